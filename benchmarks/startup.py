@@ -0,0 +1,80 @@
+# Cold-start benchmark for the Streamlit app.
+#
+# Every sample runs in a fresh interpreter, so nothing is already imported:
+#   import       importing streamlit and streamlit_option_menu, which every
+#                run needs before the first widget
+#   first_paint  the first full run of cpu.py (through streamlit.testing),
+#                i.e. what a new session waits for before the page appears
+#   results      the first Simulate click after that, which loads the
+#                engine's result display and the chart libraries
+# and records which heavy modules were loaded after each step.
+#
+# Usage: python benchmarks/startup.py [--repeat N] [--json]
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("matplotlib", "pandas", "PIL", "requests", "pyarrow")
+
+CHILD = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import streamlit
+import streamlit_option_menu
+t1 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+
+def loaded():
+    return sorted(name for name in HEAVY if name in sys.modules)
+
+HEAVY = %(heavy)r
+at = AppTest.from_file(%(app)r, default_timeout=120)
+t2 = time.perf_counter()
+at.run()
+t3 = time.perf_counter()
+after_paint = loaded()
+if at.exception:
+    raise SystemExit(at.exception[0].message)
+[button for button in at.button if button.label.startswith("Simulate")][0].click().run()
+t4 = time.perf_counter()
+if at.exception:
+    raise SystemExit(at.exception[0].message)
+print(json.dumps({"import": t1 - t0, "first_paint": t3 - t2, "results": t4 - t3,
+                  "loaded_after_paint": after_paint, "loaded_after_results": loaded()}))
+"""
+
+
+def sample():
+    code = CHILD % {"heavy": HEAVY_MODULES, "app": os.path.join(ROOT, "cpu.py")}
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold import and first-paint time of cpu.py")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh-interpreter samples (default 3)")
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = parser.parse_args()
+
+    samples = [sample() for _ in range(args.repeat)]
+    result = {step: statistics.median(s[step] for s in samples) for step in ("import", "first_paint", "results")}
+    result["samples"] = args.repeat
+    result["loaded_after_paint"] = samples[-1]["loaded_after_paint"]
+    result["loaded_after_results"] = samples[-1]["loaded_after_results"]
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    for step in ("import", "first_paint", "results"):
+        print(f"{step:12s} {result[step] * 1000:8.1f} ms  (median of {args.repeat})")
+    print(f"heavy modules after first paint: {', '.join(result['loaded_after_paint']) or 'none'}")
+    print(f"heavy modules after results:     {', '.join(result['loaded_after_results']) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
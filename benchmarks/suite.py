@@ -0,0 +1,236 @@
+# Benchmark suite for the scheduling engine and the result display.
+#
+# Runs every algorithm over synthetic workloads of 10 to 10^6 processes, for
+# each burst mix and arrival pattern, and measures each stage a page goes
+# through after Simulate:
+#   simulate   scheduler.simulate
+#   metrics    metrics.schedule_metrics (what display_metrics shows)
+#   dataframe  Schedule.to_dataframe plus the sort the pages apply
+#   gantt      charts.gantt_png (plot_gantt_chart rendered to PNG)
+# Time is the best of a few runs without tracing; peak memory is measured
+# in a separate run under tracemalloc, which NumPy reports its buffers to
+# (the Agg renderer's own pixel buffer is not traced).
+#
+# Results are written as JSON so two versions can be compared:
+#   python benchmarks/suite.py --output before.json
+#   python benchmarks/suite.py --output after.json
+#   python benchmarks/suite.py --compare before.json after.json
+#
+# The full grid runs for a long while (Round Robin over 10^6 long bursts
+# alone takes minutes); narrow it with --sizes, --algorithms, --bursts,
+# --arrivals and --stages, and skip the tracemalloc pass with --no-memory.
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+
+from metrics import schedule_metrics  # noqa: E402
+from scheduler import simulate  # noqa: E402
+from tables import Workload  # noqa: E402
+
+SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+ALGORITHMS = {
+    "FCFS": {},
+    "SJF": {},
+    "SRTF": {},
+    "Round Robin": {"time_quantum": 4},
+    "Priority": {"preemptive": True},
+    "MLFQ": {},
+    "CFS": {},
+}
+
+# short: every burst in [1, 10]; long: every burst in [50, 500];
+# mixed: 90% short and 10% long
+BURSTS = ("short", "long", "mixed")
+
+# dense: arrivals packed so the ready queue keeps growing; sparse: mean gap
+# twice the mean burst, so the CPU is mostly idle between arrivals
+ARRIVALS = ("dense", "sparse")
+
+STAGES = ("simulate", "metrics", "dataframe", "gantt")
+
+# Repeat a stage until it has run this long, and keep the fastest run
+MIN_TIMED = 0.2
+MAX_REPEAT = 50
+
+
+def make_workload(processes, bursts, arrivals, seed=0):
+    rng = np.random.default_rng(seed)
+    short = rng.integers(1, 11, processes)
+    long = rng.integers(50, 501, processes)
+    if bursts == "short":
+        burst = short
+    elif bursts == "long":
+        burst = long
+    else:
+        burst = np.where(rng.random(processes) < 0.1, long, short)
+    if arrivals == "dense":
+        arrival = np.sort(rng.integers(0, max(1, int(burst.sum() // 4)), processes))
+    else:
+        arrival = np.cumsum(rng.exponential(2 * burst.mean(), processes)).astype(np.int64)
+    names = [f"P{i + 1}" for i in range(processes)]
+    return Workload(names, np.arange(processes, dtype=np.int32), arrival, burst,
+                    rng.integers(1, 6, processes))
+
+
+def _stages(algorithm, params, workload):
+    import charts
+
+    state = {}
+
+    def run_simulate():
+        state["schedule"] = simulate(algorithm, workload, **params)
+
+    def run_metrics():
+        schedule_metrics(state["schedule"])
+
+    def run_dataframe():
+        state["schedule"].to_dataframe().sort_values("Process ID", kind="stable")
+
+    def run_gantt():
+        charts.gantt_png(state["schedule"], algorithm)
+
+    return dict(zip(STAGES, (run_simulate, run_metrics, run_dataframe, run_gantt)))
+
+
+def _best_time(function):
+    best = float("inf")
+    spent = 0.0
+    runs = 0
+    while runs < MAX_REPEAT and (runs == 0 or spent < MIN_TIMED):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        runs += 1
+    return best, runs
+
+
+def _peak_memory(function):
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        function()
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+
+def run(sizes=SIZES, algorithms=None, bursts=BURSTS, arrivals=ARRIVALS, stages=STAGES,
+        memory=True, log=None):
+    rows = []
+    for processes in sizes:
+        for burst_mix in bursts:
+            for arrival_pattern in arrivals:
+                workload = make_workload(processes, burst_mix, arrival_pattern)
+                for algorithm in algorithms or ALGORITHMS:
+                    functions = _stages(algorithm, ALGORITHMS[algorithm], workload)
+                    functions["simulate"]()  # Later stages need a schedule even if simulate is skipped
+                    for stage in stages:
+                        seconds, runs = _best_time(functions[stage])
+                        row = {
+                            "algorithm": algorithm,
+                            "processes": processes,
+                            "bursts": burst_mix,
+                            "arrivals": arrival_pattern,
+                            "stage": stage,
+                            "seconds": seconds,
+                            "runs": runs,
+                            "peak_bytes": _peak_memory(functions[stage]) if memory else None,
+                        }
+                        rows.append(row)
+                        if log:
+                            log(row)
+    return rows
+
+
+def _environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def _row_key(row):
+    return row["algorithm"], row["processes"], row["bursts"], row["arrivals"], row["stage"]
+
+
+def _format_row(row):
+    memory = "" if row["peak_bytes"] is None else f"{row['peak_bytes'] / 2**20:10.2f} MiB"
+    return (f"{row['algorithm']:12s} {row['processes']:>9,} {row['bursts']:6s} {row['arrivals']:6s} "
+            f"{row['stage']:10s} {row['seconds'] * 1000:12.3f} ms{memory}")
+
+
+# Print the time and memory ratio (new / old) of every row present in both
+# files, slowest regressions first
+def compare(old_path, new_path, threshold=1.1):
+    with open(old_path) as handle:
+        old = {_row_key(row): row for row in json.load(handle)["results"]}
+    with open(new_path) as handle:
+        new = {_row_key(row): row for row in json.load(handle)["results"]}
+    changes = []
+    for key in old.keys() & new.keys():
+        ratio = new[key]["seconds"] / max(old[key]["seconds"], 1e-9)
+        memory = None
+        if old[key]["peak_bytes"] and new[key]["peak_bytes"] is not None:
+            memory = new[key]["peak_bytes"] / old[key]["peak_bytes"]
+        changes.append((ratio, memory, key))
+    changes.sort(reverse=True)
+    regressions = 0
+    for ratio, memory, (algorithm, processes, bursts, arrivals, stage) in changes:
+        flag = "  REGRESSION" if ratio > threshold else ""
+        regressions += bool(flag)
+        memory_text = "" if memory is None else f"  memory x{memory:.2f}"
+        print(f"{algorithm:12s} {processes:>9,} {bursts:6s} {arrivals:6s} {stage:10s} time x{ratio:.2f}{memory_text}{flag}")
+    print(f"{len(changes)} rows compared, {regressions} slower than x{threshold}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every scheduler and display stage")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="process counts")
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS), help="default: all")
+    parser.add_argument("--bursts", nargs="+", choices=BURSTS, default=list(BURSTS))
+    parser.add_argument("--arrivals", nargs="+", choices=ARRIVALS, default=list(ARRIVALS))
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two result files")
+    parser.add_argument("--threshold", type=float, default=1.1, help="time ratio counted as a regression")
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare, threshold=args.threshold) else 0)
+
+    rows = run(args.sizes, args.algorithms, args.bursts, args.arrivals, args.stages,
+               memory=not args.no_memory, log=lambda row: print(_format_row(row), flush=True))
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump({"environment": _environment(), "results": rows}, handle, indent=1)
+        print(f"Wrote {len(rows)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+# Content-addressed cache for simulation results.
+#
+# Keys are SHA-256 digests of (algorithm, parameters, workload contents), so
+# identical inputs hit no matter which session or rerun produced them. Values
+# live in an in-process LRU tier and, optionally, an on-disk tier of pickle
+# files shared by every process pointed at the same directory. Each tier
+# evicts least recently used values once it exceeds its byte budget; the
+# memory tier sizes values by their array buffers and byte strings (see
+# value_size). Both tiers count hits and misses.
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+from tables import Workload
+
+DEFAULT_MEMORY_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_MISSING = object()
+
+
+def _update_array(digest, values):
+    values = np.ascontiguousarray(values)
+    digest.update(f"{values.dtype.str}{values.shape}".encode())
+    digest.update(values.tobytes())
+
+
+# Digest of a workload's contents, or None when it cannot be hashed without
+# consuming it (a one-shot chunk iterator). Re-readable sources such as
+# loader.TraceFile provide their own digest().
+def workload_digest(workload):
+    if hasattr(workload, "digest"):
+        return workload.digest()
+    if isinstance(workload, (list, tuple)) and not (workload and isinstance(workload[0], Workload)):
+        workload = Workload.from_rows(workload)
+    if not isinstance(workload, Workload):
+        return None
+    digest = hashlib.sha256()
+    for name in workload.names:
+        digest.update(str(name).encode("utf-8") + b"\0")
+    for values in (workload.pid, workload.arrival, workload.burst):
+        _update_array(digest, values)
+    if workload.priority is not None:
+        _update_array(digest, workload.priority)
+    return digest.hexdigest()
+
+
+# Key for one simulation run, or None when the workload is not hashable
+def cache_key(algorithm, params, workload):
+    workload_part = workload_digest(workload)
+    if workload_part is None:
+        return None
+    digest = hashlib.sha256()
+    digest.update(repr((algorithm, sorted(params.items()))).encode())
+    digest.update(workload_part.encode())
+    return digest.hexdigest()
+
+
+# Approximate bytes held by a cached value: NumPy buffers (nbytes), byte
+# strings (len), and the contents of containers and of objects' attributes or
+# slots (Schedule, Workload, Timeline, QuantileSketch); anything else counts
+# sys.getsizeof. Objects reachable twice count once.
+def value_size(value, seen=None):
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, memoryview):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(value_size(k, seen) + value_size(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        if value and isinstance(next(iter(value)), (str, int, float)):
+            # A flat column such as Workload.names: size it without the walk
+            return sys.getsizeof(value) + sum(map(sys.getsizeof, value))
+        return sys.getsizeof(value) + sum(value_size(item, seen) for item in value)
+    fields = list(getattr(value, "__dict__", {}).values())
+    for cls in type(value).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            fields.append(getattr(value, name, None))
+    return sys.getsizeof(value) + sum(value_size(field, seen) for field in fields)
+
+
+class MemoryLRU:
+    def __init__(self, max_bytes=DEFAULT_MEMORY_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # Key -> (value, size)
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return _MISSING
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    # A value larger than the whole budget is not kept
+    def put(self, key, value):
+        size = value_size(value)
+        if key in self.entries:
+            self.total_bytes -= self.entries.pop(key)[1]
+        if size > self.max_bytes:
+            return
+        self.entries[key] = (value, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            self.total_bytes -= self.entries.popitem(last=False)[1][1]
+
+
+# One pickle per key, named by the key's SHA-256 digest so derived keys such
+# as "<digest>:gantt:Round Robin (Quantum=2):#2563eb" make safe file names on
+# every platform; the file modification time records the last use
+class DiskLRU:
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{hashlib.sha256(key.encode()).hexdigest()}.pkl")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as handle:
+                value = pickle.load(handle)
+            os.utime(path)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            self.misses += 1
+            return _MISSING
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        # Write aside and rename, so concurrent readers never see half a file
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(handle, "wb") as out:
+            pickle.dump(value, out, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self._path(key))
+        self._evict()
+
+    def _evict(self):
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pkl"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue  # Evicted by another process
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+
+class ResultCache:
+    def __init__(self, memory_bytes=DEFAULT_MEMORY_BYTES, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.memory = MemoryLRU(memory_bytes)
+        self.disk = DiskLRU(directory, max_bytes) if directory else None
+
+    # Cached value for key, computing and storing it on a miss. A None key
+    # (unhashable input) always computes.
+    def get_or_compute(self, key, compute):
+        if key is None:
+            return compute()
+        value = self.memory.get(key)
+        if value is not _MISSING:
+            return value
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not _MISSING:
+                self.memory.put(key, value)
+                return value
+        value = compute()
+        self.memory.put(key, value)
+        if self.disk is not None:
+            self.disk.put(key, value)
+        return value
+
+    def stats(self):
+        stats = {"memory_hits": self.memory.hits, "memory_misses": self.memory.misses,
+                 "memory_entries": len(self.memory.entries), "memory_bytes": self.memory.total_bytes}
+        if self.disk is not None:
+            stats.update(disk_hits=self.disk.hits, disk_misses=self.disk.misses)
+        return stats
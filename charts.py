@@ -0,0 +1,265 @@
+# Matplotlib and PIL rendering for the pages: the Gantt chart, its GIF
+# animation and the smaller result plots. Only imported once a page renders
+# results, so neither library is loaded for the first paint. Functions return
+# figures or encoded images and never call streamlit.
+
+from io import BytesIO
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgb
+from matplotlib.patches import Rectangle
+from matplotlib.ticker import MaxNLocator
+from PIL import Image
+
+from tables import IDLE, IDLE_CODE, SWITCH, SWITCH_CODE
+
+GANTT_IDLE_COLOR = '#f0f0f0'
+GANTT_SWITCH_COLOR = '#9ca3af'
+GANTT_DETAIL_TICKS = 40  # Up to this many time units every unit gets a tick
+LABEL_CHAR_PX = 9  # Approximate width of one bold 12pt character
+
+# Timeline as start/end arrays, a kind array (0 process, 1 idle, 2 context
+# switch), a label lookup and the lane (core) of every segment. Accepts
+# (pid, start, end) tuples or a Schedule, whose segment arrays are used
+# directly; multi-core schedules come sorted by core, then start.
+def gantt_segments(timeline):
+    if hasattr(timeline, "seg_pid"):
+        names = list(timeline.workload.names)
+        codes = timeline.seg_pid
+        kinds = np.where(codes == IDLE_CODE, 1, np.where(codes == SWITCH_CODE, 2, 0))
+        label = lambda i: IDLE if codes[i] == IDLE_CODE else SWITCH if codes[i] == SWITCH_CODE else names[codes[i]]
+        lanes = np.zeros(codes.size, dtype=np.int32) if timeline.seg_core is None else timeline.seg_core
+        return np.asarray(timeline.seg_start), np.asarray(timeline.seg_end), kinds, label, lanes
+    pids = [segment[0] for segment in timeline]
+    kinds = np.array([1 if pid == IDLE else 2 if pid == SWITCH else 0 for pid in pids], dtype=np.int8)
+    starts = np.array([segment[1] for segment in timeline])
+    ends = np.array([segment[2] for segment in timeline])
+    return starts, ends, kinds, lambda i: pids[i], np.zeros(starts.size, dtype=np.int32)
+
+# Level of detail: runs of consecutive segments narrower than `unit` (one
+# pixel) that fall in the same pixel column are merged into one block, so at
+# most about two blocks per pixel are drawn. Returns each block's first
+# segment index, start, end, busy time and segment count.
+def level_of_detail(starts, ends, kinds, unit):
+    widths = ends - starts
+    small = widths < unit
+    columns = np.floor((starts - starts[0]) / unit) if unit > 0 else np.zeros(starts.size)
+    new_block = np.ones(starts.size, dtype=bool)
+    new_block[1:] = ~small[1:] | ~small[:-1] | (columns[1:] != columns[:-1])
+    first = np.flatnonzero(new_block)
+    busy = np.add.reduceat(np.where(kinds == 0, widths, 0), first)
+    counts = np.diff(np.append(first, starts.size))
+    return first, starts[first], np.maximum.reduceat(ends, first), busy, counts
+
+# Draw the chart with a single PolyCollection, one lane per core. Merged
+# blocks are shaded by the share of time they were busy, labels are only
+# drawn where they fit and ticks are thinned for long timelines, so render
+# time does not grow with the number of segments.
+def plot_gantt_chart(timeline, algorithm, color='#2563eb'):
+    starts, ends, kinds, label, lanes = gantt_segments(timeline)
+    count = int(lanes.max()) + 1 if lanes.size else 1
+    fig, ax = plt.subplots(figsize=(12, min(4 + 0.25 * (count - 1), 12)))
+    ax.set_xlabel("Time Units")
+    ax.set_title(f"Gantt Chart - {algorithm} Scheduling", pad=20)
+    ax.grid(axis='x', linestyle='--', alpha=0.7)
+    if count > 1:
+        ax.set_yticks(range(count), [f"Core {core}" for core in range(count)], fontsize=8 if count > 16 else 10)
+    else:
+        ax.set_yticks([])
+    ax.set_ylim(count - 0.4, -0.6)  # Core 0 on top
+    
+    if starts.size == 0:
+        return fig
+    t0 = min(0, starts.min())
+    t1 = ends.max()
+    pixels = fig.dpi * fig.get_figwidth() * ax.get_position().width
+    unit = (t1 - t0) / pixels
+    
+    # Level of detail per lane, since lanes overlap in time
+    bounds = np.searchsorted(lanes, np.arange(count + 1))
+    blocks = []
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        if b > a:
+            lane_first, *rest = level_of_detail(starts[a:b], ends[a:b], kinds[a:b], unit)
+            blocks.append((lane_first + a, *rest))
+    first, block_start, block_end, busy, counts = (np.concatenate(column) for column in zip(*blocks))
+    rows = lanes[first]
+    palette = np.array([to_rgb(color), to_rgb(GANTT_IDLE_COLOR), to_rgb(GANTT_SWITCH_COLOR)])
+    faces = palette[kinds[first]]
+    merged = counts > 1
+    share = (busy[merged] / np.maximum(block_end[merged] - block_start[merged], 1e-12))[:, None]
+    faces[merged] = share * palette[0] + (1 - share) * palette[1]
+    
+    # Outline only blocks wide enough for the edge not to swamp the fill
+    widths_px = (block_end - block_start) / unit if unit > 0 else np.full(first.size, pixels)
+    edges = np.where((widths_px >= 4)[:, None], to_rgb('black'), faces)
+    verts = np.empty((first.size, 4, 2))
+    verts[:, [0, 1], 0] = block_start[:, None]
+    verts[:, [2, 3], 0] = block_end[:, None]
+    verts[:, [0, 3], 1] = (rows - 0.4)[:, None]
+    verts[:, [1, 2], 1] = (rows + 0.4)[:, None]
+    ax.add_collection(PolyCollection(verts, facecolors=faces, edgecolors=edges, linewidths=1))
+    
+    # Smaller labels once lanes get thin
+    fontsize = 12 if count <= 8 else 7
+    char_px = LABEL_CHAR_PX * fontsize / 12
+    for block in np.flatnonzero(~merged):
+        i = first[block]
+        text = str(label(i))
+        if widths_px[block] >= len(text) * char_px + 4:
+            ax.text((starts[i] + ends[i]) / 2, lanes[i], text,
+                    ha='center', va='center',
+                    color='white' if kinds[i] == 0 else 'black', fontsize=fontsize, fontweight='bold')
+    
+    ax.set_xlim(t0, t1)
+    if t1 - t0 <= GANTT_DETAIL_TICKS:
+        ax.set_xticks(np.arange(t0, t1 + 1, 1))
+    else:
+        ax.xaxis.set_major_locator(MaxNLocator(nbins=12, integer=True))
+    
+    return fig
+
+# Gantt chart as PNG bytes
+def gantt_png(schedule, algorithm, color='#2563eb'):
+    fig = plot_gantt_chart(schedule, algorithm, color=color)
+    buffer = BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight", dpi=200)
+    plt.close(fig)
+    return buffer.getvalue()
+
+MAX_ANIMATION_FRAMES = 120
+
+# Render the animation once as an animated GIF that the browser plays, so the
+# server never sleeps between frames. The chart is drawn once and saved as a
+# background; each frame restores it and redraws only the mask over the
+# future, the partial bar of the running segment (found by binary search over
+# segment starts) and the title. Long timelines skip frames to stay within
+# MAX_ANIMATION_FRAMES.
+def render_gantt_animation(timeline, algorithm, color='#2563eb', speed=1.0):
+    starts, ends, kinds, label, lanes = gantt_segments(timeline)
+    if starts.size == 0:
+        return None
+    fig = plot_gantt_chart(timeline, algorithm, color=color)
+    ax = fig.axes[0]
+    t0, t1 = ax.get_xlim()
+    # The running-process highlight needs a single lane. A Schedule is looked
+    # up in its time index, where runs of a process are already merged.
+    single_lane = not lanes.any()
+    if hasattr(timeline, "time_index"):
+        index = timeline.time_index()
+        names = list(timeline.workload.names)
+        def running_at(t):
+            i = index.segment_at(t)
+            return (index.start[i], names[index.pid[i]]) if i >= 0 and index.pid[i] >= 0 else None
+    else:
+        def running_at(t):
+            i = np.searchsorted(starts, t, side='right') - 1
+            return (starts[i], str(label(i))) if i >= 0 and t < ends[i] and kinds[i] == 0 else None
+    
+    running_color = 0.7 * np.array(to_rgb(color)) + 0.3
+    mask = Rectangle((t0, -0.5), t1 - t0, int(lanes.max()) + 1, facecolor='white', edgecolor='none', zorder=4)
+    running = Rectangle((t0, -0.4), 0, 0.8, facecolor=running_color, edgecolor='black', zorder=5)
+    running_label = ax.text(0, 0, "", ha='center', va='center', color='white',
+                            fontsize=12, fontweight='bold', zorder=6)
+    ax.add_patch(mask)
+    ax.add_patch(running)
+    moving = [mask, running, running_label, ax.title]
+    for artist in moving:
+        artist.set_animated(True)
+    unit = (t1 - t0) / (fig.dpi * fig.get_figwidth() * ax.get_position().width)
+    
+    # Static background, and one GIF palette for every frame
+    fig.canvas.draw()
+    background = fig.canvas.copy_from_bbox(fig.bbox)
+    base = Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert('RGB')
+    sample = Image.new('RGB', (base.width, base.height + 8), tuple(int(255 * c) for c in running_color))
+    sample.paste(base)
+    palette = sample.quantize(colors=64)
+    
+    step = max(1, int(np.ceil((t1 - t0) / MAX_ANIMATION_FRAMES)))
+    frames = []
+    for t in np.append(np.arange(t0, t1, step), t1):
+        mask.set_x(t)
+        mask.set_width(t1 - t)
+        title = f"Gantt Chart - {algorithm} Scheduling (Time: {t:g})"
+        current = running_at(t) if single_lane else None
+        if current is not None:
+            began, text = current
+            running.set_visible(True)
+            running.set_x(began)
+            running.set_width(t - began)
+            running_label.set_position(((began + t) / 2, 0))
+            running_label.set_text(text if (t - began) / unit >= len(text) * LABEL_CHAR_PX + 4 else "")
+            title += f" | Running: {text}"
+        else:
+            running.set_visible(False)
+            running_label.set_text("")
+        ax.set_title(title, pad=20)
+        
+        fig.canvas.restore_region(background)
+        for artist in moving:
+            ax.draw_artist(artist)
+        frame = Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert('RGB')
+        frames.append(frame.quantize(palette=palette, dither=Image.Dither.NONE))
+    plt.close(fig)
+    
+    buffer = BytesIO()
+    frames[0].save(buffer, format='GIF', save_all=True, append_images=frames[1:],
+                   duration=int(1000 / speed), loop=0, optimize=False)
+    return buffer.getvalue()
+
+# Bar per core of the share of the makespan spent running processes
+def plot_utilization(utilization, color='#2563eb'):
+    fig, ax = plt.subplots(figsize=(12, 2.5))
+    ax.bar(range(utilization.size), utilization * 100, color=color)
+    ax.set_xlabel("Core")
+    ax.set_ylabel("Utilization (%)")
+    ax.set_ylim(0, 100)
+    ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+    return fig
+
+# Time spent at every P-state, then every idle state
+def plot_time_at_state(states, pstate_count, color='#2563eb'):
+    fig, ax = plt.subplots(figsize=(12, 2.5))
+    ax.barh(list(states), list(states.values()),
+            color=[color] * pstate_count + [GANTT_SWITCH_COLOR] * (len(states) - pstate_count))
+    ax.invert_yaxis()
+    ax.set_xlabel("Time Units")
+    ax.set_title("Time at Frequency / Idle State")
+    ax.grid(axis='x', linestyle='--', alpha=0.7)
+    return fig
+
+# One panel per metric against the quantum, a line per switch cost and the
+# recommended quanta highlighted
+def plot_sweep(results, color='#2563eb'):
+    fig, axes = plt.subplots(1, 4, figsize=(16, 4))
+    panels = [("avg_waiting", "Avg Waiting Time"), ("avg_turnaround", "Avg Turnaround Time"),
+              ("throughput", "Throughput"), ("context_switches", "Context Switches")]
+    costs = list(dict.fromkeys(r["context_switch"] for r in results))
+    for ax, (key, label) in zip(axes, panels):
+        for cost in costs:
+            rows = [r for r in results if r["context_switch"] == cost]
+            ax.plot([r["quantum"] for r in rows], [r[key] for r in rows], marker='o', label=f"switch cost {cost}")
+            best = [r for r in rows if r["recommended"]]
+            ax.scatter([r["quantum"] for r in best], [r[key] for r in best], s=160, color=color, zorder=3)
+        ax.set_xlabel("Time Quantum")
+        ax.set_title(label)
+        ax.grid(linestyle='--', alpha=0.7)
+    axes[0].legend()
+    fig.tight_layout()
+    return fig
+
+# Mean of each metric per algorithm with 95% confidence interval error bars
+def plot_monte_carlo(summary, labels, color='#2563eb'):
+    fig, axes = plt.subplots(1, len(labels), figsize=(15, 4))
+    for ax, (name, label) in zip(axes, labels.items()):
+        ax.bar([row["algorithm"] for row in summary], [row[name] for row in summary],
+               yerr=[row[name + "_ci"] for row in summary], capsize=6, color=color)
+        ax.set_title(label)
+        ax.tick_params(axis='x', rotation=30)
+        ax.grid(axis='y', linestyle='--', alpha=0.7)
+    fig.tight_layout()
+    return fig
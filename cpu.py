@@ -1,20 +1,30 @@
 import streamlit as st
 from streamlit_option_menu import option_menu
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
-from PIL import Image
-import requests
-from io import BytesIO
-import time
-import random
+import base64
+import importlib
+import os
+from contextlib import nullcontext
 
-# Function to load GitHub logo from URL
+# Pages live in views/ and are imported only when selected, so a cold start
+# loads neither matplotlib nor the page code of other pages
+PAGES = {
+    "FCFS": "views.fcfs",
+    "SJF": "views.sjf",
+    "SRTF": "views.srtf",
+    "Round Robin": "views.round_robin",
+    "Priority": "views.priority",
+    "MLFQ": "views.mlfq",
+    "CFS": "views.cfs",
+    "Monte Carlo": "views.monte_carlo",
+}
+
+# GitHub logo from the bundled asset, inlined as a data URI so loading the
+# page makes no request to github.com
+@st.cache_resource
 def load_github_logo():
-    url = "https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png"
-    response = requests.get(url)
-    img = Image.open(BytesIO(response.content))
-    return img
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "github-mark.svg")
+    with open(path, "rb") as handle:
+        return "data:image/svg+xml;base64," + base64.b64encode(handle.read()).decode()
 
 def center_all_headers():
     st.markdown(
@@ -149,7 +159,7 @@ st.markdown(
     f"""
     <div class="github-corner">
         <a href="https://github.com/FarazKhan001/Energy-Efficient-CPU-Scheduling-Algorithm" target="_blank">
-            <img src="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png" width="40">
+            <img src="{github_logo}" width="40">
         </a>
     </div>
     """,
@@ -161,8 +171,8 @@ with st.sidebar:
     st.markdown("<h1 style='text-align: center; color: #2563eb;'>CPU Scheduling</h1>", unsafe_allow_html=True)
     selected = option_menu(
         menu_title=None,
-        options=["FCFS", "SJF", "SRTF", "Round Robin", "Priority"],
-        icons=["clock", "stopwatch", "hourglass", "arrow-repeat", "list-ol"],
+        options=list(PAGES),
+        icons=["clock", "stopwatch", "hourglass", "arrow-repeat", "list-ol", "layers", "sliders", "bar-chart"],
         default_index=0,
         styles={
             "container": {"background-color": "#e6f0ff"},
@@ -189,6 +199,57 @@ with st.sidebar:
     # Add a theme selector
     theme_color = st.selectbox("Theme Color", ["Blue", "Green", "Purple", "Red"], index=0)
     
+    # Energy model: DVFS P-states, idle states and the energy policy
+    st.markdown("---")
+    energy_mode = st.toggle("Energy (DVFS) mode", key="energy_mode")
+    energy_settings = None
+    if energy_mode:
+        import energy
+
+        energy_policy = st.selectbox("Energy Policy", energy.POLICIES,
+                                     format_func=lambda policy: policy.replace("_", " ").title(), key="energy_policy")
+        with st.expander("P-states and Idle States"):
+            pstates = st.data_editor(
+                [{"P-state": n, "Frequency (GHz)": f, "Voltage (V)": v, "Power (W)": w}
+                 for n, f, v, w in energy.DEFAULT_PSTATES],
+                num_rows="dynamic", hide_index=True, key="energy_pstates")
+            idle_states = st.data_editor(
+                [{"Idle State": n, "Power (W)": w, "Break-even Time": b}
+                 for n, w, b in energy.DEFAULT_IDLE_STATES],
+                num_rows="dynamic", hide_index=True, key="energy_idle_states")
+        # Rows still being filled in are skipped
+        pstates = [tuple(row.values()) for row in pstates if None not in row.values()]
+        idle_states = [tuple(row.values()) for row in idle_states if None not in row.values()]
+        static_pstate = 0
+        if energy_policy == "static":
+            static_pstate = st.selectbox("Static P-state", range(len(pstates)),
+                                         format_func=lambda i: pstates[i][0], key="energy_static_pstate")
+        energy_settings = (energy_policy, pstates, idle_states, static_pstate)
+    
+    # Multi-core simulation: every page runs on this many cores
+    st.markdown("---")
+    cores = st.slider("CPU Cores", 1, 64, 1, key="smp_cores")
+    smp_params = {}
+    if cores > 1:
+        from smp import BALANCERS, DEFAULT_BALANCE_INTERVAL
+
+        balancer = st.selectbox("Load Balancer", BALANCERS,
+                                format_func=lambda name: name.replace("_", " ").title(), key="smp_balancer")
+        migration_cost = st.number_input("Migration Cost", min_value=0, value=0, key="smp_migration_cost")
+        smp_params = {"cores": cores, "balancer": balancer, "migration_cost": migration_cost}
+        if balancer == "per_core":
+            smp_params["balance_interval"] = st.number_input(
+                "Balance Interval", min_value=1, value=DEFAULT_BALANCE_INTERVAL, key="smp_balance_interval")
+    
+    # Stage timings of each simulate/animate run, shown below the guide
+    st.markdown("---")
+    profile_mode = st.toggle("Profile stages", key="profile_mode")
+    profiler = None
+    if profile_mode:
+        from profiling import StageProfiler
+
+        profiler = StageProfiler(cprofile=st.checkbox("Record with cProfile", key="profile_cprofile"))
+    
     # Add a quick guide
     with st.expander("Quick Guide"):
         st.write("""
@@ -224,699 +285,45 @@ def update_theme(color):
 
 update_theme(theme_color)
 
-# Common functions
-def plot_gantt_chart(timeline, algorithm, color='#2563eb'):
-    fig, ax = plt.subplots(figsize=(12, 4))
-    
-    for i, (process_id, start, end) in enumerate(timeline):
-        color_fill = color if process_id != "IDLE" else '#f0f0f0'
-        ax.barh(y=0, width=end-start, left=start, color=color_fill, edgecolor='black')
-        label_color = 'white' if process_id != "IDLE" else 'black'
-        ax.text((start+end)/2, 0, process_id, 
-                ha='center', va='center', 
-                color=label_color, fontsize=12, fontweight='bold')
-    
-    ax.set_yticks([])
-    ax.set_xticks(np.arange(0, timeline[-1][2] + 1, 1))
-    ax.set_xlabel("Time Units")
-    ax.set_title(f"Gantt Chart - {algorithm} Scheduling", pad=20)
-    ax.grid(axis='x', linestyle='--', alpha=0.7)
-    
-    return fig
-
-def display_metrics(results):
-    avg_tat = sum(p['Turnaround Time'] for p in results) / len(results)
-    avg_wt = sum(p['Waiting Time'] for p in results) / len(results)
-    throughput = len(results) / max(p['Completion Time'] for p in results)
-    
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown(
-            f"""
-            <div class="metric-box">
-                <h4>Avg Turnaround Time</h4>
-                <h2>{avg_tat:.2f}</h2>
-            </div>
-            """, unsafe_allow_html=True
-        )
-    with col2:
-        st.markdown(
-            f"""
-            <div class="metric-box">
-                <h4>Avg Waiting Time</h4>
-                <h2>{avg_wt:.2f}</h2>
-            </div>
-            """, unsafe_allow_html=True
-        )
-    with col3:
-        st.markdown(
-            f"""
-            <div class="metric-box">
-                <h4>Throughput</h4>
-                <h2>{throughput:.2f}</h2>
-            </div>
-            """, unsafe_allow_html=True
-        )
-
-def animate_gantt_chart(timeline, algorithm, color='#2563eb'):
-    placeholder = st.empty()
-    end_time = timeline[-1][2]
-    
-    for t in range(end_time + 1):
-        fig, ax = plt.subplots(figsize=(12, 4))
-        
-        # Draw completed processes
-        for process_id, start, end in timeline:
-            if end <= t:
-                color_fill = color if process_id != "IDLE" else '#f0f0f0'
-                ax.barh(y=0, width=end-start, left=start, color=color_fill, edgecolor='black')
-                label_color = 'white' if process_id != "IDLE" else 'black'
-                ax.text((start+end)/2, 0, process_id, 
-                        ha='center', va='center', 
-                        color=label_color, fontsize=12, fontweight='bold')
-        
-        # Draw current process
-        current_process = None
-        for process_id, start, end in timeline:
-            if start <= t < end:
-                current_process = process_id
-                ax.barh(y=0, width=t-start, left=start, color=color, edgecolor='black', alpha=0.7)
-                ax.text((start+t)/2, 0, process_id, 
-                        ha='center', va='center', 
-                        color='white', fontsize=12, fontweight='bold')
-                break
-        
-        ax.set_yticks([])
-        ax.set_xlim(0, end_time)
-        ax.set_xticks(np.arange(0, end_time + 1, 1))
-        ax.set_xlabel("Time Units")
-        title = f"Gantt Chart - {algorithm} Scheduling (Time: {t})"
-        if current_process:
-            title += f" | Running: {current_process}"
-        ax.set_title(title, pad=20)
-        ax.grid(axis='x', linestyle='--', alpha=0.7)
-        
-        placeholder.pyplot(fig)
-        plt.close(fig)
-        time.sleep(1/simulation_speed)
-
-def generate_random_processes(num_processes):
-    processes = []
-    for i in range(num_processes):
-        pid = f"P{i+1}"
-        at = random.randint(0, 5)
-        bt = random.randint(1, 10)
-        processes.append([pid, at, bt])
-    return processes
-
-# FCFS Scheduling
-if selected == "FCFS":
-    st.title("First-Come First-Served Scheduling")
-    
-    with st.expander("ℹ️ About FCFS", expanded=True):
-        st.write("""
-        **First-Come First-Served (FCFS)** is the simplest CPU scheduling algorithm:
-        - Processes are executed in order of arrival (FIFO queue)
-        - Non-preemptive - once started, runs to completion
-        - Simple to implement but suffers from the 'convoy effect'
-        - May result in poor average waiting time
-        """)
-    
-    # Process input section
-    st.subheader("Process Details")
-    col1, col2 = st.columns([3,1])
-    with col1:
-        num_processes = st.slider("Number of processes", 1, 30, 3, key="fcfs_num")
-    with col2:
-        if st.button("Randomize", key="fcfs_random"):
-            st.session_state.fcfs_processes = generate_random_processes(num_processes)
-    
-    process_list = []
-    for i in range(num_processes):
-        with st.container():
-            cols = st.columns(3)
-            with cols[0]:
-                pid = st.text_input(f"Process ID", f"P{i+1}", key=f"fcfs_pid_{i}")
-            with cols[1]:
-                at = st.number_input(f"Arrival Time", min_value=0, value=i*2, key=f"fcfs_at_{i}")
-            with cols[2]:
-                bt = st.number_input(f"Burst Time", min_value=1, value=5, key=f"fcfs_bt_{i}")
-            process_list.append([pid, at, bt])
-    
-    # Simulation controls
-    col1, col2 = st.columns(2)
-    with col1:
-        simulate_btn = st.button("Simulate FCFS", type="primary", use_container_width=True)
-    with col2:
-        animate_btn = st.button("Animate FCFS", use_container_width=True)
-    
-    if simulate_btn or animate_btn:
-        # FCFS Scheduling Logic
-        processes = sorted(process_list, key=lambda x: x[1])  # Sort by arrival time
-        timeline = []
-        current_time = 0
-        results = []
-        
-        for i, (pid, at, bt) in enumerate(processes):
-            if current_time < at:
-                timeline.append(("IDLE", current_time, at))
-                current_time = at
-            
-            start_time = current_time
-            completion_time = current_time + bt
-            timeline.append((pid, start_time, completion_time))
-            
-            turnaround = completion_time - at
-            waiting = turnaround - bt
-            
-            results.append({
-                "Process ID": pid,
-                "Arrival Time": at,
-                "Burst Time": bt,
-                "Start Time": start_time,
-                "Completion Time": completion_time,
-                "Turnaround Time": turnaround,
-                "Waiting Time": waiting
-            })
-            current_time = completion_time
-        
-        # Display results
-        st.subheader("Results")
-        df = pd.DataFrame(results)
-        st.dataframe(df.style.set_properties(**{'background-color': 'white'}), 
-                      use_container_width=True,
-                      hide_index=True)
-        
-        # Display metrics
-        display_metrics(results)
-        
-        # Show Gantt chart
-        st.subheader("Gantt Chart")
-        fig = plot_gantt_chart(timeline, "FCFS", color='#2563eb')
-        st.pyplot(fig)
-        
-        # Animation
-        if animate_btn:
-            st.subheader("Simulation Animation")
-            animate_gantt_chart(timeline, "FCFS", color='#2563eb')
-
-# SJF Scheduling
-elif selected == "SJF":
-    st.title("⏱️ Shortest Job First (Non-Preemptive)")
-    
-    with st.expander("ℹ️ About SJF", expanded=True):
-        st.write("""
-        **Shortest Job First (SJF)** scheduling:
-        - Executes processes with shortest burst time first
-        - Non-preemptive version shown here
-        - Minimizes average waiting time
-        - Requires knowing burst times in advance
-        """)
-    
-    # Process input section
-    st.subheader("Process Details")
-    col1, col2 = st.columns([3,1])
-    with col1:
-        num_processes = st.slider("Number of processes", 1, 30, 3, key="sjf_num")
-    with col2:
-        if st.button("Randomize", key="sjf_random"):
-            st.session_state.sjf_processes = generate_random_processes(num_processes)
-    
-    process_list = []
-    for i in range(num_processes):
-        with st.container():
-            cols = st.columns(3)
-            with cols[0]:
-                pid = st.text_input(f"Process ID", f"P{i+1}", key=f"sjf_pid_{i}")
-            with cols[1]:
-                at = st.number_input(f"Arrival Time", min_value=0, value=i*2, key=f"sjf_at_{i}")
-            with cols[2]:
-                bt = st.number_input(f"Burst Time", min_value=1, value=(i+1)*2, key=f"sjf_bt_{i}")
-            process_list.append([pid, at, bt])
-    
-    # Simulation controls
-    col1, col2 = st.columns(2)
-    with col1:
-        simulate_btn = st.button("Simulate SJF", type="primary", use_container_width=True)
-    with col2:
-        animate_btn = st.button("Animate SJF", use_container_width=True)
-    
-    if simulate_btn or animate_btn:
-        # SJF Scheduling Logic
-        processes = sorted(process_list, key=lambda x: x[1])  # Sort by arrival time
-        n = len(processes)
-        completed = [False] * n
-        timeline = []
-        current_time = 0
-        results = []
-        
-        while sum(completed) < n:
-            ready = [i for i in range(n) if processes[i][1] <= current_time and not completed[i]]
-            
-            if not ready:
-                next_arrival = min([p[1] for i,p in enumerate(processes) if not completed[i]])
-                timeline.append(("IDLE", current_time, next_arrival))
-                current_time = next_arrival
-                continue
-            
-            # Find process with shortest burst time
-            shortest_idx = min(ready, key=lambda i: processes[i][2])
-            pid, at, bt = processes[shortest_idx]
-            
-            start_time = current_time
-            completion_time = current_time + bt
-            timeline.append((pid, start_time, completion_time))
-            
-            turnaround = completion_time - at
-            waiting = turnaround - bt
-            
-            results.append({
-                "Process ID": pid,
-                "Arrival Time": at,
-                "Burst Time": bt,
-                "Start Time": start_time,
-                "Completion Time": completion_time,
-                "Turnaround Time": turnaround,
-                "Waiting Time": waiting
-            })
-            
-            completed[shortest_idx] = True
-            current_time = completion_time
-        
-        # Display results
-        st.subheader("Results")
-        df = pd.DataFrame(results)
-        st.dataframe(df.sort_values("Process ID").style.set_properties(**{'background-color': 'white'}), 
-                      use_container_width=True,
-                      hide_index=True)
-        
-        # Display metrics
-        display_metrics(results)
-        
-        # Show Gantt chart
-        st.subheader("Gantt Chart")
-        fig = plot_gantt_chart(timeline, "SJF", color='#2563eb')
-        st.pyplot(fig)
-        
-        # Animation
-        if animate_btn:
-            st.subheader("Simulation Animation")
-            animate_gantt_chart(timeline, "SJF", color='#2563eb')
+# Selected page
+settings = {"speed": simulation_speed, "energy": energy_settings, "smp": smp_params, "profiler": profiler}
+with profiler.run() if profiler else nullcontext():
+    importlib.import_module(PAGES[selected]).render(settings)
+# Keep the last run that simulated something, so the panel survives reruns
+if profiler and profiler.stages:
+    st.session_state["last_profile"] = profiler
 
-# SRTF Scheduling
-elif selected == "SRTF":
-    st.title("Shortest Remaining Time First (Preemptive)")
-    
-    with st.expander("ℹ️ About SRTF", expanded=True):
-        st.write("""
-        **Shortest Remaining Time First (SRTF)**:
-        - Preemptive version of SJF
-        - Always executes process with shortest remaining time
-        - More complex but better for responsiveness
-        - Optimal for minimizing average turnaround time
-        """)
-    
-    # Process input section
-    st.subheader("Process Details")
-    col1, col2 = st.columns([3,1])
-    with col1:
-        num_processes = st.slider("Number of processes", 1, 30, 3, key="srtf_num")
-    with col2:
-        if st.button("Randomize", key="srtf_random"):
-            st.session_state.srtf_processes = generate_random_processes(num_processes)
-    
-    process_list = []
-    for i in range(num_processes):
-        with st.container():
-            cols = st.columns(3)
-            with cols[0]:
-                pid = st.text_input(f"Process ID", f"P{i+1}", key=f"srtf_pid_{i}")
-            with cols[1]:
-                at = st.number_input(f"Arrival Time", min_value=0, value=i, key=f"srtf_at_{i}")
-            with cols[2]:
-                bt = st.number_input(f"Burst Time", min_value=1, value=(i+1)*2, key=f"srtf_bt_{i}")
-            process_list.append([pid, at, bt])
-    
-    # Simulation controls
-    col1, col2 = st.columns(2)
-    with col1:
-        simulate_btn = st.button("Simulate SRTF", type="primary", use_container_width=True)
-    with col2:
-        animate_btn = st.button("Animate SRTF", use_container_width=True)
-    
-    if simulate_btn or animate_btn:
-        # SRTF Scheduling Logic
-        processes = sorted(process_list, key=lambda x: x[1])  # Sort by arrival time
-        n = len(processes)
-        remaining_time = [p[2] for p in processes]
-        timeline = []
-        current_time = 0
-        results = {pid: {"pid": pid, "at": at, "bt": bt, "start": None, "end": None} 
-                  for pid, at, bt in processes}
-        
-        while True:
-            ready = [i for i in range(n) if processes[i][1] <= current_time and remaining_time[i] > 0]
-            
-            if not ready:
-                if all(rt == 0 for rt in remaining_time):
-                    break
-                next_arrival = min([p[1] for i,p in enumerate(processes) if remaining_time[i] > 0])
-                idle_time = next_arrival - current_time
-                if idle_time > 0:
-                    timeline.append(("IDLE", current_time, next_arrival))
-                current_time = next_arrival
-                continue
-            
-            # Find process with shortest remaining time
-            shortest_idx = min(ready, key=lambda i: remaining_time[i])
-            pid = processes[shortest_idx][0]
-            
-            # Record start time if not already set
-            if results[pid]["start"] is None:
-                results[pid]["start"] = current_time
-            
-            # Execute for 1 time unit
-            start_time = current_time
-            remaining_time[shortest_idx] -= 1
-            current_time += 1
-            
-            if timeline and timeline[-1][0] == pid:
-                # Extend existing execution
-                timeline[-1] = (pid, timeline[-1][1], current_time)
+# Stage timings of the last profiled run
+if profile_mode:
+    with st.sidebar:
+        with st.expander("Stage Timings", expanded=True):
+            profile = st.session_state.get("last_profile")
+            if profile is None:
+                st.write("Simulate to see where the time goes.")
             else:
-                timeline.append((pid, start_time, current_time))
-            
-            # Record completion if finished
-            if remaining_time[shortest_idx] == 0:
-                results[pid]["end"] = current_time
-        
-        # Prepare results
-        final_results = []
-        for pid, data in results.items():
-            if data["end"] is None:
-                continue
-            turnaround = data["end"] - data["at"]
-            waiting = turnaround - data["bt"]
-            final_results.append({
-                "Process ID": pid,
-                "Arrival Time": data["at"],
-                "Burst Time": data["bt"],
-                "Start Time": data["start"],
-                "Completion Time": data["end"],
-                "Turnaround Time": turnaround,
-                "Waiting Time": waiting
-            })
-        
-        # Display results
-        st.subheader("Results")
-        df = pd.DataFrame(final_results)
-        st.dataframe(df.sort_values("Process ID").style.set_properties(**{'background-color': 'white'}), 
-                      use_container_width=True,
-                      hide_index=True)
-        
-        # Display metrics
-        display_metrics(final_results)
-        
-        # Show Gantt chart
-        st.subheader("Gantt Chart")
-        fig = plot_gantt_chart(timeline, "SRTF", color='#2563eb')
-        st.pyplot(fig)
-        
-        # Animation
-        if animate_btn:
-            st.subheader("Simulation Animation")
-            animate_gantt_chart(timeline, "SRTF", color='#2563eb')
+                rows = profile.breakdown()
+                st.dataframe({
+                    "Stage": [name for name, _ in rows],
+                    "Time (ms)": [round(seconds * 1000, 1) for _, seconds in rows],
+                    "Share": [f"{seconds / max(profile.total, 1e-9):.0%}" for _, seconds in rows],
+                }, use_container_width=True, hide_index=True)
+                st.write(", ".join(f"{value:,} {name.replace('_', ' ')}" for name, value in profile.counters.items()))
+                st.download_button("Export JSON", profile.to_json(), "profile.json",
+                                   mime="application/json", key="profile_json")
+                stats = profile.cprofile_stats()
+                if stats is not None:
+                    st.download_button("Export cProfile", stats, "profile.prof", key="profile_prof")
 
-# Round Robin Scheduling
-elif selected == "Round Robin":
-    st.title("Round Robin Scheduling")
-    
-    with st.expander("ℹ️ About Round Robin", expanded=True):
-        st.write("""
-        **Round Robin** scheduling:
-        - Each process gets equal time quantum
-        - Preemptive - interrupts processes after quantum
-        - Fair allocation of CPU time
-        - Performance depends heavily on quantum size
-        """)
-    
-    # Time quantum input
-    time_quantum = st.slider("Time Quantum", 1, 10, 2, key="rr_quantum")
-    
-    # Process input section
-    st.subheader("Process Details")
-    col1, col2 = st.columns([3,1])
-    with col1:
-        num_processes = st.slider("Number of processes", 1, 30, 3, key="rr_num")
-    with col2:
-        if st.button("Randomize", key="rr_random"):
-            st.session_state.rr_processes = generate_random_processes(num_processes)
-    
-    process_list = []
-    for i in range(num_processes):
-        with st.container():
-            cols = st.columns(3)
-            with cols[0]:
-                pid = st.text_input(f"Process ID", f"P{i+1}", key=f"rr_pid_{i}")
-            with cols[1]:
-                at = st.number_input(f"Arrival Time", min_value=0, value=i, key=f"rr_at_{i}")
-            with cols[2]:
-                bt = st.number_input(f"Burst Time", min_value=1, value=(i+1)*2, key=f"rr_bt_{i}")
-            process_list.append([pid, at, bt])
-    
-    # Simulation controls
-    col1, col2 = st.columns(2)
-    with col1:
-        simulate_btn = st.button("Simulate Round Robin", type="primary", use_container_width=True)
-    with col2:
-        animate_btn = st.button("Animate Round Robin", use_container_width=True)
-    
-    if simulate_btn or animate_btn:
-        # Round Robin Scheduling Logic
-        processes = sorted(process_list, key=lambda x: x[1])  # Sort by arrival time
-        n = len(processes)
-        remaining_time = [p[2] for p in processes]
-        timeline = []
-        current_time = 0
-        results = {pid: {"pid": pid, "at": at, "bt": bt, "start": None, "end": None} 
-                  for pid, at, bt in processes}
-        queue = []
-        visited = [False] * n
-        
-        # Initial queue population
-        for i in range(n):
-            if processes[i][1] <= current_time:
-                queue.append(i)
-                visited[i] = True
-        
-        while queue:
-            idx = queue.pop(0)
-            pid, at, bt = processes[idx]
-            
-            if current_time < at:
-                timeline.append(("IDLE", current_time, at))
-                current_time = at
-            
-            # Record start time if not already set
-            if results[pid]["start"] is None:
-                results[pid]["start"] = current_time
-            
-            # Execute for time quantum or remaining time
-            exec_time = min(time_quantum, remaining_time[idx])
-            start_time = current_time
-            current_time += exec_time
-            remaining_time[idx] -= exec_time
-            timeline.append((pid, start_time, current_time))
-            
-            # Check for new arrivals
-            for i in range(n):
-                if not visited[i] and processes[i][1] <= current_time:
-                    queue.append(i)
-                    visited[i] = True
-            
-            # Record completion if finished
-            if remaining_time[idx] == 0:
-                results[pid]["end"] = current_time
-            else:
-                queue.append(idx)  # Re-add to queue if not finished
-        
-        # Prepare results
-        final_results = []
-        for pid, data in results.items():
-            if data["end"] is None:
-                continue
-            turnaround = data["end"] - data["at"]
-            waiting = turnaround - data["bt"]
-            final_results.append({
-                "Process ID": pid,
-                "Arrival Time": data["at"],
-                "Burst Time": data["bt"],
-                "Start Time": data["start"],
-                "Completion Time": data["end"],
-                "Turnaround Time": turnaround,
-                "Waiting Time": waiting
-            })
-        
-        # Display results
-        st.subheader("Results")
-        df = pd.DataFrame(final_results)
-        st.dataframe(df.sort_values("Process ID").style.set_properties(**{'background-color': 'white'}), 
-                      use_container_width=True,
-                      hide_index=True)
-        
-        # Display metrics
-        display_metrics(final_results)
-        
-        # Show Gantt chart
-        st.subheader("Gantt Chart")
-        fig = plot_gantt_chart(timeline, f"Round Robin (Quantum={time_quantum})", color='#2563eb')
-        st.pyplot(fig)
-        
-        # Animation
-        if animate_btn:
-            st.subheader("Simulation Animation")
-            animate_gantt_chart(timeline, f"Round Robin (Quantum={time_quantum})", color='#2563eb')
+# Result cache counters
+with st.sidebar:
+    with st.expander("Result Cache"):
+        from ui import result_cache
 
-# Priority Scheduling
-elif selected == "Priority":
-    st.title("Priority Scheduling")
-    
-    with st.expander("ℹ️ About Priority Scheduling", expanded=True):
-        st.write("""
-        **Priority** scheduling:
-        - Each process has a priority (lower number = higher priority)
-        - Can be preemptive or non-preemptive
-        - Higher priority processes run first
-        - May cause starvation of low-priority processes
-        """)
-    
-    # Scheduling type
-    preemptive = st.radio("Scheduling Type", ["Non-Preemptive", "Preemptive"], index=0, key="priority_type") == "Preemptive"
-    
-    # Process input section
-    st.subheader("Process Details")
-    col1, col2 = st.columns([3,1])
-    with col1:
-        num_processes = st.slider("Number of processes", 1, 30, 3, key="priority_num")
-    with col2:
-        if st.button("Randomize", key="priority_random"):
-            st.session_state.priority_processes = generate_random_processes(num_processes)
-            for i in range(num_processes):
-                st.session_state.priority_processes[i].append(random.randint(1, 5))
-    
-    process_list = []
-    for i in range(num_processes):
-        with st.container():
-            cols = st.columns(4)
-            with cols[0]:
-                pid = st.text_input(f"Process ID", f"P{i+1}", key=f"priority_pid_{i}")
-            with cols[1]:
-                at = st.number_input(f"Arrival Time", min_value=0, value=i, key=f"priority_at_{i}")
-            with cols[2]:
-                bt = st.number_input(f"Burst Time", min_value=1, value=(i+1)*2, key=f"priority_bt_{i}")
-            with cols[3]:
-                priority = st.number_input(f"Priority", min_value=1, value=i+1, key=f"priority_priority_{i}")
-            process_list.append([pid, at, bt, priority])
-    
-    # Simulation controls
-    col1, col2 = st.columns(2)
-    with col1:
-        simulate_btn = st.button("Simulate Priority", type="primary", use_container_width=True)
-    with col2:
-        animate_btn = st.button("Animate Priority", use_container_width=True)
-    
-    if simulate_btn or animate_btn:
-        # Priority Scheduling Logic
-        processes = sorted(process_list, key=lambda x: (x[1], x[3]))  # Sort by arrival then priority
-        n = len(processes)
-        remaining_time = [p[2] for p in processes]
-        timeline = []
-        current_time = 0
-        results = {pid: {"pid": pid, "at": at, "bt": bt, "priority": priority, "start": None, "end": None} 
-                  for pid, at, bt, priority in processes}
-        
-        while True:
-            ready = [i for i in range(n) if processes[i][1] <= current_time and remaining_time[i] > 0]
-            
-            if not ready:
-                if all(rt == 0 for rt in remaining_time):
-                    break
-                next_arrival = min([p[1] for i,p in enumerate(processes) if remaining_time[i] > 0])
-                timeline.append(("IDLE", current_time, next_arrival))
-                current_time = next_arrival
-                continue
-            
-            # Find process with highest priority (lowest number)
-            highest_idx = min(ready, key=lambda i: processes[i][3])
-            pid = processes[highest_idx][0]
-            
-            if preemptive:
-                # Record start time if not already set
-                if results[pid]["start"] is None:
-                    results[pid]["start"] = current_time
-                
-                # Execute for 1 time unit
-                start_time = current_time
-                remaining_time[highest_idx] -= 1
-                current_time += 1
-                
-                if timeline and timeline[-1][0] == pid:
-                    # Extend existing execution
-                    timeline[-1] = (pid, timeline[-1][1], current_time)
-                else:
-                    timeline.append((pid, start_time, current_time))
-                
-                # Record completion if finished
-                if remaining_time[highest_idx] == 0:
-                    results[pid]["end"] = current_time
-            else:
-                # Non-preemptive - execute entire burst
-                if results[pid]["start"] is None:
-                    results[pid]["start"] = current_time
-                
-                start_time = current_time
-                current_time += remaining_time[highest_idx]
-                remaining_time[highest_idx] = 0
-                timeline.append((pid, start_time, current_time))
-                results[pid]["end"] = current_time
-        
-        # Prepare results
-        final_results = []
-        for pid, data in results.items():
-            if data["end"] is None:
-                continue
-            turnaround = data["end"] - data["at"]
-            waiting = turnaround - data["bt"]
-            final_results.append({
-                "Process ID": pid,
-                "Arrival Time": data["at"],
-                "Burst Time": data["bt"],
-                "Priority": data["priority"],
-                "Start Time": data["start"],
-                "Completion Time": data["end"],
-                "Turnaround Time": turnaround,
-                "Waiting Time": waiting
-            })
-        
-        # Display results
-        st.subheader("Results")
-        df = pd.DataFrame(final_results)
-        st.dataframe(df.sort_values("Process ID").style.set_properties(**{'background-color': 'white'}), 
-                      use_container_width=True,
-                      hide_index=True)
-        
-        # Display metrics
-        display_metrics(final_results)
-        
-        # Show Gantt chart
-        st.subheader("Gantt Chart")
-        fig = plot_gantt_chart(timeline, f"Priority ({'Preemptive' if preemptive else 'Non-Preemptive'})", color='#2563eb')
-        st.pyplot(fig)
-        
-        # Animation
-        if animate_btn:
-            st.subheader("Simulation Animation")
-            animate_gantt_chart(timeline, f"Priority ({'Preemptive' if preemptive else 'Non-Preemptive'})", color='#2563eb')
+        stats = result_cache().stats()
+        st.write(f"Memory: {stats['memory_hits']} hits, {stats['memory_misses']} misses, "
+                 f"{stats['memory_entries']} entries ({stats['memory_bytes'] / 2**20:.1f} MiB)")
+        if "disk_hits" in stats:
+            st.write(f"Disk: {stats['disk_hits']} hits, {stats['disk_misses']} misses")
 
 # Footer
 st.markdown("---")
\ No newline at end of file
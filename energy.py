@@ -0,0 +1,177 @@
+# DVFS energy model and energy-aware scheduling policies.
+#
+# A P-state is (name, frequency in GHz, voltage in V, active power in W); the
+# fastest one is the nominal speed at which burst times are measured, so a
+# process runs burst * f_max / f time units at frequency f. An idle state is
+# (name, power in W, break-even time): a gap uses the lowest-power state whose
+# break-even time it covers, so short gaps stay in a shallow idle state.
+#
+# Policies, each applied on top of an ordinary algorithm run:
+#   race_to_idle       run everything at the fastest P-state, sleep in the gaps
+#   slack_reclamation  a process that finishes right before an idle gap is
+#                      slowed down to the P-state that spends the least energy
+#                      on it plus the rest of the gap; nothing else moves
+#   static             scale every burst to one fixed P-state and re-simulate
+#
+# All accounting works on the Schedule's segment arrays, so it is vectorized
+# over the whole timeline.
+
+import numpy as np
+
+from scheduler import simulate
+from tables import IDLE_CODE, SWITCH_CODE, Schedule, Workload
+
+DEFAULT_PSTATES = [
+    ("P0", 3.0, 1.20, 45.0),
+    ("P1", 2.4, 1.05, 28.0),
+    ("P2", 1.8, 0.95, 17.0),
+    ("P3", 1.2, 0.85, 9.0),
+]
+
+DEFAULT_IDLE_STATES = [
+    ("C1", 5.0, 0.0),
+    ("C3", 2.0, 2.0),
+    ("C6", 0.5, 5.0),
+]
+
+POLICIES = ("race_to_idle", "slack_reclamation", "static")
+
+
+def _pstate_columns(pstates):
+    if not pstates:
+        raise ValueError("At least one P-state is required")
+    names = [state[0] for state in pstates]
+    frequency = np.array([state[1] for state in pstates], dtype=float)
+    power = np.array([state[3] for state in pstates], dtype=float)
+    if np.any(frequency <= 0) or np.any(power < 0):
+        raise ValueError("P-state frequencies must be positive and powers non-negative")
+    return names, frequency / frequency.max(), power
+
+
+def _idle_columns(idle_states):
+    if not idle_states:
+        raise ValueError("At least one idle state is required")
+    names = [state[0] for state in idle_states]
+    power = np.array([state[1] for state in idle_states], dtype=float)
+    break_even = np.array([state[2] for state in idle_states], dtype=float)
+    if not np.any(break_even <= 0):
+        raise ValueError("One idle state must have a zero break-even time")
+    return names, power, break_even
+
+
+# Cheapest usable idle state for each gap length, and its energy. Works on
+# arrays of any shape.
+def _idle_choice(gaps, idle_power, break_even):
+    gaps = np.asarray(gaps, dtype=float)
+    energy = np.where(gaps[..., None] >= break_even, gaps[..., None] * idle_power, np.inf)
+    state = energy.argmin(axis=-1)
+    return state, np.take_along_axis(energy, state[..., None], axis=-1)[..., 0]
+
+
+# Slow down each process that runs right before an idle gap. Returns the new
+# segment ends/starts, the P-state per segment and the updated schedule.
+def _reclaim_slack(schedule, speed, power, idle_power, break_even, fastest):
+    seg_pid = schedule.seg_pid
+    seg_start = schedule.seg_start.astype(float)
+    seg_end = schedule.seg_end.astype(float)
+    state = np.full(seg_pid.size, fastest, dtype=np.intp)
+
+    gaps = np.flatnonzero(seg_pid == IDLE_CODE)
+    gaps = gaps[gaps > 0]
+    gaps = gaps[seg_pid[gaps - 1] >= 0]
+    if gaps.size == 0:
+        return seg_start, seg_end, state, schedule
+    run = seg_end[gaps - 1] - seg_start[gaps - 1]
+    room = run + (seg_end[gaps] - seg_start[gaps])
+
+    # Energy of every (gap, P-state) choice: stretched run plus idle remainder
+    stretched = run[:, None] / speed
+    _, idle_energy = _idle_choice(np.maximum(room[:, None] - stretched, 0), idle_power, break_even)
+    energy = np.where(stretched <= room[:, None] + 1e-9, stretched * power + idle_energy, np.inf)
+    best = energy.argmin(axis=1)
+    new_end = np.minimum(seg_start[gaps - 1] + stretched[np.arange(gaps.size), best], seg_end[gaps])
+    old_end = seg_end[gaps - 1]
+    seg_end[gaps - 1] = new_end
+    seg_start[gaps] = np.minimum(new_end, seg_end[gaps])
+    state[gaps - 1] = best
+
+    # The stretched segment is the last one of its process: move its completion
+    workload = schedule.workload
+    completion = schedule.completion.astype(float)
+    by_completion = np.argsort(completion, kind="stable")
+    rows = by_completion[np.minimum(np.searchsorted(completion[by_completion], old_end),
+                                    completion.size - 1)]
+    matched = (workload.pid[rows] == seg_pid[gaps - 1]) & (completion[rows] == old_end)
+    rows = rows[matched]
+    burst = workload.burst.astype(float)
+    burst[rows] += (new_end - old_end)[matched]
+    completion[rows] = new_end[matched]
+
+    keep = seg_end > seg_start  # Gaps that were used up entirely
+    stretched_workload = Workload(workload.names, workload.pid, workload.arrival, burst, workload.priority)
+    result = Schedule(stretched_workload, schedule.start, completion,
+                      seg_pid[keep], seg_start[keep], seg_end[keep])
+    return seg_start[keep], seg_end[keep], state[keep], result
+
+
+# Bursts scaled to run at a slower P-state, chunk by chunk for streamed traces
+def _scaled(workload, speed):
+    if isinstance(workload, (list, tuple)) and not (workload and isinstance(workload[0], Workload)):
+        workload = Workload.from_rows(workload)
+    chunks = [workload] if isinstance(workload, Workload) else workload
+    for chunk in chunks:
+        yield Workload(chunk.names, chunk.pid, chunk.arrival, chunk.burst / speed, chunk.priority)
+
+
+# Simulate `algorithm` under a DVFS policy. Returns the (possibly stretched)
+# Schedule and an energy report with total/active/idle energy in joules
+# (time units taken as seconds), EDP (energy x makespan) and the time spent
+# in every P-state and idle state.
+def simulate_energy(algorithm, workload, policy="slack_reclamation", pstates=DEFAULT_PSTATES,
+                    idle_states=DEFAULT_IDLE_STATES, pstate=0, **params):
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown energy policy: {policy}")
+    pstate_names, speed, power = _pstate_columns(pstates)
+    idle_names, idle_power, break_even = _idle_columns(idle_states)
+    fastest = int(speed.argmax())
+
+    if policy == "static":
+        if not 0 <= pstate < len(pstates):
+            raise ValueError("pstate must index one of the P-states")
+        schedule = simulate(algorithm, _scaled(workload, speed[pstate]), **params)
+        seg_start = schedule.seg_start.astype(float)
+        seg_end = schedule.seg_end.astype(float)
+        state = np.full(schedule.seg_pid.size, pstate, dtype=np.intp)
+    else:
+        schedule = simulate(algorithm, workload, **params)
+        if policy == "slack_reclamation":
+            seg_start, seg_end, state, schedule = _reclaim_slack(
+                schedule, speed, power, idle_power, break_even, fastest)
+        else:
+            seg_start = schedule.seg_start.astype(float)
+            seg_end = schedule.seg_end.astype(float)
+            state = np.full(schedule.seg_pid.size, fastest, dtype=np.intp)
+
+    seg_pid = schedule.seg_pid
+    length = seg_end - seg_start
+    idle = seg_pid == IDLE_CODE
+    # Context switches run at the fastest P-state
+    state[seg_pid == SWITCH_CODE] = fastest
+    active_time = np.bincount(state[~idle], weights=length[~idle], minlength=len(pstates))
+    active_energy = float(active_time @ power)
+    idle_state, idle_energy = _idle_choice(length[idle], idle_power, break_even)
+    idle_time = np.bincount(idle_state, weights=length[idle], minlength=len(idle_states))
+
+    energy = active_energy + float(idle_energy.sum())
+    makespan = float(seg_end[-1]) if seg_end.size else 0.0
+    time_at_state = dict(zip(pstate_names, active_time.tolist()))
+    time_at_state.update(zip(idle_names, idle_time.tolist()))
+    report = {
+        "energy": energy,
+        "active_energy": active_energy,
+        "idle_energy": float(idle_energy.sum()),
+        "edp": energy * makespan,
+        "makespan": makespan,
+        "time_at_state": time_at_state,
+    }
+    return schedule, report
@@ -0,0 +1,211 @@
+# Incremental re-simulation for FCFS and non-preemptive SJF.
+#
+# Both algorithms only look at processes that have already arrived, so when a
+# workload is edited the schedule is unchanged up to the first decision that
+# could see an edited process. Runs keep their state in arrival order (the
+# order the engine dispatches from) together with checkpoints along the
+# timeline; re-simulating an edited workload finds the first arrival-ordered
+# position where the two workloads differ, resumes from the last checkpoint
+# before the earliest arrival involved, and splices the new suffix onto the
+# kept prefix of the timeline and the start/completion columns.
+#
+#   FCFS  the only state is when the CPU becomes free, so every completion is
+#         a checkpoint and the run resumes right at the first changed position
+#   SJF   a checkpoint every CHECKPOINT_INTERVAL dispatches records the clock,
+#         the arrival cursor, the dispatch count and the timeline length; the
+#         ready heap is rebuilt from each process's dispatch rank
+#
+# Anything else (other algorithms, extra parameters, streamed traces, no
+# usable previous run) falls back to a full scheduler.simulate run.
+
+import heapq
+
+import numpy as np
+
+from scheduler import fcfs_arrays, pid_sort_key, simulate
+from tables import IDLE_CODE, Schedule, Workload
+
+ALGORITHMS = ("FCFS", "SJF")
+
+CHECKPOINT_INTERVAL = 64
+
+
+# Simulate `workload`, reusing the unaffected prefix of `previous` (the state
+# returned by an earlier call) when it can. Returns the Schedule and the state
+# to pass to the next call, which is None when the run cannot be resumed.
+def simulate_incremental(algorithm, workload, previous=None, interval=CHECKPOINT_INTERVAL, **params):
+    if algorithm not in ALGORITHMS or params or not isinstance(workload, Workload):
+        return simulate(algorithm, workload, **params), None
+
+    order, names, arrival, burst = _sorted_columns(workload)
+    resume = None
+    if previous is not None and previous["algorithm"] == algorithm:
+        resume = _first_change(previous, names, arrival, burst)
+    if algorithm == "FCFS":
+        state = _fcfs(previous if resume else None, arrival, burst, resume)
+    else:
+        state = _sjf(previous if resume else None, names, arrival, burst, resume, interval)
+    state.update(algorithm=algorithm, names=names, arrival=arrival, burst=burst)
+    return _schedule(workload, order, state), state
+
+
+# Workload columns in dispatch order: stable by arrival, as scheduler.py sorts
+def _sorted_columns(workload):
+    arrival = workload.arrival
+    if np.any(arrival[1:] < arrival[:-1]):
+        order = np.argsort(arrival, kind="stable")
+    else:
+        order = np.arange(arrival.size)
+    names = np.asarray(list(workload.names), dtype=object)[workload.pid[order]]
+    return order, names, arrival[order], workload.burst[order]
+
+
+# First arrival-ordered position where the new columns differ from the
+# previous run's, and the earliest arrival among the two differing entries
+# (None when nothing changed). Every process arriving before that time sits
+# in the shared prefix, so decisions taken earlier still hold.
+def _first_change(previous, names, arrival, burst):
+    count = min(previous["arrival"].size, arrival.size)
+    differs = ((previous["names"][:count] != names[:count])
+               | (previous["arrival"][:count] != arrival[:count])
+               | (previous["burst"][:count] != burst[:count]))
+    changed = np.flatnonzero(differs)
+    position = int(changed[0]) if changed.size else count
+    arrivals = [column[position] for column in (previous["arrival"], arrival) if position < column.size]
+    return position, (min(arrivals) if arrivals else None)
+
+
+def _fcfs(previous, arrival, burst, resume):
+    if previous is None:
+        position, since = 0, 0
+    else:
+        position, since = resume
+        if since is None:
+            return {key: previous[key] for key in ("start", "end", "seg_pos", "seg_start", "seg_end")}
+
+    # Keep the timeline through the last unchanged process
+    cut = 0
+    start_time = 0
+    if position:
+        cut = int(np.flatnonzero(previous["seg_pos"] == position - 1)[0]) + 1
+        start_time = previous["end"][position - 1]
+
+    result = fcfs_arrays(arrival[position:], burst[position:], start_time)
+    start, completion = result["start"], result["completion"]
+    # Interleave the idle gaps with the process segments, as scheduler.fcfs does
+    gap_at = result["idle_before"]
+    count = start.size + gap_at.size
+    is_gap = np.zeros(count, dtype=bool)
+    is_gap[gap_at + np.arange(gap_at.size)] = True
+    seg_pos = np.full(count, IDLE_CODE, dtype=np.int64)
+    seg_start = np.empty(count, dtype=start.dtype)
+    seg_end = np.empty(count, dtype=start.dtype)
+    seg_pos[~is_gap] = np.arange(position, position + start.size)
+    seg_start[~is_gap] = start
+    seg_end[~is_gap] = completion
+    seg_start[is_gap] = result["idle_start"]
+    seg_end[is_gap] = result["idle_end"]
+
+    if position:
+        start = np.concatenate((previous["start"][:position], start))
+        completion = np.concatenate((previous["end"][:position], completion))
+        seg_pos = np.concatenate((previous["seg_pos"][:cut], seg_pos))
+        seg_start = np.concatenate((previous["seg_start"][:cut], seg_start))
+        seg_end = np.concatenate((previous["seg_end"][:cut], seg_end))
+    return {"start": start, "end": completion, "seg_pos": seg_pos, "seg_start": seg_start, "seg_end": seg_end}
+
+
+def _sjf(previous, names, arrival, burst, resume, interval):
+    count = arrival.size
+    arrival_list = arrival.tolist()
+    burst_list = burst.tolist()
+    start = [None] * count
+    end = [None] * count
+    rank = [-1] * count
+    ready = []
+    checkpoints = []
+    current_time = next_arrival = dispatched = 0
+    prefix = None
+
+    if previous is not None:
+        _, since = resume
+        if since is None:
+            return {key: previous[key] for key in
+                    ("start", "end", "rank", "checkpoints", "seg_pos", "seg_start", "seg_end")}
+        # Last checkpoint taken before the earliest changed arrival
+        kept = [c for c in previous["checkpoints"] if c[0] < since]
+        if kept:
+            current_time, next_arrival, dispatched, segments = kept[-1]
+            checkpoints = kept
+            unset = [None] * (count - next_arrival)
+            start = previous["start"][:next_arrival].tolist() + unset
+            end = previous["end"][:next_arrival].tolist() + unset
+            rank = previous["rank"][:next_arrival].tolist() + [-1] * len(unset)
+            waiting = np.flatnonzero(previous["rank"][:next_arrival] >= dispatched).tolist()
+            for i in waiting:
+                start[i] = end[i] = None
+                rank[i] = -1
+            ready = [(burst_list[i], arrival_list[i], i) for i in waiting]
+            heapq.heapify(ready)
+            prefix = (previous["seg_pos"][:segments], previous["seg_start"][:segments],
+                      previous["seg_end"][:segments])
+
+    seg_pos, seg_start, seg_end = [], [], []
+    offset = 0 if prefix is None else prefix[0].size
+    next_checkpoint = dispatched + (interval if checkpoints else 0)
+    # Same loop as scheduler.sjf, on arrival-ordered positions
+    while ready or next_arrival < count:
+        if dispatched >= next_checkpoint:
+            checkpoints.append((current_time, next_arrival, dispatched, offset + len(seg_pos)))
+            next_checkpoint = dispatched + interval
+
+        while next_arrival < count and arrival_list[next_arrival] <= current_time:
+            heapq.heappush(ready, (burst_list[next_arrival], arrival_list[next_arrival], next_arrival))
+            next_arrival += 1
+
+        if not ready:
+            seg_pos.append(IDLE_CODE)
+            seg_start.append(current_time)
+            seg_end.append(arrival_list[next_arrival])
+            current_time = arrival_list[next_arrival]
+            continue
+
+        bt, at, idx = heapq.heappop(ready)
+        if ready and ready[0][0] == bt and ready[0][1] == at:
+            tied = [idx]
+            while ready and ready[0][0] == bt and ready[0][1] == at:
+                tied.append(heapq.heappop(ready)[2])
+            idx = min(tied, key=lambda i: (pid_sort_key(names[i]), i))
+            for other in tied:
+                if other != idx:
+                    heapq.heappush(ready, (bt, at, other))
+        start[idx] = current_time
+        current_time += bt
+        end[idx] = current_time
+        rank[idx] = dispatched
+        dispatched += 1
+        seg_pos.append(idx)
+        seg_start.append(start[idx])
+        seg_end.append(current_time)
+
+    seg_pos = np.array(seg_pos, dtype=np.int64)
+    seg_start = np.array(seg_start)
+    seg_end = np.array(seg_end)
+    if prefix is not None:
+        seg_pos = np.concatenate((prefix[0], seg_pos))
+        seg_start = np.concatenate((prefix[1], seg_start)) if seg_start.size else prefix[1]
+        seg_end = np.concatenate((prefix[2], seg_end)) if seg_end.size else prefix[2]
+    return {"start": np.array(start), "end": np.array(end), "rank": np.array(rank, dtype=np.int64),
+            "checkpoints": checkpoints, "seg_pos": seg_pos, "seg_start": seg_start, "seg_end": seg_end}
+
+
+# Schedule in workload row order from a run's arrival-ordered state
+def _schedule(workload, order, state):
+    pid = workload.pid[order]
+    seg_pos = state["seg_pos"]
+    seg_pid = np.where(seg_pos >= 0, pid[np.maximum(seg_pos, 0)] if pid.size else 0, IDLE_CODE)
+    start = np.empty_like(state["start"])
+    end = np.empty_like(state["end"])
+    start[order] = state["start"]
+    end[order] = state["end"]
+    return Schedule(workload, start, end, seg_pid, state["seg_start"], state["seg_end"])
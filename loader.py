@@ -0,0 +1,199 @@
+# Streaming workload loader for CSV and JSONL trace files.
+#
+# Traces are read through a generator pipeline: lines -> parsed records ->
+# Workload chunks of at most `chunk_size` processes. Only one chunk of
+# parsed Python objects is alive at a time, and scheduler.simulate() pulls
+# chunks as its clock reaches them, so parsing never runs ahead of the
+# simulation. The engine still keeps every process it has seen (as compact
+# columns, see scheduler.py), so a run's memory grows with the trace length.
+# Records must be in arrival order.
+#
+# CSV files need a header row; JSONL files hold one object per line. Column
+# names are matched case-insensitively against FIELD_NAMES. Binary traces
+# written by tracefile.py are mapped rather than parsed.
+
+import csv
+import gzip
+import hashlib
+import io
+import json
+
+import numpy as np
+
+from tables import Workload, concat_workloads
+from tracefile import EXTENSION, read_binary_trace
+
+DEFAULT_CHUNK_SIZE = 65536
+
+FIELD_NAMES = {
+    "pid": ("pid", "process id", "process_id", "id", "name"),
+    "arrival": ("arrival", "arrival time", "arrival_time", "at"),
+    "burst": ("burst", "burst time", "burst_time", "bt"),
+    "priority": ("priority", "prio"),
+}
+
+
+def _number(value):
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+# Map each field to its position (CSV) or key (JSONL) in the source columns
+def _match_fields(columns):
+    lookup = {str(column).strip().lower(): column for column in columns}
+    fields = {}
+    for field, aliases in FIELD_NAMES.items():
+        for alias in aliases:
+            if alias in lookup:
+                fields[field] = lookup[alias]
+                break
+    missing = [f for f in ("arrival", "burst") if f not in fields]
+    if missing:
+        raise ValueError(f"Trace is missing column(s): {', '.join(missing)}")
+    return fields
+
+
+# Text lines from a path (optionally .gz) or an open text/binary file
+def iter_lines(source):
+    if isinstance(source, str):
+        opener = gzip.open if source.endswith(".gz") else open
+        with opener(source, "rt", newline="") as handle:
+            yield from handle
+        return
+    if isinstance(source.read(0), bytes):
+        wrapper = io.TextIOWrapper(source, encoding="utf-8", newline="")
+        try:
+            yield from wrapper
+        finally:
+            wrapper.detach()  # Leave the caller's file open
+        return
+    yield from source
+
+
+# (pid, arrival, burst, priority) records from CSV lines
+def parse_csv(lines):
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    fields = _match_fields(header)
+    index = {field: header.index(column) for field, column in fields.items()}
+    for number, row in enumerate(reader):
+        if not row:
+            continue
+        pid = row[index["pid"]] if "pid" in index else f"P{number + 1}"
+        priority = _number(row[index["priority"]]) if "priority" in index else None
+        yield pid, _number(row[index["arrival"]]), _number(row[index["burst"]]), priority
+
+
+# (pid, arrival, burst, priority) records from JSONL lines
+def parse_jsonl(lines):
+    fields = None
+    number = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if fields is None:
+            fields = _match_fields(record.keys())
+        number += 1
+        pid = record[fields["pid"]] if "pid" in fields else f"P{number}"
+        priority = _number(record[fields["priority"]]) if "priority" in fields else None
+        yield str(pid), _number(record[fields["arrival"]]), _number(record[fields["burst"]]), priority
+
+
+# Group records into Workload chunks. All chunks share one interned names
+# list, so pid codes stay valid across the whole trace.
+def chunked(records, chunk_size=DEFAULT_CHUNK_SIZE):
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    names = []
+    codes = {}
+    pid, arrival, burst, priority = [], [], [], []
+
+    def flush():
+        chunk = Workload(
+            names,
+            np.array(pid, dtype=np.int32),
+            np.array(arrival),
+            np.array(burst),
+            None if None in priority else np.array(priority),
+        )
+        for column in (pid, arrival, burst, priority):
+            column.clear()
+        return chunk
+
+    for name, at, bt, prio in records:
+        code = codes.get(name)
+        if code is None:
+            code = codes[name] = len(names)
+            names.append(name)
+        pid.append(code)
+        arrival.append(at)
+        burst.append(bt)
+        priority.append(prio)
+        if len(pid) >= chunk_size:
+            yield flush()
+    if pid:
+        yield flush()
+
+
+def _detect_format(name):
+    name = name.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if name.endswith(EXTENSION):
+        return "binary"
+    return "jsonl" if name.endswith((".jsonl", ".json", ".ndjson")) else "csv"
+
+
+# Lazily read a trace as Workload chunks; `name` is used to detect the format
+# when reading from an open file
+def read_trace(source, fmt=None, chunk_size=DEFAULT_CHUNK_SIZE, name=None):
+    if fmt is None:
+        fmt = _detect_format(name or (source if isinstance(source, str) else getattr(source, "name", "")))
+    if fmt == "binary":
+        return read_binary_trace(source, chunk_size)
+    parse = {"csv": parse_csv, "jsonl": parse_jsonl}.get(fmt)
+    if parse is None:
+        raise ValueError(f"Unknown trace format: {fmt}")
+    return chunked(parse(iter_lines(source)), chunk_size)
+
+
+# Read a whole trace into a single Workload
+def load_trace(source, fmt=None, chunk_size=DEFAULT_CHUNK_SIZE, name=None):
+    return concat_workloads(read_trace(source, fmt, chunk_size, name))
+
+
+# A trace that can be read more than once: each iteration rewinds the source
+# and yields fresh Workload chunks, and digest() hashes the raw bytes so
+# results for the same file can be cached (see cache.py)
+class TraceFile:
+    def __init__(self, source, fmt=None, chunk_size=DEFAULT_CHUNK_SIZE, name=None):
+        self.source = source
+        self.fmt = fmt
+        self.chunk_size = chunk_size
+        self.name = name
+
+    def __iter__(self):
+        if not isinstance(self.source, str):
+            self.source.seek(0)
+        return read_trace(self.source, self.fmt, self.chunk_size, self.name)
+
+    def digest(self):
+        digest = hashlib.sha256()
+        if isinstance(self.source, str):
+            with open(self.source, "rb") as handle:
+                for block in iter(lambda: handle.read(1 << 20), b""):
+                    digest.update(block)
+        elif hasattr(self.source, "getbuffer"):
+            digest.update(self.source.getbuffer())
+        else:
+            self.source.seek(0)
+            for block in iter(lambda: self.source.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
@@ -0,0 +1,180 @@
+# Scheduling metrics computed with NumPy over per-process columns, so the
+# same code serves the 30-row pages and multi-million process traces.
+
+import numpy as np
+
+from scheduler import NICE_0_WEIGHT
+from sketch import QuantileSketch
+
+LATENCIES = ("response", "waiting", "turnaround")
+TAIL_QUANTILES = {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+
+# Processes per chunk when a schedule is summarized in one streaming pass
+LATENCY_CHUNK_SIZE = 65536
+
+# Instants at which fairness_metrics compares vruntimes
+FAIRNESS_SAMPLES = 32
+
+
+# Average turnaround, average waiting and throughput (processes per time unit
+# up to the last completion)
+def compute_metrics(turnaround, waiting, completion):
+    turnaround = np.asarray(turnaround)
+    waiting = np.asarray(waiting)
+    completion = np.asarray(completion)
+    count = turnaround.size
+    if count == 0:
+        return {"avg_turnaround": 0.0, "avg_waiting": 0.0, "throughput": 0.0}
+
+    makespan = completion.max()
+    return {
+        "avg_turnaround": float(turnaround.mean()),
+        "avg_waiting": float(waiting.mean()),
+        "throughput": float(count / makespan) if makespan > 0 else 0.0,
+    }
+
+
+# Same metrics for a Schedule returned by the engine
+def schedule_metrics(schedule):
+    return compute_metrics(schedule.turnaround, schedule.waiting, schedule.completion)
+
+
+# Number of times a CPU moves from one process to a different one; idle
+# gaps and switch-overhead segments in between are skipped. Multi-core
+# schedules are counted core by core and summed, so the step from one core's
+# lane to the next is not a switch.
+def context_switches(schedule):
+    running = schedule.seg_pid >= 0
+    pid = schedule.seg_pid[running]
+    changed = pid[1:] != pid[:-1]
+    if schedule.seg_core is not None:
+        core = schedule.seg_core[running]
+        order = np.lexsort((schedule.seg_start[running], core))
+        pid, core = pid[order], core[order]
+        changed = (pid[1:] != pid[:-1]) & (core[1:] == core[:-1])
+    return int(np.count_nonzero(changed))
+
+
+# Fraction of the makespan each core spent running processes (switch overhead
+# and idle time excluded), one entry per core, from the schedule's time index
+def core_utilization(schedule):
+    cores = schedule.cores
+    makespan = schedule.makespan
+    if makespan <= 0:
+        return np.zeros(cores)
+    index = schedule.time_index()
+    return np.array([index.utilization(0, makespan, core) for core in range(cores)])
+
+
+# Add one chunk of per-process columns to `sketches`, a dict of
+# QuantileSketch keyed by (latency, priority class); class None holds every
+# process. Response time is the wait before a process first runs.
+def add_latencies(sketches, arrival, burst, start, completion, priority=None):
+    latencies = {"response": start - arrival, "turnaround": completion - arrival}
+    latencies["waiting"] = latencies["turnaround"] - burst
+    classes = [(None, slice(None))]
+    if priority is not None:
+        classes += [(value, priority == value) for value in np.unique(priority).tolist()]
+    for latency in LATENCIES:
+        for value, rows in classes:
+            sketch = sketches.get((latency, value))
+            if sketch is None:
+                sketch = sketches[(latency, value)] = QuantileSketch()
+            sketch.add(latencies[latency][rows])
+    return sketches
+
+
+# Fold the sketches of another chunk or worker into `sketches`
+def merge_latencies(sketches, other):
+    for key, sketch in other.items():
+        if key in sketches:
+            sketches[key].merge(sketch)
+        else:
+            sketches[key] = sketch
+    return sketches
+
+
+# Latency sketches of a Schedule, read chunk by chunk
+def latency_sketches(schedule, chunk_size=LATENCY_CHUNK_SIZE):
+    workload = schedule.workload
+    sketches = {}
+    for first in range(0, len(workload), chunk_size):
+        rows = slice(first, first + chunk_size)
+        add_latencies(sketches, workload.arrival[rows], workload.burst[rows],
+                      schedule.start[rows], schedule.completion[rows],
+                      None if workload.priority is None else workload.priority[rows])
+    return sketches
+
+
+# One row per (priority class, latency) with its p50/p95/p99 and exact max,
+# all processes (class None) first
+def tail_summary(sketches):
+    rows = []
+    order = lambda key: (key[1] is not None, 0 if key[1] is None else key[1], LATENCIES.index(key[0]))
+    for latency, value in sorted(sketches, key=order):
+        sketch = sketches[(latency, value)]
+        row = {"class": value, "latency": latency, "count": sketch.count}
+        row.update((name, sketch.quantile(q)) for name, q in TAIL_QUANTILES.items())
+        row["max"] = sketch.max
+        rows.append(row)
+    return rows
+
+
+# Fairness of a single-CPU schedule against weighted fair sharing, so CFS can
+# be compared with Round Robin or anything else. `weights` are per-process
+# CFS weights (scheduler.cfs_weights), equal when None.
+#   share_deviation  mean |received / entitled - 1|, where a process is
+#                    entitled to weight / (total weight in the system) of the
+#                    CPU from its arrival to its completion
+#   jain_index       Jain's index of received / entitled (1 is perfectly fair)
+#   vruntime_spread  largest and mean gap between the vruntimes of the
+#                    processes in the system, sampled at `samples` instants.
+#                    A process's vruntime is taken as CFS would account it:
+#                    starting at min_vruntime on arrival (which advances by
+#                    NICE_0_WEIGHT / total weight per time unit) and growing by
+#                    NICE_0_WEIGHT / weight per time unit it runs.
+def fairness_metrics(schedule, weights=None, samples=FAIRNESS_SAMPLES):
+    workload = schedule.workload
+    count = len(workload)
+    result = {"share_deviation": 0.0, "jain_index": 1.0, "vruntime_spread_max": 0.0, "vruntime_spread_mean": 0.0}
+    if count == 0:
+        return result
+    weights = np.full(count, float(NICE_0_WEIGHT)) if weights is None else np.asarray(weights, dtype=float)
+    arrival = workload.arrival.astype(float)
+    burst = workload.burst.astype(float)
+    completion = schedule.completion.astype(float)
+
+    # Integral of 1 / (total weight present) over time, sampled at every
+    # arrival and completion; zero where nothing is present
+    times = np.concatenate((arrival, completion))
+    order = np.argsort(times, kind="stable")
+    times = times[order]
+    load = np.cumsum(np.concatenate((weights, -weights))[order])
+    inverse = np.where(load > weights.min() / 2, 1 / np.maximum(load, weights.min() / 2), 0.0)
+    integral = np.concatenate(([0.0], np.cumsum(inverse[:-1] * np.diff(times))))
+    entitled = weights * (np.interp(completion, times, integral) - np.interp(arrival, times, integral))
+    valid = (entitled > 0) & (burst > 0)
+    if valid.any():
+        ratio = burst[valid] / entitled[valid]
+        result["share_deviation"] = float(np.abs(ratio - 1).mean())
+        result["jain_index"] = float(ratio.sum() ** 2 / (ratio.size * (ratio ** 2).sum()))
+
+    running = schedule.seg_pid >= 0
+    seg_pid = schedule.seg_pid[running]
+    seg_start = schedule.seg_start[running]
+    seg_length = schedule.seg_end[running] - seg_start
+    codes = len(workload.names)
+    spreads = []
+    for t in np.linspace(0, float(schedule.makespan), samples + 1)[1:-1]:
+        present = (arrival <= t) & (completion > t)
+        if np.count_nonzero(present) < 2:
+            continue
+        service = np.bincount(seg_pid, weights=np.clip(t - seg_start, 0, seg_length), minlength=codes)
+        placed = np.interp(arrival[present], times, integral)
+        vruntime = NICE_0_WEIGHT * (placed + service[workload.pid[present]] / weights[present])
+        spreads.append(float(vruntime.max() - vruntime.min()))
+    if spreads:
+        result["vruntime_spread_max"] = max(spreads)
+        result["vruntime_spread_mean"] = sum(spreads) / len(spreads)
+    return result
+
@@ -0,0 +1,130 @@
+# Monte Carlo evaluation of the scheduling algorithms.
+#
+# Generates many random workloads (same distribution as the pages' Randomize
+# button), runs every algorithm on each, and reports the mean and a 95%
+# confidence interval of the per-workload metrics, plus tail latency over
+# every simulated process from quantile sketches that each batch builds and
+# the parent merges (see sketch.py). The workloads live in one
+# shared-memory block of shape (3, workloads, processes) holding the arrival,
+# burst and priority columns; pool workers attach to it by name and read
+# their rows in place, so only (first, last) index ranges and small result
+# arrays cross process boundaries.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from metrics import add_latencies, merge_latencies, schedule_metrics, tail_summary
+from scheduler import simulate
+from sweep import PARALLEL_MIN_WORK
+from tables import Workload
+
+ALGORITHMS = {
+    "FCFS": {},
+    "SJF": {},
+    "SRTF": {},
+    "Round Robin": {"time_quantum": 2},
+    "Priority": {},
+}
+
+METRICS = ("avg_waiting", "avg_turnaround", "throughput")
+
+# Normal-approximation 95% interval; samples are in the hundreds or more
+Z_95 = 1.96
+
+_columns = None
+_names = None
+_shared = None
+
+
+# Random workloads as a (3, count, processes) int64 array: arrival in [0, 5],
+# burst in [1, 10], priority in [1, 5]
+def generate_workloads(count, processes, seed=None, out=None):
+    rng = np.random.default_rng(seed)
+    if out is None:
+        out = np.empty((3, count, processes), dtype=np.int64)
+    out[0] = rng.integers(0, 6, size=(count, processes))
+    out[1] = rng.integers(1, 11, size=(count, processes))
+    out[2] = rng.integers(1, 6, size=(count, processes))
+    return out
+
+
+def _init_worker(columns, shared_name=None):
+    global _columns, _names, _shared
+    if shared_name is not None:
+        _shared = shared_memory.SharedMemory(name=shared_name)
+        shape, dtype = columns
+        columns = np.ndarray(shape, dtype=dtype, buffer=_shared.buf)
+    _columns = columns
+    _names = [f"P{i + 1}" for i in range(columns.shape[2])]
+
+
+# Metrics of workloads first..last-1 under each algorithm, as an array of
+# shape (algorithms, workloads, metrics), and per algorithm the latency
+# sketches of every process in the batch
+def _run_batch(task):
+    first, last, algorithms = task
+    pid = np.arange(_columns.shape[2], dtype=np.int32)
+    results = np.empty((len(algorithms), last - first, len(METRICS)))
+    starts = np.empty((len(algorithms), last - first, _columns.shape[2]))
+    completions = np.empty_like(starts)
+    for row in range(first, last):
+        workload = Workload(_names, pid, _columns[0, row], _columns[1, row], _columns[2, row])
+        for a, (algorithm, params) in enumerate(algorithms):
+            schedule = simulate(algorithm, workload, **params)
+            metrics = schedule_metrics(schedule)
+            results[a, row - first] = [metrics[name] for name in METRICS]
+            starts[a, row - first] = schedule.start
+            completions[a, row - first] = schedule.completion
+    arrival, burst = _columns[0, first:last].ravel(), _columns[1, first:last].ravel()
+    sketches = [add_latencies({}, arrival, burst, starts[a].ravel(), completions[a].ravel())
+                for a in range(len(algorithms))]
+    return results, sketches
+
+
+# Mean and 95% CI half-width of each metric per algorithm, one row per
+# algorithm. workers=None uses every core.
+def evaluate(count, processes, algorithms=None, seed=None, workers=None):
+    if count < 1 or processes < 1:
+        raise ValueError("count and processes must be positive")
+    algorithms = list((algorithms or ALGORITHMS).items())
+    workers = min(workers or os.cpu_count() or 1, count)
+
+    if workers == 1 or count * processes * len(algorithms) < PARALLEL_MIN_WORK:
+        _init_worker(generate_workloads(count, processes, seed))
+        results, sketches = _run_batch((0, count, algorithms))
+    else:
+        shape = (3, count, processes)
+        shared = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+        try:
+            columns = np.ndarray(shape, dtype=np.int64, buffer=shared.buf)
+            generate_workloads(count, processes, seed, out=columns)
+            # A few batches per worker keeps the cores busy to the end
+            bounds = np.linspace(0, count, min(count, workers * 4) + 1).astype(int)
+            tasks = [(first, last, algorithms) for first, last in zip(bounds[:-1], bounds[1:])]
+            with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                     initargs=((shape, np.int64), shared.name)) as pool:
+                batches = list(pool.map(_run_batch, tasks))
+            results = np.concatenate([batch[0] for batch in batches], axis=1)
+            sketches = batches[0][1]
+            for _, batch_sketches in batches[1:]:
+                for merged, sketch in zip(sketches, batch_sketches):
+                    merge_latencies(merged, sketch)
+            del columns
+        finally:
+            shared.close()
+            shared.unlink()
+
+    summary = []
+    for a, (algorithm, _) in enumerate(algorithms):
+        row = {"algorithm": algorithm, "samples": count}
+        for m, name in enumerate(METRICS):
+            values = results[a, :, m]
+            spread = values.std(ddof=1) if count > 1 else 0.0
+            row[name] = float(values.mean())
+            row[f"{name}_ci"] = float(Z_95 * spread / np.sqrt(count))
+        row["tail"] = tail_summary(sketches[a])
+        summary.append(row)
+    return summary
@@ -0,0 +1,86 @@
+# Per-stage profiling of one page run.
+#
+# A StageProfiler times named stages (the engine run, the results DataFrame
+# and its styling, the metrics boxes, matplotlib rendering, ...) and counts
+# what the engine produced: scheduling events, context switches and timeline
+# segments. Time spent in the page outside any stage is reported as "other".
+# With cprofile=True the whole run is also recorded by cProfile, and the
+# stats can be exported in the format `python -m pstats` and snakeviz read.
+# Nothing here imports streamlit, so batch jobs can use it too.
+
+import cProfile
+import json
+import marshal
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+from metrics import context_switches
+from tables import SWITCH_CODE
+
+
+class StageProfiler:
+    def __init__(self, cprofile=False):
+        self.stages = {}  # Stage name -> seconds, in the order stages first ran
+        self.counters = {}
+        self.total = 0.0
+        self.profile = cProfile.Profile() if cprofile else None
+
+    # Time one stage; a stage that runs more than once adds up
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    # Time the whole run (and record it with cProfile when enabled)
+    @contextmanager
+    def run(self):
+        if self.profile is not None:
+            self.profile.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.total += time.perf_counter() - start
+            if self.profile is not None:
+                self.profile.disable()
+
+    # Counters for a Schedule. Events are what the engine steps through:
+    # one arrival per process plus the end of every slice that ran.
+    def count(self, schedule):
+        seg_pid = schedule.seg_pid
+        self.counters = {
+            "processes": len(schedule.workload),
+            "events": len(schedule.workload) + int(np.count_nonzero(seg_pid >= 0)),
+            "context_switches": context_switches(schedule),
+            "switch_segments": int(np.count_nonzero(seg_pid == SWITCH_CODE)),
+            "segments": int(seg_pid.size),
+            "cores": schedule.cores,
+        }
+
+    # (stage, seconds) rows, with the unaccounted rest of the run as "other"
+    def breakdown(self):
+        rows = list(self.stages.items())
+        other = self.total - sum(self.stages.values())
+        if other > 0:
+            rows.append(("other", other))
+        return rows
+
+    def to_json(self):
+        return json.dumps({
+            "total_seconds": self.total,
+            "stages": dict(self.breakdown()),
+            "counters": self.counters,
+        }, indent=1)
+
+    # cProfile stats as bytes in the marshal format of pstats.dump_stats, or
+    # None when cProfile was off
+    def cprofile_stats(self):
+        if self.profile is None:
+            return None
+        self.profile.create_stats()
+        return marshal.dumps(self.profile.stats)
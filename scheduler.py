@@ -0,0 +1,750 @@
+# Headless CPU scheduling engine used by the Streamlit pages in cpu.py.
+# Nothing here imports streamlit, matplotlib or PIL, so the algorithms can be
+# called from batch jobs and benchmarks without starting the UI. Each
+# algorithm advances time from event to event (arrival, completion, quantum
+# expiry) rather than one time unit at a time.
+#
+# Algorithms take a columnar Workload (or [pid, arrival_time, burst_time]
+# rows, with an optional fourth priority column) and return a Schedule
+# holding the per-process start/completion arrays and the timeline. See
+# tables.py for both. They also accept an iterator of arrival-ordered
+# Workload chunks (loader.read_trace), consumed only as the clock reaches it.
+#
+# Streaming bounds the parser, not the engine: every process an engine has
+# seen keeps its per-position columns (8 bytes per value, see _ArrivalFeed)
+# and its chunk table until the run ends, and the timeline grows with every
+# slice, so a run holds O(n + segments) memory whatever the chunk size.
+
+import heapq
+import math
+import re
+from array import array
+from collections import deque
+
+import numpy as np
+
+from tables import IDLE_CODE, SWITCH_CODE, Schedule, Workload, concat_workloads
+
+DEFAULT_MLFQ_QUANTA = (2, 4, 8)
+DEFAULT_MLFQ_BOOST = 50
+
+DEFAULT_CFS_TARGET_LATENCY = 6
+DEFAULT_CFS_MIN_GRANULARITY = 0.75
+NICE_0_WEIGHT = 1024
+CFS_WEIGHT_RATIO = 1.25
+# CFS slices are fractional, so remaining time can be left with float
+# residue; a slice that leaves no more than this finishes the process
+CFS_RESIDUE = 1e-9
+
+
+# Re-key chunks onto one names table when they were built separately (chunks
+# from loader.read_trace already share one)
+def _shared_names(chunks):
+    names = None
+    codes = None
+    for table in chunks:
+        if names is None:
+            names = table.names
+        elif table.names is not names:
+            if codes is None:
+                names = list(names)
+                codes = {name: code for code, name in enumerate(names)}
+            mapping = np.empty(len(table.names), dtype=np.int32)
+            for i, name in enumerate(table.names):
+                code = codes.get(name)
+                if code is None:
+                    code = codes[name] = len(names)
+                    names.append(name)
+                mapping[i] = code
+            table = Workload(names, mapping[table.pid], table.arrival, table.burst, table.priority)
+        yield table
+
+
+# Yield (table, order) pairs in dispatch order. A Workload or row list is a
+# single table sorted as a whole; an iterator of Workload chunks is pulled
+# lazily, each chunk sorted on its own, and must not go back in time.
+def _sorted_chunks(workload, by_priority=False):
+    if isinstance(workload, (list, tuple)) and workload and isinstance(workload[0], Workload):
+        chunks = workload
+    elif isinstance(workload, (Workload, list, tuple)):
+        chunks = [Workload.coerce(workload)]
+    else:
+        chunks = workload
+    last_arrival = None
+    for table in _shared_names(chunks):
+        if len(table) == 0:
+            continue
+        if by_priority:
+            if table.priority is None:
+                raise ValueError("Priority scheduling needs a priority column")
+            order = np.lexsort((table.priority, table.arrival))  # Sort by arrival then priority
+        elif np.any(table.arrival[1:] < table.arrival[:-1]):
+            order = np.argsort(table.arrival, kind="stable")  # Sort by arrival time
+        else:
+            order = np.arange(len(table))  # Traces are usually stored in arrival order
+        if last_arrival is not None and table.arrival[order[0]] < last_arrival:
+            raise ValueError("Trace chunks must be in arrival order")
+        last_arrival = table.arrival[order[-1]]
+        yield table, order
+
+
+# Arrival-ordered process columns for the event loops, kept as typed
+# array.array buffers: 8 bytes per value like NumPy, but indexing them from
+# Python is as fast as a list, where NumPy scalars slow the loops down by a
+# quarter to two thirds. Times and bursts are float64 (whole numbers are
+# exact, and finish turns them back into integers for integer workloads);
+# an unset time is NaN. Positions are loaded a chunk at a time: has(i) pulls
+# chunks until position i exists, so streamed traces are parsed only as far
+# as the simulation has progressed.
+class _ArrivalFeed:
+    def __init__(self, workload, by_priority=False):
+        self._chunks = _sorted_chunks(workload, by_priority)
+        self._tables = []
+        self._orders = []
+        self._loaded = 0
+        self._columns = []
+        self.names = []
+        self.pid = array("i")
+        self.arrival = array("d")
+        self.burst = array("d")
+        self.priority = array("d")
+
+    # Per-position float64 scratch column that grows with the feed; None
+    # starts every position as NaN
+    def column(self, default=None):
+        default = math.nan if default is None else default
+        values = array("d", [default]) * len(self.arrival)
+        self._columns.append((values, default))
+        return values
+
+    def has(self, index):
+        while index >= len(self.arrival):
+            table, order = next(self._chunks, (None, None))
+            if table is None:
+                return False
+            self._load(table, order)
+        return True
+
+    def _load(self, table, order):
+        self._orders.append(order + self._loaded)
+        self._tables.append(table)
+        self._loaded += len(table)
+        self.names = table.names
+        self.pid.frombytes(table.pid[order].astype(np.int32).tobytes())
+        self.arrival.frombytes(table.arrival[order].astype(np.float64).tobytes())
+        self.burst.frombytes(table.burst[order].astype(np.float64).tobytes())
+        if table.priority is not None:
+            self.priority.frombytes(table.priority[order].astype(np.float64).tobytes())
+        for values, default in self._columns:
+            values += array("d", [default]) * len(order)
+
+    # Scatter per-position start/completion columns back to workload row
+    # order. Times stay whole numbers when every arrival and burst is one, so
+    # integer workloads get int64 times as they always have.
+    def finish(self, start, end, timeline):
+        table = concat_workloads(self._tables)
+        order = np.concatenate(self._orders) if self._orders else np.empty(0, dtype=np.intp)
+        start_col = np.empty(len(order))
+        end_col = np.empty(len(order))
+        start_col[order] = np.frombuffer(start, dtype=np.float64)
+        end_col[order] = np.frombuffer(end, dtype=np.float64)
+        schedule = Schedule.from_segments(table, start_col, end_col, timeline)
+        if table.arrival.dtype.kind in "iub" and table.burst.dtype.kind in "iub":
+            times = (schedule.start, schedule.completion, schedule.seg_start, schedule.seg_end)
+            if all(np.array_equal(values, np.floor(values)) for values in times):
+                schedule.start, schedule.completion, schedule.seg_start, schedule.seg_end = (
+                    values.astype(np.int64) for values in times)
+        return schedule
+
+
+# Natural ordering for process ids, so "P2" sorts before "P10"
+def pid_sort_key(pid):
+    return tuple((0, int(part), "") if part.isdigit() else (1, 0, part)
+                 for part in re.findall(r"\d+|\D+", str(pid)))
+
+
+def _append_slice(timeline, pid, start, end, merge):
+    if merge and timeline and timeline[-1][0] == pid and timeline[-1][2] == start:
+        # Extend existing execution
+        timeline[-1] = (pid, timeline[-1][1], end)
+    else:
+        timeline.append((pid, start, end))
+
+
+# Vectorized FCFS over arrival/burst arrays. With processes in arrival order
+# and S the running sum of bursts, completion[i] = S[i] + max over j <= i of
+# (arrival[j] - S[j-1]), so the whole schedule is a cumsum and a running max.
+# Returns a dict of arrays in arrival order ("order" maps back to the input),
+# plus the idle gaps as idle_start/idle_end and the positions of the
+# processes they precede as idle_before. `start_time` is when the CPU becomes
+# free, for continuing a schedule chunk by chunk.
+def fcfs_arrays(arrival, burst, start_time=0):
+    arrival = np.asarray(arrival)
+    burst = np.asarray(burst)
+    # Traces usually arrive pre-sorted; skip the sort and gather when they are
+    if np.any(arrival[1:] < arrival[:-1]):
+        order = np.argsort(arrival, kind="stable")
+        arrival = arrival[order]
+        burst = burst[order]
+    else:
+        order = np.arange(arrival.size)
+
+    finished = np.cumsum(burst)
+    before = finished - burst
+    # The CPU cannot start before start_time even if the trace does
+    offset = np.maximum(np.maximum.accumulate(arrival - before), start_time)
+    completion = finished + offset
+    start = completion - burst
+    turnaround = completion - arrival
+
+    previous_end = np.concatenate(([start_time], completion[:-1])).astype(completion.dtype)
+    gaps = np.flatnonzero(start > previous_end)
+    return {
+        "order": order,
+        "arrival": arrival,
+        "burst": burst,
+        "start": start,
+        "completion": completion,
+        "turnaround": turnaround,
+        "waiting": turnaround - burst,
+        "idle_start": previous_end[gaps],
+        "idle_end": start[gaps],
+        "idle_before": gaps,
+    }
+
+
+def fcfs(workload):
+    tables, orders, starts, ends, segments = [], [], [], [], []
+    offset = 0
+    current_time = 0
+    # Each chunk continues from where the previous one left the CPU
+    for table, order in _sorted_chunks(workload):
+        schedule = fcfs_arrays(table.arrival[order], table.burst[order], current_time)
+        start = schedule["start"]
+        completion = schedule["completion"]
+
+        # Interleave the idle gaps with the process segments
+        gap_at = schedule["idle_before"]
+        count = order.size + gap_at.size
+        is_gap = np.zeros(count, dtype=bool)
+        is_gap[gap_at + np.arange(gap_at.size)] = True
+        seg_pid = np.full(count, IDLE_CODE, dtype=np.int32)
+        seg_start = np.empty(count, dtype=start.dtype)
+        seg_end = np.empty(count, dtype=start.dtype)
+        seg_pid[~is_gap] = table.pid[order]
+        seg_start[~is_gap] = start
+        seg_end[~is_gap] = completion
+        seg_start[is_gap] = schedule["idle_start"]
+        seg_end[is_gap] = schedule["idle_end"]
+
+        tables.append(table)
+        orders.append(order + offset)
+        starts.append(start)
+        ends.append(completion)
+        segments.append((seg_pid, seg_start, seg_end))
+        offset += order.size
+        current_time = completion[-1]
+
+    table = concat_workloads(tables)
+    if not tables:
+        return Schedule(table, [], [], [], [], [])
+    order = np.concatenate(orders)
+    start = np.concatenate(starts)
+    completion = np.concatenate(ends)
+    start_col = np.empty_like(start)
+    end_col = np.empty_like(completion)
+    start_col[order] = start
+    end_col[order] = completion
+    return Schedule(table, start_col, end_col,
+                    *(np.concatenate(column) for column in zip(*segments)))
+
+
+# Non-preemptive SJF: arrivals are fed from the arrival-sorted list into a
+# min-heap keyed on (burst, arrival), giving O(n log n) dispatch. Exact ties
+# are broken by pid; the pid key is only computed when a tie occurs.
+def sjf(workload):
+    feed = _ArrivalFeed(workload)
+    pid, arrival, burst = feed.pid, feed.arrival, feed.burst
+    start = feed.column()
+    end = feed.column()
+    timeline = []
+    ready = []
+    current_time = 0
+    next_arrival = 0
+
+    while ready or feed.has(next_arrival):
+        while feed.has(next_arrival) and arrival[next_arrival] <= current_time:
+            heapq.heappush(ready, (burst[next_arrival], arrival[next_arrival], next_arrival))
+            next_arrival += 1
+
+        if not ready:
+            timeline.append((IDLE_CODE, current_time, arrival[next_arrival]))
+            current_time = arrival[next_arrival]
+            continue
+
+        bt, at, idx = heapq.heappop(ready)
+        if ready and ready[0][0] == bt and ready[0][1] == at:
+            tied = [idx]
+            while ready and ready[0][0] == bt and ready[0][1] == at:
+                tied.append(heapq.heappop(ready)[2])
+            idx = min(tied, key=lambda i: (pid_sort_key(feed.names[pid[i]]), i))
+            for other in tied:
+                if other != idx:
+                    heapq.heappush(ready, (bt, at, other))
+        start[idx] = current_time
+        current_time += bt
+        end[idx] = current_time
+        timeline.append((pid[idx], start[idx], current_time))
+
+    return feed.finish(start, end, timeline)
+
+
+# SRTF keeps the ready set in a min-heap keyed on (remaining time, arrival
+# index) and only reacts at arrival and completion events, so the cost is
+# O(n log n) no matter how long the bursts are.
+def srtf(workload):
+    feed = _ArrivalFeed(workload)
+    pid, arrival, burst = feed.pid, feed.arrival, feed.burst
+    start = feed.column()
+    end = feed.column()
+    timeline = []
+    ready = []
+    current_time = 0
+    next_arrival = 0
+
+    while ready or feed.has(next_arrival):
+        while feed.has(next_arrival) and arrival[next_arrival] <= current_time:
+            heapq.heappush(ready, (burst[next_arrival], next_arrival))
+            next_arrival += 1
+
+        if not ready:
+            timeline.append((IDLE_CODE, current_time, arrival[next_arrival]))
+            current_time = arrival[next_arrival]
+            continue
+
+        remaining, idx = heapq.heappop(ready)
+        if math.isnan(start[idx]):
+            start[idx] = current_time
+
+        # Run until completion or the next arrival, whichever comes first
+        finish = stop = current_time + remaining
+        if feed.has(next_arrival) and arrival[next_arrival] < stop:
+            stop = arrival[next_arrival]
+        if stop > current_time:
+            _append_slice(timeline, pid[idx], current_time, stop, merge=True)
+        # Set exactly 0 on completion: with fractional bursts the subtraction
+        # can leave a residue too small to ever advance the clock
+        remaining = 0 if stop == finish else remaining - (stop - current_time)
+        current_time = stop
+
+        if remaining == 0:
+            end[idx] = current_time
+        else:
+            heapq.heappush(ready, (remaining, idx))
+
+    return feed.finish(start, end, timeline)
+
+
+# Round Robin on a deque with an arrival cursor, so dispatch and admission are
+# O(1). Once per round the queue is checked for a stable stretch: if every
+# queued process needs more than k further quanta and nothing arrives in the
+# next k rounds, those k rounds are emitted in one step instead of being
+# dispatched slice by slice.
+#
+# context_switch adds that much overhead (a SWITCH segment) whenever the CPU
+# moves on to a different process than the one it ran last.
+def round_robin(workload, time_quantum=2, context_switch=0):
+    if time_quantum <= 0:
+        raise ValueError("time_quantum must be positive")
+    if context_switch < 0:
+        raise ValueError("context_switch must not be negative")
+    feed = _ArrivalFeed(workload)
+    # The burst column is only read here, so it doubles as remaining time
+    pid, arrival, remaining = feed.pid, feed.arrival, feed.burst
+    start = feed.column()
+    end = feed.column()
+    timeline = []
+    queue = deque()
+    current_time = 0
+    next_arrival = 0
+    until_check = 0
+    last = None
+
+    while queue or feed.has(next_arrival):
+        while feed.has(next_arrival) and arrival[next_arrival] <= current_time:
+            queue.append(next_arrival)
+            next_arrival += 1
+
+        if not queue:
+            timeline.append((IDLE_CODE, current_time, arrival[next_arrival]))
+            current_time = arrival[next_arrival]
+            continue
+
+        if until_check == 0:
+            current_time = _fast_forward_rounds(
+                feed, queue, remaining, start, timeline, current_time,
+                time_quantum, next_arrival, context_switch, last)
+            until_check = len(queue)
+        until_check -= 1
+
+        idx = queue.popleft()
+        if context_switch and last is not None and idx != last:
+            timeline.append((SWITCH_CODE, current_time, current_time + context_switch))
+            current_time += context_switch
+        last = idx
+        if math.isnan(start[idx]):
+            start[idx] = current_time
+
+        # Execute for time quantum or remaining time
+        left = remaining[idx]
+        exec_time = min(time_quantum, left)
+        timeline.append((pid[idx], current_time, current_time + exec_time))
+        current_time += exec_time
+        left -= exec_time
+        remaining[idx] = left
+
+        # New arrivals queue up ahead of the process that was just preempted
+        while feed.has(next_arrival) and arrival[next_arrival] <= current_time:
+            queue.append(next_arrival)
+            next_arrival += 1
+
+        if left == 0:
+            end[idx] = current_time
+        else:
+            queue.append(idx)
+
+    return feed.finish(start, end, timeline)
+
+
+# Emit k full Round Robin rounds at once when the queue order cannot change
+# during them. Returns the new current time.
+def _fast_forward_rounds(feed, queue, remaining, start, timeline,
+                         current_time, time_quantum, next_arrival,
+                         context_switch=0, last=None):
+    # With several processes queued every slice is a switch; a lone process
+    # only avoids it when it is already the one on the CPU
+    switch = 0
+    if context_switch:
+        if len(queue) > 1 and last is not None:
+            switch = context_switch
+        elif len(queue) > 1 or queue[0] != last:
+            return current_time
+    step = time_quantum + switch
+    round_length = len(queue) * step
+    # Every process must still be unfinished after k rounds...
+    rounds = math.ceil(min(remaining[i] for i in queue) / time_quantum) - 1
+    # ...and no arrival may land before the last of them ends
+    if feed.has(next_arrival):
+        gap = feed.arrival[next_arrival] - current_time
+        rounds = min(rounds, math.ceil(gap / round_length) - 1)
+    if rounds < 1:
+        return current_time
+
+    pid = feed.pid
+    order = list(queue)
+    for pos, idx in enumerate(order):
+        if math.isnan(start[idx]):
+            start[idx] = current_time + pos * step + switch
+        remaining[idx] -= rounds * time_quantum
+    if switch:
+        for r in range(rounds):
+            for pos, idx in enumerate(order):
+                slice_start = current_time + r * round_length + pos * step
+                timeline.append((SWITCH_CODE, slice_start, slice_start + switch))
+                timeline.append((pid[idx], slice_start + switch, slice_start + step))
+    else:
+        timeline.extend(
+            (pid[idx], slice_start, slice_start + time_quantum)
+            for r in range(rounds)
+            for pos, idx in enumerate(order)
+            for slice_start in (current_time + r * round_length + pos * time_quantum,)
+        )
+    return current_time + rounds * round_length
+
+
+# Priority scheduling (lower number = higher priority) on a heap, in both
+# preemptive and non-preemptive modes.
+#
+# With aging > 0 a waiting process gains `aging` priority levels per time unit
+# spent in the ready queue. The boost is folded into the heap key: a process
+# enqueued at time r with accumulated wait w has effective priority
+# priority - aging * (w + t - r) at time t, so ordering by
+# priority - aging * w + aging * r never changes while it waits and no
+# per-tick rescan is needed. Equal effective priorities go to the better base
+# priority, then the earlier arrival. Aging only decides who wins at arrival and
+# completion events; letting a waiting process preempt purely by aging would
+# make two near-equal processes swap the CPU every time unit.
+def priority(workload, preemptive=False, aging=0):
+    if aging < 0:
+        raise ValueError("aging must not be negative")
+    feed = _ArrivalFeed(workload, by_priority=True)
+    # The burst column is only read here, so it doubles as remaining time
+    pid, arrival, remaining, prio = feed.pid, feed.arrival, feed.burst, feed.priority
+    waited = feed.column(0)
+    enqueued = feed.column()
+    start = feed.column()
+    end = feed.column()
+    timeline = []
+    ready = []
+    current_time = 0
+    next_arrival = 0
+
+    while ready or feed.has(next_arrival):
+        while feed.has(next_arrival) and arrival[next_arrival] <= current_time:
+            enqueued[next_arrival] = arrival[next_arrival]
+            heapq.heappush(ready, (prio[next_arrival] + aging * arrival[next_arrival],
+                                   prio[next_arrival], next_arrival))
+            next_arrival += 1
+
+        if not ready:
+            timeline.append((IDLE_CODE, current_time, arrival[next_arrival]))
+            current_time = arrival[next_arrival]
+            continue
+
+        _, _, idx = heapq.heappop(ready)
+        waited[idx] += current_time - enqueued[idx]
+        effective = prio[idx] - aging * waited[idx]
+        if math.isnan(start[idx]):
+            start[idx] = current_time
+
+        finish = stop = current_time + remaining[idx]
+        if preemptive:
+            if feed.has(next_arrival) and arrival[next_arrival] < stop:
+                stop = arrival[next_arrival]
+
+        if stop > current_time:
+            _append_slice(timeline, pid[idx], current_time, stop, merge=preemptive)
+        remaining[idx] = 0 if stop == finish else remaining[idx] - (stop - current_time)
+        current_time = stop
+
+        if remaining[idx] == 0:
+            end[idx] = current_time
+        else:
+            enqueued[idx] = current_time
+            heapq.heappush(ready, (effective + aging * current_time, prio[idx], idx))
+
+    return feed.finish(start, end, timeline)
+
+
+# Multilevel feedback queue. Level 0 is the highest; level l runs round robin
+# with quantum quanta[l]. New arrivals enter level 0, and a process that has
+# used up its level's quantum (across preemptions) drops one level; the last
+# level keeps it. An arrival preempts a process running below level 0, which
+# goes back to the tail of its level with the rest of its quantum. Every
+# boost_interval time units (0 disables it) all queued processes move back to
+# level 0 with a fresh quantum.
+#
+# The non-empty levels are kept as bits of one integer, so the highest one is
+# bitmap & -bitmap: O(1) dispatch whatever the level count. A boost splices
+# the lower deques onto level 0 and bumps an epoch; a process's quantum usage
+# is reset lazily when it is next dispatched in a newer epoch.
+def mlfq(workload, quanta=DEFAULT_MLFQ_QUANTA, boost_interval=DEFAULT_MLFQ_BOOST):
+    quanta = list(quanta)
+    if not quanta or min(quanta) <= 0:
+        raise ValueError("MLFQ needs at least one level and positive quanta")
+    if boost_interval < 0:
+        raise ValueError("boost_interval must not be negative")
+    feed = _ArrivalFeed(workload)
+    # The burst column is only read here, so it doubles as remaining time
+    pid, arrival, remaining = feed.pid, feed.arrival, feed.burst
+    used = feed.column(0)
+    epoch_of = feed.column(0)
+    start = feed.column()
+    end = feed.column()
+    timeline = []
+    queues = [deque() for _ in quanta]
+    bottom = len(quanta) - 1
+    bitmap = 0
+    epoch = 0
+    next_boost = boost_interval or math.inf
+    current_time = 0
+    next_arrival = 0
+
+    while bitmap or feed.has(next_arrival):
+        if current_time >= next_boost:
+            epoch += 1
+            for queue in queues[1:]:
+                queues[0].extend(queue)
+                queue.clear()
+            bitmap = 1 if queues[0] else 0
+            next_boost = (current_time // boost_interval + 1) * boost_interval
+
+        while feed.has(next_arrival) and arrival[next_arrival] <= current_time:
+            queues[0].append(next_arrival)
+            epoch_of[next_arrival] = epoch
+            next_arrival += 1
+            bitmap |= 1
+
+        if not bitmap:
+            timeline.append((IDLE_CODE, current_time, arrival[next_arrival]))
+            current_time = arrival[next_arrival]
+            continue
+
+        level = (bitmap & -bitmap).bit_length() - 1
+        queue = queues[level]
+        idx = queue.popleft()
+        if not queue:
+            bitmap &= ~(1 << level)
+        if epoch_of[idx] != epoch:
+            used[idx] = 0  # Boosted since it last ran
+            epoch_of[idx] = epoch
+        if math.isnan(start[idx]):
+            start[idx] = current_time
+
+        # Run to the end of the quantum or the burst, cut short by an arrival
+        # (below level 0) or a boost
+        completes = remaining[idx] <= quanta[level] - used[idx]
+        finish = stop = current_time + min(quanta[level] - used[idx], remaining[idx])
+        if level and feed.has(next_arrival) and arrival[next_arrival] < stop:
+            stop = arrival[next_arrival]
+        if next_boost < stop:
+            stop = next_boost
+        if stop > current_time:
+            _append_slice(timeline, pid[idx], current_time, stop, merge=True)
+        ran = stop - current_time
+        current_time = stop
+        # Set exactly 0 on completion (see srtf)
+        remaining[idx] = 0 if stop == finish and completes else remaining[idx] - ran
+        if remaining[idx] == 0:
+            end[idx] = current_time
+            continue
+
+        used[idx] += ran
+        if used[idx] >= quanta[level]:
+            level = min(level + 1, bottom)
+            used[idx] = 0
+        # New arrivals queue up ahead of the process that was just preempted
+        while feed.has(next_arrival) and arrival[next_arrival] <= current_time:
+            queues[0].append(next_arrival)
+            epoch_of[next_arrival] = epoch
+            next_arrival += 1
+            bitmap |= 1
+        queues[level].append(idx)
+        bitmap |= 1 << level
+
+    return feed.finish(start, end, timeline)
+
+
+# Completely-Fair-Scheduler-style scheduling. Each process has a weight from
+# its priority (see cfs_weights) and a virtual runtime that advances by
+# ran * NICE_0_WEIGHT / weight, so heavier processes age more slowly. The
+# runnable processes sit in a binary heap ordered by (vruntime, arrival index)
+# (a complete, hence balanced, tree) and the leftmost one runs next, for
+# O(log n) insert and pick. Its slice is its weight's share of the scheduling
+# period, target_latency or min_granularity per runnable process when there
+# are more than target_latency / min_granularity of them, and never less than
+# min_granularity. A new process starts one virtual slice after min_vruntime
+# (the smallest vruntime seen on the CPU so far), as the kernel's START_DEBIT
+# does, so it joins the end of the current period instead of jumping ahead of
+# every waiting process; arrivals wait for the current slice to end. The
+# virtual slice, period * NICE_0_WEIGHT / total weight, is the same for every
+# weight, and everything that arrived during one slice is placed with the
+# same one, so co-arrivals keep their arrival order. A lone process runs
+# whole slices until one ends at or after the next arrival.
+def cfs(workload, target_latency=DEFAULT_CFS_TARGET_LATENCY, min_granularity=DEFAULT_CFS_MIN_GRANULARITY):
+    if target_latency <= 0 or min_granularity <= 0:
+        raise ValueError("target_latency and min_granularity must be positive")
+    feed = _ArrivalFeed(workload)
+    # The burst column is only read here, so it doubles as remaining time
+    pid, arrival, remaining, prio = feed.pid, feed.arrival, feed.burst, feed.priority
+    weight = feed.column()
+    vruntime = feed.column(0.0)
+    start = feed.column()
+    end = feed.column()
+    timeline = []
+    tree = []
+    runnable = 0
+    total_weight = 0
+    min_vruntime = 0.0
+    current_time = 0
+    next_arrival = 0
+
+    while tree or feed.has(next_arrival):
+        admitted = next_arrival
+        while feed.has(next_arrival) and arrival[next_arrival] <= current_time:
+            idx = next_arrival
+            # Same as cfs_weights, without the NumPy call per process
+            weight[idx] = max(1, round(NICE_0_WEIGHT * CFS_WEIGHT_RATIO ** -prio[idx])) if prio else NICE_0_WEIGHT
+            runnable += 1
+            total_weight += weight[idx]
+            next_arrival += 1
+        if next_arrival > admitted:
+            period = max(target_latency, runnable * min_granularity)
+            placed = min_vruntime + period * NICE_0_WEIGHT / total_weight
+            for idx in range(admitted, next_arrival):
+                vruntime[idx] = placed
+                heapq.heappush(tree, (placed, idx))
+
+        if not tree:
+            timeline.append((IDLE_CODE, current_time, arrival[next_arrival]))
+            current_time = arrival[next_arrival]
+            continue
+
+        v, idx = heapq.heappop(tree)
+        min_vruntime = max(min_vruntime, v)
+        if math.isnan(start[idx]):
+            start[idx] = current_time
+
+        period = max(target_latency, runnable * min_granularity)
+        length = max(period * weight[idx] / total_weight, min_granularity)
+        slices = 1
+        if not tree:
+            # Alone: every slice is the same length, so run whole slices up to
+            # the first boundary at or after the next arrival (or completion)
+            until = arrival[next_arrival] if feed.has(next_arrival) else current_time + remaining[idx]
+            slices = max(1, math.ceil(min(until - current_time, remaining[idx]) / length))
+        completes = remaining[idx] <= slices * length + CFS_RESIDUE
+        ran = remaining[idx] if completes else slices * length
+        # The last of the skipped slices started at this vruntime
+        min_vruntime = max(min_vruntime, v + (slices - 1) * length * NICE_0_WEIGHT / weight[idx])
+        if ran > 0:
+            _append_slice(timeline, pid[idx], current_time, current_time + ran, merge=True)
+        current_time += ran
+        vruntime[idx] = v + ran * NICE_0_WEIGHT / weight[idx]
+
+        if completes:
+            remaining[idx] = 0
+            end[idx] = current_time
+            runnable -= 1
+            total_weight -= weight[idx]
+        else:
+            remaining[idx] -= ran
+            heapq.heappush(tree, (vruntime[idx], idx))
+
+    return feed.finish(start, end, timeline)
+
+
+# CFS load weights: NICE_0_WEIGHT at priority 0, and each priority level
+# (lower number = higher priority, like nice values) weighs 1.25 times less
+# than the one before, as in the kernel's weight table. Weights are whole
+# numbers (at least 1) like the kernel's, so the engine's running total of
+# runnable weight stays exact. Works on arrays.
+def cfs_weights(priority):
+    return np.maximum(np.rint(NICE_0_WEIGHT * CFS_WEIGHT_RATIO ** -np.asarray(priority, dtype=float)), 1)
+
+
+ALGORITHMS = {
+    "FCFS": fcfs,
+    "SJF": sjf,
+    "SRTF": srtf,
+    "Round Robin": round_robin,
+    "Priority": priority,
+    "MLFQ": mlfq,
+    "CFS": cfs,
+}
+
+
+# Single entry point: simulate("Round Robin", workload, time_quantum=2)
+# returns a Schedule. cores > 1 runs the multi-core engine in smp.py, which
+# also takes balancer, migration_cost and balance_interval, and only runs the
+# algorithms in smp.ALGORITHMS.
+def simulate(algorithm, workload, cores=1, **params):
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    if cores != 1:
+        import smp
+
+        if algorithm not in smp.ALGORITHMS:
+            raise ValueError(f"{algorithm} is not supported on multiple cores")
+        return smp.simulate_smp(algorithm, workload, cores, **params)
+    return ALGORITHMS[algorithm](workload, **params)
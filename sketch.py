@@ -0,0 +1,81 @@
+# Mergeable quantile sketch for streaming latency percentiles.
+#
+# Values are counted in logarithmic buckets (the DDSketch scheme): bucket k
+# holds values in (gamma^(k-1), gamma^k] with gamma = (1 + a) / (1 - a), and a
+# quantile is answered with the bucket's midpoint 2 gamma^k / (gamma + 1),
+# which is within relative accuracy `a` of the true value. Memory grows with
+# the logarithm of the value range, not the number of values, and two
+# sketches with the same accuracy merge by adding bucket counts, so chunks of
+# a trace or results from pool workers can be summarized separately and
+# combined. Values at or below MIN_POSITIVE (zero waiting time) share one
+# bucket; count, sum, min and max are kept exactly.
+
+import math
+
+import numpy as np
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+MIN_POSITIVE = 1e-9
+
+
+class QuantileSketch:
+    def __init__(self, relative_accuracy=DEFAULT_RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = {}  # Bucket index -> count
+        self.zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    # Add an array (or any iterable) of values in one vectorized step
+    def add(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return
+        self.count += values.size
+        self.total += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        positive = values[values > MIN_POSITIVE]
+        self.zeros += values.size - positive.size
+        keys, counts = np.unique(np.ceil(np.log(positive) / self._log_gamma).astype(np.int64),
+                                 return_counts=True)
+        buckets = self.buckets
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            buckets[key] = buckets.get(key, 0) + count
+
+    def merge(self, other):
+        if other.gamma != self.gamma:
+            raise ValueError("Only sketches with the same relative accuracy can be merged")
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else math.nan
+
+    # Value at quantile q in [0, 1], NaN when the sketch is empty
+    def quantile(self, q):
+        if not self.count:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return min(max(0.0, self.min), self.max)
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                value = 2 * self.gamma ** key / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
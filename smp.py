@@ -0,0 +1,310 @@
+# Multi-core (SMP) simulation of the scheduling algorithms.
+#
+# N cores share one event loop driven by a heap of slice-end events plus the
+# arrival cursor, so the cost is O(events log n) whatever the core count; a
+# core is only looked at when one of its events fires. Ready processes wait
+# in run queues ordered like the single-CPU algorithms (arrival order for
+# FCFS and Round Robin, burst for SJF, remaining time for SRTF, priority for
+# Priority), so on one core the results match scheduler.py.
+#
+# Balancers:
+#   global         one run queue shared by every core
+#   per_core       a run queue per core; arrivals go to an idle core or the
+#                  shortest queue, and every balance_interval time units work
+#                  is moved from the longest queues to the shortest
+#   work_stealing  a run queue per core; a core whose queue is empty takes
+#                  work from the longest queue when it goes idle
+# Moved work is taken from the far end of a queue (a heap leaf), so the
+# victim keeps its most urgent processes.
+#
+# A process resuming on a different core than it last ran on pays
+# migration_cost first, and a core that switches to a different process pays
+# context_switch; both show up as SWITCH segments on that core's lane. Every
+# core's lane is padded with IDLE segments up to the makespan, so per-core
+# utilization is busy time over makespan.
+
+import heapq
+import math
+from collections import deque
+
+import numpy as np
+
+from scheduler import _ArrivalFeed
+from tables import IDLE_CODE, SWITCH_CODE, Schedule
+
+BALANCERS = ("global", "per_core", "work_stealing")
+
+# Algorithms the multi-core engine runs; scheduler.simulate rejects the rest
+# before their own parameters reach simulate_smp
+ALGORITHMS = ("FCFS", "SJF", "SRTF", "Round Robin", "Priority")
+
+DEFAULT_BALANCE_INTERVAL = 10
+
+
+def simulate_smp(algorithm, workload, cores=2, balancer="work_stealing", migration_cost=0,
+                 balance_interval=DEFAULT_BALANCE_INTERVAL, time_quantum=2, preemptive=False,
+                 context_switch=0, aging=0):
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"{algorithm} is not supported on multiple cores")
+    if balancer not in BALANCERS:
+        raise ValueError(f"Unknown balancer: {balancer}")
+    if cores < 1:
+        raise ValueError("cores must be positive")
+    if migration_cost < 0 or context_switch < 0:
+        raise ValueError("migration_cost and context_switch must not be negative")
+    if balancer == "per_core" and balance_interval <= 0:
+        raise ValueError("balance_interval must be positive")
+    if algorithm == "Round Robin" and time_quantum <= 0:
+        raise ValueError("time_quantum must be positive")
+    if aging:
+        raise ValueError("aging is only supported on a single core")
+
+    feed = _ArrivalFeed(workload, by_priority=algorithm == "Priority")
+    pid, arrival, prio = feed.pid, feed.arrival, feed.priority
+    remaining = feed.burst  # Only read here, so it doubles as remaining time
+    start = feed.column()
+    end = feed.column()
+    last_core = feed.column(-1)
+    quantum = time_quantum if algorithm == "Round Robin" else None
+    preempts = algorithm == "SRTF" or (algorithm == "Priority" and preemptive)
+    shared = balancer == "global"
+    fifo = algorithm in ("FCFS", "Round Robin")
+
+    queues = [deque() if fifo else [] for _ in range(1 if shared else cores)]
+    running = [-1] * cores
+    run_start = [0] * cores
+    slice_end = [0] * cores
+    version = [0] * cores
+    last_run = [-1] * cores
+    switch_seg = [-1] * cores
+    last_seg = [-1] * cores
+    first_run = [False] * cores  # Whether the running process had never run before
+    idle = list(range(cores))  # Heap of idle cores, lowest first
+    events = []
+    timeline = []
+    state = {"queued": 0}
+
+    def key(idx):
+        if algorithm in ("SJF", "SRTF"):
+            return remaining[idx]  # SJF never requeues, so this is the burst
+        if algorithm == "Priority":
+            return prio[idx]
+        return 0
+
+    # FCFS and Round Robin queue on a deque in enqueue order; the keyed
+    # algorithms use a heap of (key, arrival index), so a preempted process
+    # keeps its place among equal keys
+    def enqueue(queue, idx):
+        state["queued"] += 1
+        if fifo:
+            queue.append(idx)
+        else:
+            heapq.heappush(queue, (key(idx), idx))
+
+    def dequeue(queue, tail=False):
+        state["queued"] -= 1
+        if fifo:
+            return queue.pop() if tail else queue.popleft()
+        if tail:
+            return queue.pop()[1]  # A leaf, so the heap stays valid
+        return heapq.heappop(queue)[1]
+
+    def dispatch(core, now):
+        queue = queues[0 if shared else core]
+        if queue:
+            idx = dequeue(queue)
+        elif balancer == "work_stealing" and state["queued"]:
+            victim = max(queues, key=len)
+            idx = dequeue(victim, tail=True)
+        else:
+            heapq.heappush(idle, core)
+            return
+        overhead = 0
+        if context_switch and last_run[core] not in (-1, idx):
+            overhead += context_switch
+        if migration_cost and last_core[idx] not in (-1, core):
+            overhead += migration_cost
+        switch_seg[core] = -1
+        if overhead:
+            switch_seg[core] = len(timeline)
+            timeline.append((SWITCH_CODE, now, now + overhead, core))
+            last_seg[core] = -1
+        begin = now + overhead
+        first_run[core] = math.isnan(start[idx])
+        if first_run[core]:
+            start[idx] = begin
+        length = remaining[idx] if quantum is None else min(quantum, remaining[idx])
+        running[core] = idx
+        run_start[core] = begin
+        slice_end[core] = begin + length
+        last_core[idx] = core
+        last_run[core] = idx
+        version[core] += 1
+        heapq.heappush(events, (begin + length, core, version[core]))
+
+    # Take the running process off a core; returns it and whether it finished
+    def stop(core, now):
+        idx = running[core]
+        running[core] = -1
+        version[core] += 1
+        if now < run_start[core]:
+            # Preempted during the switch overhead: cut the SWITCH segment
+            # short, and the process has not started after all
+            seg = switch_seg[core]
+            timeline[seg] = (SWITCH_CODE, timeline[seg][1], now, core)
+            if first_run[core]:
+                start[idx] = math.nan
+            return idx, False
+        if now > run_start[core]:
+            seg = last_seg[core]
+            if seg >= 0 and timeline[seg][0] == pid[idx] and timeline[seg][2] == run_start[core]:
+                timeline[seg] = (pid[idx], timeline[seg][1], now, core)
+            else:
+                last_seg[core] = len(timeline)
+                timeline.append((pid[idx], run_start[core], now, core))
+        # Set exactly 0 on completion (see scheduler.srtf)
+        if now == slice_end[core] and (quantum is None or remaining[idx] <= quantum):
+            remaining[idx] = 0
+            return idx, True
+        if now == run_start[core] and first_run[core]:
+            start[idx] = math.nan  # Preempted just as it would have started
+        remaining[idx] -= now - run_start[core]
+        return idx, False
+
+    def running_key(core, now):
+        idx = running[core]
+        if algorithm == "SRTF":
+            return remaining[idx] - max(now - run_start[core], 0)
+        return prio[idx]
+
+    def preempt(core, now):
+        idx, _ = stop(core, now)
+        enqueue(queues[0 if shared else core], idx)
+
+    def balance():
+        while True:
+            longest = max(queues, key=len)
+            shortest = min(queues, key=len)
+            if len(longest) - len(shortest) < 2:
+                return
+            enqueue(shortest, dequeue(longest, tail=True))
+
+    next_arrival = 0
+    next_balance = balance_interval
+    while True:
+        while events and events[0][2] != version[events[0][1]]:
+            heapq.heappop(events)  # Stale: the core was preempted
+        now = None
+        if events:
+            now = events[0][0]
+        if feed.has(next_arrival) and (now is None or arrival[next_arrival] < now):
+            now = arrival[next_arrival]
+        if now is None:
+            break
+        if balancer == "per_core" and state["queued"] and next_balance < now:
+            now = next_balance
+
+        # Slice ends: completions, and Round Robin quantum expiries
+        freed = []
+        expired = []
+        while events and events[0][0] == now:
+            _, core, ver = heapq.heappop(events)
+            if ver != version[core]:
+                continue
+            idx, finished = stop(core, now)
+            if finished:
+                end[idx] = now
+            else:
+                expired.append((core, idx))
+            freed.append(core)
+
+        # Arrivals at this instant; per-core balancers place each one on a
+        # free core when there is one, else on the shortest queue
+        spare = [core for core in freed if shared or not queues[core]]
+        touched = set()
+        while feed.has(next_arrival) and arrival[next_arrival] <= now:
+            idx = next_arrival
+            next_arrival += 1
+            if shared:
+                enqueue(queues[0], idx)
+                continue
+            if spare:
+                core = spare.pop()
+            elif idle:
+                core = heapq.heappop(idle)
+                freed.append(core)
+            else:
+                lengths = list(map(len, queues))
+                core = lengths.index(min(lengths))
+                touched.add(core)
+            enqueue(queues[core], idx)
+
+        # As on one CPU, new arrivals queue up ahead of a preempted process
+        for core, idx in expired:
+            enqueue(queues[0 if shared else core], idx)
+
+        if balancer == "per_core" and now >= next_balance:
+            balance()
+            next_balance = now + balance_interval
+            while idle:
+                freed.append(heapq.heappop(idle))
+
+        # Idle cores take work before anything is preempted
+        for core in sorted(freed):
+            dispatch(core, now)
+        while idle and (queues[0] if shared else balancer == "work_stealing" and state["queued"]):
+            dispatch(heapq.heappop(idle), now)
+
+        if preempts:
+            if shared:
+                queue = queues[0]
+                while queue:
+                    busy = [c for c in range(cores) if running[c] >= 0]
+                    if not busy:
+                        break
+                    worst = max(busy, key=lambda c: (running_key(c, now), c))
+                    if queue[0][0] >= running_key(worst, now):
+                        break
+                    preempt(worst, now)
+                    dispatch(worst, now)
+            else:
+                for core in sorted(touched):
+                    queue = queues[core]
+                    if running[core] >= 0 and queue and queue[0][0] < running_key(core, now):
+                        preempt(core, now)
+                        dispatch(core, now)
+
+    schedule = feed.finish(start, end, timeline)
+    return _pad_idle(schedule, cores)
+
+
+# Sort segments by core then start, and fill every gap in a core's lane
+# (including the stretch up to the makespan) with an IDLE segment
+def _pad_idle(schedule, cores):
+    seg_core = schedule.seg_core
+    if seg_core is None:
+        seg_core = np.empty(0, dtype=np.int32)
+    seg_pid, seg_start, seg_end = schedule.seg_pid, schedule.seg_start, schedule.seg_end
+    makespan = seg_end.max() if seg_end.size else 0
+    order = np.lexsort((seg_start, seg_core))
+    seg_core, seg_pid, seg_start, seg_end = seg_core[order], seg_pid[order], seg_start[order], seg_end[order]
+
+    # Lane boundaries: each core's segments as [first, last)
+    bounds = np.searchsorted(seg_core, np.arange(cores + 1))
+    gap_core, gap_start, gap_end = [], [], []
+    for core in range(cores):
+        first, last = bounds[core], bounds[core + 1]
+        starts = np.concatenate(([0], seg_end[first:last]))
+        ends = np.concatenate((seg_start[first:last], [makespan]))
+        gaps = ends > starts
+        gap_start.append(starts[gaps])
+        gap_end.append(ends[gaps])
+        gap_core.append(np.full(np.count_nonzero(gaps), core, dtype=np.int32))
+
+    seg_core = np.concatenate([seg_core] + gap_core)
+    seg_start = np.concatenate([seg_start] + gap_start)
+    seg_end = np.concatenate([seg_end] + gap_end)
+    seg_pid = np.concatenate([seg_pid, np.full(seg_core.size - seg_pid.size, IDLE_CODE, dtype=np.int32)])
+    order = np.lexsort((seg_start, seg_core))
+    return Schedule(schedule.workload, schedule.start, schedule.completion,
+                    seg_pid[order], seg_start[order], seg_end[order], seg_core[order])
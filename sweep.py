@@ -0,0 +1,80 @@
+# Round Robin time-quantum sweep.
+#
+# Simulates one workload for every (quantum, context-switch cost) pair and
+# reports the metrics per pair, so a quantum can be picked from a curve rather
+# than by trying values one at a time. Large sweeps run in a process pool; the
+# workload is sent to each worker once (pool initializer) instead of with
+# every task.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from metrics import context_switches, schedule_metrics
+from scheduler import round_robin
+from tables import Workload, concat_workloads
+
+# Below this many process-simulations the pool start-up costs more than it
+# saves; montecarlo.py uses the same cut-off
+PARALLEL_MIN_WORK = 200_000
+
+_worker_workload = None
+
+
+def _init_worker(workload):
+    global _worker_workload
+    _worker_workload = workload
+
+
+def _run_point(point):
+    quantum, switch_cost = point
+    schedule = round_robin(_worker_workload, quantum, switch_cost)
+    return {
+        "quantum": quantum,
+        "context_switch": switch_cost,
+        **schedule_metrics(schedule),
+        "context_switches": context_switches(schedule),
+    }
+
+
+# Best row per switch cost: lowest average waiting time, then fewer context
+# switches, then the larger quantum
+def recommend(results):
+    best = {}
+    for row in results:
+        key = (row["avg_waiting"], row["context_switches"], -row["quantum"])
+        current = best.get(row["context_switch"])
+        if current is None or key < current[0]:
+            best[row["context_switch"]] = (key, row)
+    return {cost: row for cost, (_, row) in best.items()}
+
+
+# One result row per (quantum, switch cost), each marked "recommended" when it
+# is the best quantum for its cost. workers=None uses every core.
+def quantum_sweep(workload, quanta, switch_costs=(0,), workers=None):
+    # Workers need one picklable table, so chunked traces are read in full here
+    if isinstance(workload, (list, tuple)) and not (workload and isinstance(workload[0], Workload)):
+        workload = Workload.from_rows(workload)
+    elif not isinstance(workload, Workload):
+        workload = concat_workloads(workload)
+    points = [(quantum, cost) for cost in switch_costs for quantum in quanta]
+    if not points:
+        return []
+    for quantum, cost in points:
+        if quantum <= 0:
+            raise ValueError("time_quantum must be positive")
+        if cost < 0:
+            raise ValueError("context_switch must not be negative")
+
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(points))
+    if workers == 1 or len(workload) * len(points) < PARALLEL_MIN_WORK:
+        _init_worker(workload)
+        results = [_run_point(point) for point in points]
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(workload,)) as pool:
+            results = list(pool.map(_run_point, points))
+
+    best = recommend(results)
+    for row in results:
+        row["recommended"] = best[row["context_switch"]] is row
+    return results
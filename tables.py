@@ -0,0 +1,289 @@
+# Columnar process and schedule tables.
+#
+# A Workload stores one typed NumPy array per field instead of a Python list
+# per process, and process ids are interned: `pid` holds small integer codes
+# into the `names` lookup table. A Schedule holds the per-process start and
+# completion arrays plus the timeline as three parallel arrays (pid code,
+# start, end) where code IDLE_CODE marks idle gaps and SWITCH_CODE marks
+# context-switch overhead. Both convert to the row/tuple shapes the pages
+# render only at display time.
+
+import numpy as np
+
+IDLE = "IDLE"
+IDLE_CODE = -1
+SWITCH = "SWITCH"
+SWITCH_CODE = -2
+
+RESULT_COLUMNS = ["Process ID", "Arrival Time", "Burst Time", "Priority",
+                  "Start Time", "Completion Time", "Turnaround Time", "Waiting Time"]
+
+
+# Read-only pid names stored as one UTF-8 blob plus an offsets array, so a
+# memory-mapped trace (tracefile.py) needs no Python string per process until
+# a name is actually looked up
+class NameTable:
+    __slots__ = ("blob", "offsets")
+
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, code):
+        if code < 0:
+            code += len(self)
+        return bytes(self.blob[self.offsets[code]:self.offsets[code + 1]]).decode("utf-8")
+
+    def __iter__(self):
+        blob = bytes(self.blob)
+        offsets = self.offsets.tolist()
+        for start, end in zip(offsets, offsets[1:]):
+            yield blob[start:end].decode("utf-8")
+
+
+class Workload:
+    __slots__ = ("names", "pid", "arrival", "burst", "priority")
+
+    def __init__(self, names, pid, arrival, burst, priority=None):
+        # Chunks streamed from one trace share a single names table
+        self.names = names if isinstance(names, (list, NameTable)) else list(names)
+        self.pid = np.asarray(pid, dtype=np.int32)
+        self.arrival = np.asarray(arrival)
+        self.burst = np.asarray(burst)
+        self.priority = None if priority is None else np.asarray(priority)
+
+    # Build from [pid, arrival, burst] / [pid, arrival, burst, priority] rows
+    @classmethod
+    def from_rows(cls, rows):
+        rows = list(rows)
+        codes = {}
+        pid = np.fromiter((codes.setdefault(row[0], len(codes)) for row in rows),
+                          dtype=np.int32, count=len(rows))
+        arrival = np.array([row[1] for row in rows])
+        burst = np.array([row[2] for row in rows])
+        priority = None
+        if rows and all(len(row) > 3 for row in rows):
+            priority = np.array([row[3] for row in rows])
+        return cls(codes, pid, arrival, burst, priority)
+
+    # Build from column arrays; pid names are interned in order of first
+    # appearance, as from_rows does
+    @classmethod
+    def from_columns(cls, pids, arrival, burst, priority=None):
+        pids = np.asarray(pids)
+        if pids.size == 0:
+            return cls([], [], np.asarray(arrival), np.asarray(burst), priority)
+        names, first, inverse = np.unique(pids, return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        rank = np.empty(order.size, dtype=np.int32)
+        rank[order] = np.arange(order.size, dtype=np.int32)
+        return cls(names[order].tolist(), rank[inverse], arrival, burst, priority)
+
+    # Accept either a Workload or a list of rows
+    @classmethod
+    def coerce(cls, workload):
+        if isinstance(workload, cls):
+            return workload
+        return cls.from_rows(workload)
+
+    def __len__(self):
+        return self.pid.size
+
+    def pid_names(self):
+        return np.asarray(list(self.names), dtype=object)[self.pid]
+
+    def rows(self):
+        columns = [self.pid_names().tolist(), self.arrival.tolist(), self.burst.tolist()]
+        if self.priority is not None:
+            columns.append(self.priority.tolist())
+        return [list(row) for row in zip(*columns)]
+
+
+# Stack workloads (e.g. streamed chunks) into one, remapping pid codes when
+# the parts do not share a names table
+def concat_workloads(parts):
+    parts = list(parts)
+    if not parts:
+        return Workload([], [], [], [])
+    names = parts[0].names
+    if all(part.names is names for part in parts):
+        pid = np.concatenate([part.pid for part in parts])
+    else:
+        codes = {}
+        pid = np.concatenate([
+            np.array([codes.setdefault(name, len(codes)) for name in part.names], dtype=np.int32)[part.pid]
+            for part in parts
+        ])
+        names = list(codes)
+    priority = None
+    if all(part.priority is not None for part in parts):
+        priority = np.concatenate([part.priority for part in parts])
+    return Workload(
+        names,
+        pid,
+        np.concatenate([part.arrival for part in parts]),
+        np.concatenate([part.burst for part in parts]),
+        priority,
+    )
+
+
+# seg_core is None for a single CPU; multi-core runs (smp.py) record the core
+# of every segment there, and their segments may overlap in time.
+class Schedule:
+    __slots__ = ("workload", "start", "completion", "seg_pid", "seg_start", "seg_end", "seg_core", "_index")
+
+    def __init__(self, workload, start, completion, seg_pid, seg_start, seg_end, seg_core=None):
+        self.workload = workload
+        self.start = np.asarray(start)
+        self.completion = np.asarray(completion)
+        self.seg_pid = np.asarray(seg_pid, dtype=np.int32)
+        self.seg_start = np.asarray(seg_start)
+        self.seg_end = np.asarray(seg_end)
+        self.seg_core = None if seg_core is None else np.asarray(seg_core, dtype=np.int32)
+        self._index = None
+
+    # Build from per-process lists and a list of (code, start, end) segments,
+    # or (code, start, end, core) for multi-core runs
+    @classmethod
+    def from_segments(cls, workload, start, completion, segments):
+        count = len(segments)
+        seg_pid = np.fromiter((s[0] for s in segments), dtype=np.int32, count=count)
+        seg_start = np.array([s[1] for s in segments])
+        seg_end = np.array([s[2] for s in segments])
+        seg_core = None
+        if count and len(segments[0]) > 3:
+            seg_core = np.fromiter((s[3] for s in segments), dtype=np.int32, count=count)
+        return cls(workload, start, completion, seg_pid, seg_start, seg_end, seg_core)
+
+    @property
+    def cores(self):
+        return 1 if self.seg_core is None or self.seg_core.size == 0 else int(self.seg_core.max()) + 1
+
+    def __len__(self):
+        return len(self.workload)
+
+    @property
+    def turnaround(self):
+        return self.completion - self.workload.arrival
+
+    @property
+    def waiting(self):
+        return self.turnaround - self.workload.burst
+
+    @property
+    def makespan(self):
+        if not self.seg_end.size:
+            return 0
+        return self.seg_end[-1] if self.seg_core is None else self.seg_end.max()
+
+    # Time index over the segments (see Timeline), built on first use. Results
+    # pickled before the index existed have no _index slot set.
+    def time_index(self):
+        if getattr(self, "_index", None) is None:
+            self._index = Timeline(self.seg_pid, self.seg_start, self.seg_end, self.seg_core)
+        return self._index
+
+    # Timeline as (pid, start, end) tuples for the Gantt chart helpers
+    def timeline(self):
+        # Negative codes index from the end: -2 is SWITCH, -1 is IDLE
+        names = np.asarray(list(self.workload.names) + [SWITCH, IDLE], dtype=object)
+        return list(zip(names[self.seg_pid].tolist(), self.seg_start.tolist(), self.seg_end.tolist()))
+
+    # Results table in the column layout the pages show
+    def to_dataframe(self):
+        import pandas as pd
+
+        workload = self.workload
+        columns = {
+            "Process ID": workload.pid_names(),
+            "Arrival Time": workload.arrival,
+            "Burst Time": workload.burst,
+            "Priority": workload.priority,
+            "Start Time": self.start,
+            "Completion Time": self.completion,
+            "Turnaround Time": self.turnaround,
+            "Waiting Time": self.waiting,
+        }
+        return pd.DataFrame({name: columns[name] for name in RESULT_COLUMNS
+                             if columns[name] is not None})
+
+
+# Timeline with time-indexed queries: pid codes plus start/end arrays with
+# adjacent runs of the same process merged, one lane per core (sorted by
+# core, then start). Per-lane prefix sums of busy time and a grouping of the
+# segments by process answer these in O(log n):
+#   running_at(t)       process code running at t: SWITCH_CODE during switch
+#                       overhead, IDLE_CODE if nothing runs
+#   busy_time(a, b)     time spent running processes in [a, b]
+#   utilization(a, b)   busy_time as a share of the window
+#   slices(code)        start/end/core of every run of one process
+class Timeline:
+    __slots__ = ("pid", "start", "end", "core", "lanes", "_bounds", "_busy", "_by_pid", "_sorted_pid")
+
+    def __init__(self, seg_pid, seg_start, seg_end, seg_core=None):
+        pid = np.asarray(seg_pid, dtype=np.int32)
+        start = np.asarray(seg_start)
+        end = np.asarray(seg_end)
+        core = np.zeros(pid.size, dtype=np.int32) if seg_core is None else np.asarray(seg_core, dtype=np.int32)
+
+        # Merge runs: a segment continuing the previous one on the same lane
+        joined = np.zeros(pid.size, dtype=bool)
+        joined[1:] = (pid[1:] == pid[:-1]) & (core[1:] == core[:-1]) & (start[1:] == end[:-1])
+        first = np.flatnonzero(~joined)
+        last = np.append(first[1:], pid.size) - 1
+        self.pid, self.start, self.end, self.core = pid[first], start[first], end[last], core[first]
+
+        self.lanes = int(self.core.max()) + 1 if self.core.size else 1
+        self._bounds = np.searchsorted(self.core, np.arange(self.lanes + 1))
+        busy = np.where(self.pid >= 0, self.end - self.start, 0)
+        self._busy = np.concatenate(([0], np.cumsum(busy)))
+        self._by_pid = np.argsort(self.pid, kind="stable")
+        self._sorted_pid = None
+
+    def __len__(self):
+        return self.pid.size
+
+    # Index of the segment covering t on a lane, or -1
+    def segment_at(self, t, core=0):
+        first, last = self._bounds[core], self._bounds[core + 1]
+        i = first + int(np.searchsorted(self.start[first:last], t, side="right")) - 1
+        if i < first or t >= self.end[i]:
+            return -1
+        return i
+
+    def running_at(self, t, core=0):
+        i = self.segment_at(t, core)
+        return IDLE_CODE if i < 0 else int(self.pid[i])
+
+    # Busy time on one lane (or all lanes when core is None) from the lane's
+    # start up to t
+    def _busy_until(self, t, core):
+        first, last = self._bounds[core], self._bounds[core + 1]
+        i = first + int(np.searchsorted(self.start[first:last], t, side="right"))
+        busy = self._busy[i] - self._busy[first]
+        if i > first and self.pid[i - 1] >= 0 and t < self.end[i - 1]:
+            busy -= self.end[i - 1] - t  # The segment covering t only counts up to t
+        return busy
+
+    def busy_time(self, a, b, core=None):
+        lanes = range(self.lanes) if core is None else [core]
+        return sum(self._busy_until(b, lane) - self._busy_until(a, lane) for lane in lanes)
+
+    # Share of [a, b] spent running processes, averaged over the lanes asked for
+    def utilization(self, a, b, core=None):
+        if b <= a:
+            return 0.0
+        lanes = self.lanes if core is None else 1
+        return float(self.busy_time(a, b, core)) / ((b - a) * lanes)
+
+    # Every run of one process as (start, end, core) arrays in lane order
+    def slices(self, code):
+        if self._sorted_pid is None:
+            self._sorted_pid = self.pid[self._by_pid]
+        first, last = np.searchsorted(self._sorted_pid, [code, code + 1])
+        rows = self._by_pid[first:last]
+        return self.start[rows], self.end[rows], self.core[rows]
+
@@ -0,0 +1,38 @@
+import os
+
+import numpy as np
+
+from cache import DiskLRU, MemoryLRU, ResultCache, value_size
+from scheduler import simulate
+from tables import Workload
+
+
+def test_value_size_counts_buffers():
+    assert value_size(np.zeros(1000)) == 8000
+    assert value_size(b"x" * 500) == 500
+    schedule = simulate("FCFS", Workload.from_rows([[f"P{i}", i, 2] for i in range(1000)]))
+    assert value_size(schedule) > schedule.start.nbytes + schedule.completion.nbytes
+
+
+def test_memory_tier_is_bounded_by_bytes():
+    memory = MemoryLRU(max_bytes=10_000)
+    for key in range(5):
+        memory.put(key, np.zeros(500))  # 4,000 bytes each
+    assert list(memory.entries) == [3, 4]
+    assert memory.total_bytes <= 10_000
+    memory.get(3)
+    memory.put(5, np.zeros(500))
+    assert list(memory.entries) == [3, 5]
+    # Too large for the whole budget: not kept, and nothing else evicted
+    memory.put(6, np.zeros(2000))
+    assert list(memory.entries) == [3, 5]
+
+
+def test_disk_file_names_are_digests(tmp_path):
+    cache = ResultCache(directory=str(tmp_path))
+    key = "abc:gantt:Round Robin (Quantum=2):#2563eb"
+    assert cache.get_or_compute(key, lambda: b"png") == b"png"
+    names = os.listdir(tmp_path)
+    assert len(names) == 1 and names[0].endswith(".pkl")
+    assert all(c in "0123456789abcdef" for c in names[0][:-4])
+    assert DiskLRU(str(tmp_path)).get(key) == b"png"
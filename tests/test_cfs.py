@@ -0,0 +1,107 @@
+import random
+
+import numpy as np
+import pytest
+
+from scheduler import CFS_RESIDUE, NICE_0_WEIGHT, cfs_weights, simulate
+from tables import Workload
+
+
+# Straightforward CFS: a linear scan for the smallest (vruntime, arrival
+# index) every slice, weights summed afresh, one slice at a time (no lone
+# fast-forward). Also returns whether any pick was a near-tie, where float
+# rounding in either implementation can legitimately pick the other process.
+def reference(rows, target_latency, min_granularity):
+    order = sorted(range(len(rows)), key=lambda i: rows[i][1])
+    arrival = [rows[i][1] for i in order]
+    remaining = [float(rows[i][2]) for i in order]
+    weight = [float(cfs_weights(rows[i][3])) if len(rows[i]) > 3 else float(NICE_0_WEIGHT) for i in order]
+    count = len(rows)
+    vruntime = [0.0] * count
+    start = [None] * count
+    end = [None] * count
+    runnable = []
+    tied = False
+    min_vruntime = 0.0
+    time = 0.0
+    next_arrival = 0
+    while runnable or next_arrival < count:
+        batch = []
+        while next_arrival < count and arrival[next_arrival] <= time:
+            batch.append(next_arrival)
+            next_arrival += 1
+        if batch:
+            runnable += batch
+            period = max(target_latency, len(runnable) * min_granularity)
+            for i in batch:
+                vruntime[i] = min_vruntime + period * NICE_0_WEIGHT / sum(weight[k] for k in runnable)
+        if not runnable:
+            time = arrival[next_arrival]
+            continue
+        i = min(runnable, key=lambda k: (vruntime[k], k))
+        tied = tied or any(k != i and abs(vruntime[k] - vruntime[i]) < 1e-6 for k in runnable)
+        min_vruntime = max(min_vruntime, vruntime[i])
+        if start[i] is None:
+            start[i] = time
+        period = max(target_latency, len(runnable) * min_granularity)
+        length = max(period * weight[i] / sum(weight[k] for k in runnable), min_granularity)
+        completes = remaining[i] <= length + CFS_RESIDUE
+        ran = remaining[i] if completes else length
+        time += ran
+        vruntime[i] += ran * NICE_0_WEIGHT / weight[i]
+        if completes:
+            end[i] = time
+            runnable.remove(i)
+        else:
+            remaining[i] -= ran
+    result_start = [0.0] * count
+    result_end = [0.0] * count
+    for position, i in enumerate(order):
+        result_start[i] = start[position]
+        result_end[i] = end[position]
+    return result_start, result_end, tied
+
+
+def test_matches_reference():
+    rng = random.Random(9)
+    mismatched = 0
+    for _ in range(400):
+        count = rng.randint(1, 15)
+        rows = [[f"P{i + 1}", rng.randint(0, 40), rng.randint(1, 30), rng.randint(0, 5)] for i in range(count)]
+        if rng.random() < 0.3:
+            rows = [row[:3] for row in rows]
+        target_latency, min_granularity = rng.choice([(6, 0.75), (4, 1), (10, 2), (3, 3), (1, 1)])
+        schedule = simulate("CFS", Workload.from_rows(rows), target_latency=target_latency,
+                            min_granularity=min_granularity)
+        running = schedule.seg_pid >= 0
+        assert np.all(schedule.seg_end[running] > schedule.seg_start[running])
+        assert np.isclose((schedule.seg_end - schedule.seg_start)[running].sum(), sum(row[2] for row in rows))
+        start, end, tied = reference(rows, target_latency, min_granularity)
+        if not (np.allclose(schedule.start, start) and np.allclose(schedule.completion, end)):
+            assert tied, rows
+            mismatched += 1
+    assert mismatched < 10
+
+
+# Processes arriving together run in arrival order
+def test_co_arrivals_keep_order():
+    schedule = simulate("CFS", Workload.from_rows([["P1", 0, 5], ["P2", 0, 5], ["P3", 0, 5]]))
+    assert list(schedule.start) == [0, 2, 4]
+
+
+# A heavier process gets the larger share of the period
+def test_weighted_share():
+    schedule = simulate("CFS", Workload.from_rows([["P1", 0, 100, 0], ["P2", 0, 100, 3]]),
+                        target_latency=6, min_granularity=0.75)
+    assert schedule.completion[0] < schedule.completion[1]
+
+
+def test_weights_are_whole_numbers():
+    weights = cfs_weights([-5, 0, 1, 5, 60])
+    assert weights[1] == NICE_0_WEIGHT
+    assert np.all(weights == np.rint(weights)) and weights.min() >= 1
+
+
+def test_not_supported_on_multiple_cores():
+    with pytest.raises(ValueError, match="not supported on multiple cores"):
+        simulate("CFS", Workload.from_rows([["P1", 0, 5]]), cores=2, target_latency=6)
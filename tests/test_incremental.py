@@ -0,0 +1,54 @@
+import random
+
+import numpy as np
+
+from incremental import simulate_incremental
+from scheduler import simulate
+from tables import Workload
+
+
+def _same(a, b):
+    return all(np.array_equal(getattr(a, field), getattr(b, field))
+               for field in ("start", "completion", "seg_pid", "seg_start", "seg_end"))
+
+
+# 400 random workloads, each edited 6 times (changed arrival or burst,
+# inserted row, deleted row, or no change), with every checkpoint interval
+# from 1 upward: each incremental run must equal a full re-simulation
+def test_edit_chains_match_full_runs():
+    rng = random.Random(1)
+    for trial in range(400):
+        algorithm = rng.choice(["FCFS", "SJF"])
+        rows = [[f"P{i + 1}", rng.randint(0, 40), rng.randint(1, 8)] for i in range(rng.randint(1, 60))]
+        interval = rng.choice([1, 2, 5, 64])
+        state = None
+        for step in range(6):
+            workload = Workload.from_rows(rows)
+            schedule, state = simulate_incremental(algorithm, workload, state, interval=interval)
+            assert _same(schedule, simulate(algorithm, workload)), (algorithm, interval, rows)
+            edit = rng.random()
+            if edit < 0.5:
+                row = rows[rng.randrange(len(rows))]
+                row[rng.choice([1, 2])] = rng.randint(1 if rng.random() < 0.5 else 0, 40)
+                row[2] = max(row[2], 1)
+            elif edit < 0.7:
+                rows.insert(rng.randrange(len(rows) + 1), [f"N{trial}_{step}", rng.randint(0, 40), rng.randint(1, 8)])
+            elif edit < 0.9 and len(rows) > 1:
+                rows.pop(rng.randrange(len(rows)))
+
+
+# An unchanged workload reuses the previous run as it is
+def test_unchanged_workload_is_reused():
+    workload = Workload.from_rows([["P1", 0, 5], ["P2", 1, 3], ["P3", 2, 1]])
+    for algorithm in ("FCFS", "SJF"):
+        first, state = simulate_incremental(algorithm, workload)
+        second, _ = simulate_incremental(algorithm, workload, state)
+        assert _same(first, second)
+
+
+# Other algorithms, and extra parameters, fall back to a full run
+def test_fallback_has_no_state():
+    workload = Workload.from_rows([["P1", 0, 5], ["P2", 1, 3]])
+    schedule, state = simulate_incremental("Round Robin", workload, time_quantum=2)
+    assert state is None
+    assert _same(schedule, simulate("Round Robin", workload, time_quantum=2))
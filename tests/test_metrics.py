@@ -0,0 +1,34 @@
+import random
+
+from metrics import context_switches
+from scheduler import simulate
+from smp import BALANCERS, simulate_smp
+from tables import Workload
+
+
+# Each core switches once; the step from core 0's lane to core 1's is not a switch
+def test_context_switches_counts_per_core():
+    workload = Workload.from_rows([["P1", 0, 3], ["P2", 0, 3], ["P3", 0, 3], ["P4", 0, 3]])
+    schedule = simulate_smp("FCFS", workload, 2, balancer="global")
+    assert context_switches(schedule) == 2
+
+
+# On multiple cores the count is the sum of each lane's own switches
+def test_context_switches_sums_lanes():
+    rng = random.Random(5)
+    for _ in range(100):
+        rows = [[f"P{i + 1}", rng.randint(0, 15), rng.randint(1, 9)] for i in range(rng.randint(1, 20))]
+        workload = Workload.from_rows(rows)
+        schedule = simulate_smp("Round Robin", workload, rng.choice([2, 3]), rng.choice(BALANCERS),
+                                context_switch=rng.choice([0, 1]))
+        expected = 0
+        for core in range(schedule.cores):
+            lane = schedule.seg_pid[(schedule.seg_core == core) & (schedule.seg_pid >= 0)]
+            expected += int((lane[1:] != lane[:-1]).sum())
+        assert context_switches(schedule) == expected, rows
+
+
+# A single CPU is one lane
+def test_context_switches_single_core():
+    workload = Workload.from_rows([["P1", 0, 3], ["P2", 0, 3]])
+    assert context_switches(simulate("Round Robin", workload, time_quantum=2)) == 3
@@ -0,0 +1,102 @@
+import random
+
+import numpy as np
+import pytest
+
+from scheduler import simulate
+from tables import Workload
+
+
+# Straightforward MLFQ: levels scanned linearly, boosts applied eagerly by
+# moving every queued process back to the top level
+def reference(rows, quanta, boost_interval):
+    order = sorted(range(len(rows)), key=lambda i: rows[i][1])
+    arrival = [rows[i][1] for i in order]
+    remaining = [rows[i][2] for i in order]
+    count = len(order)
+    queues = [[] for _ in quanta]
+    used = [0] * count
+    start = [None] * count
+    end = [None] * count
+    time = 0
+    next_arrival = 0
+    next_boost = boost_interval if boost_interval else float("inf")
+
+    def admit():
+        nonlocal next_arrival
+        while next_arrival < count and arrival[next_arrival] <= time:
+            queues[0].append(next_arrival)
+            used[next_arrival] = 0
+            next_arrival += 1
+
+    while any(queues) or next_arrival < count:
+        if time >= next_boost:
+            boosted = [i for queue in queues for i in queue]
+            for queue in queues:
+                queue.clear()
+            queues[0].extend(boosted)
+            for i in boosted:
+                used[i] = 0
+            next_boost = (time // boost_interval + 1) * boost_interval
+        admit()
+        if not any(queues):
+            time = arrival[next_arrival]
+            continue
+        level = next(level for level, queue in enumerate(queues) if queue)
+        i = queues[level].pop(0)
+        if start[i] is None:
+            start[i] = time
+        stop = time + min(quanta[level] - used[i], remaining[i])
+        if level and next_arrival < count and arrival[next_arrival] < stop:
+            stop = arrival[next_arrival]  # Lower levels yield to new arrivals
+        stop = min(stop, next_boost)
+        ran = stop - time
+        time = stop
+        remaining[i] -= ran
+        if remaining[i] == 0:
+            end[i] = time
+            continue
+        used[i] += ran
+        if used[i] >= quanta[level]:
+            level = min(level + 1, len(quanta) - 1)
+            used[i] = 0
+        admit()
+        queues[level].append(i)
+    result_start = [0] * count
+    result_end = [0] * count
+    for position, i in enumerate(order):
+        result_start[i] = start[position]
+        result_end[i] = end[position]
+    return result_start, result_end
+
+
+def test_matches_reference():
+    rng = random.Random(5)
+    for _ in range(1500):
+        rows = [[f"P{i + 1}", rng.randint(0, 40), rng.randint(1, 15)] for i in range(rng.randint(1, 25))]
+        quanta = [rng.randint(1, 6) for _ in range(rng.randint(1, 5))]
+        boost_interval = rng.choice([0, 0, 7, 13, 30])
+        schedule = simulate("MLFQ", Workload.from_rows(rows), quanta=quanta, boost_interval=boost_interval)
+        start, end = reference(rows, quanta, boost_interval)
+        assert list(schedule.start) == start, (rows, quanta, boost_interval)
+        assert list(schedule.completion) == end, (rows, quanta, boost_interval)
+        busy = (schedule.seg_end - schedule.seg_start)[schedule.seg_pid >= 0].sum()
+        assert busy == sum(row[2] for row in rows)
+
+
+# One level and no boost is Round Robin
+def test_single_level_is_round_robin():
+    rng = random.Random(6)
+    for _ in range(200):
+        rows = [[f"P{i + 1}", rng.randint(0, 40), rng.randint(1, 15)] for i in range(rng.randint(1, 25))]
+        quantum = rng.randint(1, 6)
+        workload = Workload.from_rows(rows)
+        mlfq = simulate("MLFQ", workload, quanta=[quantum], boost_interval=0)
+        round_robin = simulate("Round Robin", workload, time_quantum=quantum)
+        assert np.array_equal(mlfq.start, round_robin.start)
+        assert np.array_equal(mlfq.completion, round_robin.completion)
+
+
+def test_not_supported_on_multiple_cores():
+    with pytest.raises(ValueError, match="not supported on multiple cores"):
+        simulate("MLFQ", Workload.from_rows([["P1", 0, 5]]), cores=2, quanta=(2, 4))
@@ -0,0 +1,28 @@
+import random
+
+from smp import BALANCERS, simulate_smp
+from tables import Workload
+
+
+# A process preempted during its switch overhead has not started yet
+def test_start_skips_preempted_overhead():
+    workload = Workload.from_rows([["P1", 0, 3], ["P2", 0, 10], ["P3", 4, 1]])
+    schedule = simulate_smp("SRTF", workload, 1, balancer="global", context_switch=2)
+    assert list(schedule.start) == [0, 9, 6]
+
+
+# Every start time is when the process's first run segment begins
+def test_start_is_first_run():
+    rng = random.Random(3)
+    for _ in range(100):
+        rows = [[f"P{i + 1}", rng.randint(0, 15), rng.randint(1, 9), rng.randint(1, 5)]
+                for i in range(rng.randint(1, 20))]
+        workload = Workload.from_rows(rows)
+        for algorithm, params in [("SRTF", {}), ("Priority", {"preemptive": True}), ("Round Robin", {})]:
+            for balancer in BALANCERS:
+                schedule = simulate_smp(algorithm, workload, rng.choice([1, 2, 3]), balancer,
+                                        migration_cost=rng.choice([0, 1]), context_switch=rng.choice([0, 2]),
+                                        **params)
+                for pid in workload.pid:
+                    first = schedule.seg_start[schedule.seg_pid == pid].min()
+                    assert schedule.start[pid] == first, (algorithm, balancer, rows)
@@ -0,0 +1,41 @@
+import numpy as np
+
+from scheduler import ALGORITHMS, simulate
+from tables import Workload
+
+
+def _workload(count=500, seed=0, fractional=False):
+    rng = np.random.default_rng(seed)
+    arrival = np.sort(rng.integers(0, count * 2, count))
+    burst = rng.integers(1, 10, count)
+    if fractional:
+        burst = burst + 0.5
+    return Workload([f"P{i + 1}" for i in range(count)], np.arange(count, dtype=np.int32), arrival, burst,
+                    rng.integers(1, 6, count))
+
+
+def _chunks(workload, size):
+    for first in range(0, len(workload), size):
+        rows = slice(first, first + size)
+        yield Workload(workload.names, workload.pid[rows], workload.arrival[rows], workload.burst[rows],
+                       workload.priority[rows])
+
+
+# Streamed chunks give the same schedule as the whole table
+def test_chunks_match_whole_table():
+    workload = _workload()
+    for algorithm in ALGORITHMS:
+        whole = simulate(algorithm, workload)
+        streamed = simulate(algorithm, _chunks(workload, 64))
+        assert np.array_equal(whole.start, streamed.start), algorithm
+        assert np.array_equal(whole.completion, streamed.completion), algorithm
+        assert np.array_equal(whole.seg_pid, streamed.seg_pid), algorithm
+
+
+# Integer workloads keep integer times; fractional ones stay float
+def test_time_dtypes():
+    for algorithm in ("FCFS", "SJF", "SRTF", "Round Robin", "Priority", "MLFQ"):
+        schedule = simulate(algorithm, _workload())
+        assert schedule.start.dtype.kind == "i" and schedule.seg_start.dtype.kind == "i", algorithm
+        schedule = simulate(algorithm, _workload(fractional=True))
+        assert schedule.completion.dtype.kind == "f", algorithm
@@ -0,0 +1,13 @@
+from scheduler import simulate
+from tables import IDLE_CODE, SWITCH_CODE, Workload
+
+
+# Switch overhead is reported as SWITCH_CODE, not as idle time or a process
+def test_running_at_during_switch():
+    workload = Workload.from_rows([["P1", 0, 3], ["P2", 0, 3], ["P3", 10, 1]])
+    schedule = simulate("Round Robin", workload, time_quantum=2, context_switch=1)
+    index = schedule.time_index()
+    assert index.running_at(0.5) == 0
+    assert index.running_at(2.5) == SWITCH_CODE
+    assert index.running_at(3.5) == 1
+    assert index.running_at(9.5) == IDLE_CODE
@@ -0,0 +1,199 @@
+# Fixed-width binary trace format for replaying large workloads.
+#
+# A text trace is converted once (convert_trace) and then opened with
+# open_trace, which memory-maps the file and returns a Workload whose columns
+# are zero-copy NumPy views of the mapped pages. Reopening a 50M-process
+# trace costs a header read instead of a parse, and worker processes that map
+# the same file share its pages through the OS page cache.
+#
+# Layout (little-endian), every section starting on a 64-byte boundary:
+#   header      HEADER below
+#   pid         int32[count], codes into the names table
+#   arrival     int64 or float64 [count]
+#   burst       int64 or float64 [count]
+#   priority    int64 or float64 [count], only when FLAG_PRIORITY is set
+#   offsets     int64[name_count + 1], byte offsets into the names blob
+#   names       UTF-8 bytes, the names back to back
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from tables import NameTable, Workload
+
+MAGIC = b"CPUTRACE"
+VERSION = 1
+FLAG_PRIORITY = 1
+ALIGN = 64
+EXTENSION = ".trace"
+
+HEADER = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("flags", "<u4"),
+    ("count", "<u8"),
+    ("name_count", "<u8"),
+    ("arrival_dtype", "S4"),
+    ("burst_dtype", "S4"),
+    ("priority_dtype", "S4"),
+    ("reserved", "V20"),
+])
+
+COLUMNS = ("arrival", "burst", "priority")
+
+
+def _aligned(position):
+    return -(-position // ALIGN) * ALIGN
+
+
+# Integer columns stay int64 so timelines keep whole-number times
+def _column_dtype(dtypes):
+    if all(np.issubdtype(dtype, np.integer) or dtype == np.bool_ for dtype in dtypes):
+        return np.dtype("<i8")
+    return np.dtype("<f8")
+
+
+# Write a Workload or an iterator of chunks sharing one names table (as
+# loader.read_trace yields). Columns are spilled to temporary files while the
+# chunks stream past, then copied into place once the row count is known.
+def write_trace(workload, path):
+    chunks = [workload] if isinstance(workload, Workload) else workload
+    names = None
+    has_priority = True
+    spills = {column: tempfile.TemporaryFile() for column in ("pid",) + COLUMNS}
+    parts = {column: [] for column in spills}
+    try:
+        for chunk in chunks:
+            if names is None:
+                names = chunk.names
+            elif chunk.names is not names:
+                raise ValueError("Trace chunks must share one names table")
+            has_priority = has_priority and chunk.priority is not None
+            for column, spill in spills.items():
+                values = getattr(chunk, column)
+                if values is None:
+                    continue
+                values = np.ascontiguousarray(values)
+                spill.write(values.tobytes())
+                parts[column].append((values.dtype, values.size))
+        if names is None:
+            names = []
+
+        count = sum(size for _, size in parts["pid"])
+        dtypes = {column: _column_dtype([dtype for dtype, _ in parts[column]]) for column in COLUMNS}
+        encoded = [str(name).encode("utf-8") for name in names]
+        offsets = np.zeros(len(encoded) + 1, dtype="<i8")
+        np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+
+        header = np.zeros(1, dtype=HEADER)
+        header["magic"] = MAGIC
+        header["version"] = VERSION
+        header["flags"] = FLAG_PRIORITY if has_priority and count else 0
+        header["count"] = count
+        header["name_count"] = len(encoded)
+        for column in COLUMNS:
+            header[f"{column}_dtype"] = dtypes[column].str.encode()
+
+        sections = [("pid", np.dtype("<i4")), ("arrival", dtypes["arrival"]), ("burst", dtypes["burst"])]
+        if header["flags"][0] & FLAG_PRIORITY:
+            sections.append(("priority", dtypes["priority"]))
+
+        # Write next to the target and rename, so readers never map a partial file
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as out:
+            out.write(header.tobytes())
+            for column, dtype in sections:
+                out.seek(_aligned(out.tell()))
+                spill = spills[column]
+                spill.seek(0)
+                for part_dtype, size in parts[column]:
+                    values = np.frombuffer(spill.read(size * part_dtype.itemsize), dtype=part_dtype)
+                    out.write(values.astype(dtype, copy=False).tobytes())
+            out.seek(_aligned(out.tell()))
+            out.write(offsets.tobytes())
+            out.seek(_aligned(out.tell()))
+            out.write(b"".join(encoded))
+        os.replace(temp_path, path)
+    finally:
+        for spill in spills.values():
+            spill.close()
+
+
+# Parse a text trace (see loader.read_trace) and write it in binary form
+def convert_trace(source, path, fmt=None, chunk_size=None, name=None):
+    from loader import DEFAULT_CHUNK_SIZE, read_trace
+
+    write_trace(read_trace(source, fmt, chunk_size or DEFAULT_CHUNK_SIZE, name), path)
+
+
+# Raw bytes of a trace: mapped for paths, borrowed for in-memory uploads
+def _buffer(source):
+    if isinstance(source, (str, os.PathLike)):
+        if os.path.getsize(source) == 0:
+            return np.empty(0, dtype=np.uint8)
+        return np.memmap(source, dtype=np.uint8, mode="r")
+    if hasattr(source, "getbuffer"):
+        return np.frombuffer(source.getbuffer(), dtype=np.uint8)
+    return np.frombuffer(source.read(), dtype=np.uint8)
+
+
+# Open a binary trace as a Workload of read-only views into the file
+def open_trace(source):
+    buffer = _buffer(source)
+    if buffer.size < HEADER.itemsize:
+        raise ValueError("Not a binary trace file")
+    header = np.frombuffer(buffer[:HEADER.itemsize].tobytes(), dtype=HEADER)[0]
+    if header["magic"] != MAGIC:
+        raise ValueError("Not a binary trace file")
+    if header["version"] != VERSION:
+        raise ValueError(f"Unsupported binary trace version: {header['version']}")
+    count = int(header["count"])
+    position = HEADER.itemsize
+
+    def section(dtype, size):
+        nonlocal position
+        dtype = np.dtype(dtype)
+        if size == 0:
+            return np.empty(0, dtype=dtype)
+        start = _aligned(position)
+        position = start + size * dtype.itemsize
+        if position > buffer.size:
+            raise ValueError("Binary trace file is truncated")
+        return buffer[start:position].view(dtype)
+
+    pid = section("<i4", count)
+    arrival = section(header["arrival_dtype"].decode(), count)
+    burst = section(header["burst_dtype"].decode(), count)
+    priority = None
+    if header["flags"] & FLAG_PRIORITY:
+        priority = section(header["priority_dtype"].decode(), count)
+    offsets = section("<i8", int(header["name_count"]) + 1)
+    names = NameTable(section(np.uint8, int(offsets[-1])), offsets)
+    return Workload(names, pid, arrival, burst, priority)
+
+
+# Views of an open trace in chunks of at most chunk_size processes, for the
+# schedulers' lazy chunk feed
+def read_binary_trace(source, chunk_size=None):
+    from loader import DEFAULT_CHUNK_SIZE
+
+    workload = open_trace(source)
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    for start in range(0, len(workload), chunk_size):
+        end = start + chunk_size
+        yield Workload(
+            workload.names,
+            workload.pid[start:end],
+            workload.arrival[start:end],
+            workload.burst[start:end],
+            None if workload.priority is None else workload.priority[start:end],
+        )
+
+
+# python tracefile.py trace.csv trace.trace
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python tracefile.py SOURCE.(csv|jsonl)[.gz] DEST.trace")
+    convert_trace(sys.argv[1], sys.argv[2])
@@ -0,0 +1,352 @@
+# Streamlit helpers shared by the pages in views/: the process editor, trace
+# upload, the result cache and the results display. The chart libraries
+# (matplotlib, PIL) are imported inside the functions that draw, so a page
+# that has not been simulated yet never loads them. pandas is imported
+# lazily too, but the process editor needs it, so it loads at first paint.
+#
+# `settings` is the dict built from the sidebar in cpu.py:
+#   speed   animation speed
+#   energy  None, or (policy, P-states, idle states, static P-state)
+#   smp     {} for one core, else cores/balancer/migration parameters
+#   profiler  None, or the profiling.StageProfiler timing this run
+
+import os
+from contextlib import nullcontext
+
+import numpy as np
+import streamlit as st
+
+from cache import ResultCache, cache_key
+from loader import TraceFile
+from metrics import core_utilization, fairness_metrics, latency_sketches, schedule_metrics, tail_summary
+from scheduler import cfs_weights, simulate
+from tables import Workload
+
+PROCESS_COLUMNS = ["Process ID", "Arrival Time", "Burst Time", "Priority"]
+MAX_RANDOM_PROCESSES = 1_000_000
+
+# Random processes as one columnar table: arrival in [0, 5], burst in
+# [1, 10], priority in [1, 5]
+def random_process_table(num_processes, with_priority=False):
+    import pandas as pd
+
+    rng = np.random.default_rng()
+    table = {
+        "Process ID": [f"P{i+1}" for i in range(num_processes)],
+        "Arrival Time": rng.integers(0, 6, num_processes),
+        "Burst Time": rng.integers(1, 11, num_processes),
+    }
+    if with_priority:
+        table["Priority"] = rng.integers(1, 6, num_processes)
+    return pd.DataFrame(table)
+
+# Whole-number columns come back as floats once the grid has had empty cells
+def _whole(values):
+    import pandas as pd
+
+    values = pd.to_numeric(values).to_numpy()
+    if values.dtype.kind == 'f' and np.all(values == np.floor(values)):
+        return values.astype(np.int64)
+    return values
+
+# Workload from the editor's table; rows still being filled in are skipped
+def table_workload(table):
+    table = table.dropna(subset=[column for column in PROCESS_COLUMNS if column in table])
+    return Workload.from_columns(
+        table["Process ID"].astype(str).to_numpy(),
+        _whole(table["Arrival Time"]),
+        _whole(table["Burst Time"]),
+        _whole(table["Priority"]) if "Priority" in table else None,
+    )
+
+# One editable grid for the whole workload instead of a row of widgets per
+# process. The grid only renders the rows in view and accepts rows pasted
+# from a spreadsheet; its base table is kept in session state as a single
+# DataFrame and replaced by Randomize. Returns the edited table; convert it
+# with table_workload when simulating.
+def process_editor(prefix, defaults):
+    import pandas as pd
+
+    with_priority = len(defaults[0]) > 3
+    table_key = f"{prefix}_processes"
+    editor_key = f"{prefix}_editor"
+    if table_key not in st.session_state:
+        st.session_state[table_key] = pd.DataFrame(defaults, columns=PROCESS_COLUMNS[:len(defaults[0])])
+
+    col1, col2 = st.columns([3,1])
+    with col1:
+        num_processes = st.number_input("Number of random processes", 1, MAX_RANDOM_PROCESSES, 10, key=f"{prefix}_num")
+    with col2:
+        if st.button("Randomize", key=f"{prefix}_random", use_container_width=True):
+            st.session_state[table_key] = random_process_table(num_processes, with_priority)
+            st.session_state.pop(editor_key, None)  # Drop edits made to the old table
+
+    table = st.data_editor(
+        st.session_state[table_key],
+        num_rows="dynamic",
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "Process ID": st.column_config.TextColumn(required=True),
+            "Arrival Time": st.column_config.NumberColumn(min_value=0, required=True),
+            "Burst Time": st.column_config.NumberColumn(min_value=1, required=True),
+            "Priority": st.column_config.NumberColumn(min_value=1, required=True),
+        },
+        key=editor_key,
+    )
+    st.caption(f"{len(table):,} processes. Edit cells in place, paste rows copied from a "
+               "spreadsheet, or add and delete rows at the bottom of the grid.")
+    return table
+
+# Optional trace upload; returns a re-readable TraceFile or None
+def upload_trace(key):
+    uploaded = st.file_uploader("Or load a trace file (CSV, JSONL or binary .trace)", type=["csv", "jsonl", "json", "trace"], key=key)
+    if uploaded is None:
+        return None
+    return TraceFile(uploaded, name=uploaded.name)
+
+# Simulate and Animate buttons side by side
+def simulation_buttons(algorithm):
+    col1, col2 = st.columns(2)
+    with col1:
+        simulate_btn = st.button(f"Simulate {algorithm}", type="primary", use_container_width=True)
+    with col2:
+        animate_btn = st.button(f"Animate {algorithm}", use_container_width=True)
+    return simulate_btn, animate_btn
+
+# One result cache per server process, shared by all sessions. Set
+# CPU_SCHEDULER_CACHE_DIR to add an on-disk tier shared across restarts.
+@st.cache_resource
+def result_cache():
+    return ResultCache(directory=os.environ.get("CPU_SCHEDULER_CACHE_DIR"))
+
+# Value derived from a cached simulation (metrics, rendered charts)
+def cached(key, name, compute):
+    return result_cache().get_or_compute(key and f"{key}:{name}", compute)
+
+def show_figure(fig):
+    import matplotlib.pyplot as plt
+
+    st.pyplot(fig)
+    plt.close(fig)
+
+# Time a stage of the page run when the sidebar's profiler is on
+def profiled(settings, name):
+    profiler = settings["profiler"]
+    return profiler.stage(name) if profiler else nullcontext()
+
+# FCFS and SJF on one core resume the session's previous run of the same
+# page from its last checkpoint before the first edited process
+def _simulate_edit(algorithm, workload, params):
+    import incremental
+
+    if algorithm not in incremental.ALGORITHMS or params:
+        return simulate(algorithm, workload, **params)
+    state_key = f"incremental_{algorithm}"
+    schedule, st.session_state[state_key] = incremental.simulate_incremental(
+        algorithm, workload, st.session_state.get(state_key))
+    return schedule
+
+# Run the engine through the result cache, reporting bad input on the page
+# instead of crashing. Runs on the sidebar's cores. Returns the schedule and
+# its cache key.
+def run_simulation(settings, algorithm, workload, **params):
+    if isinstance(workload, Workload) and len(workload) == 0:
+        st.warning("Add at least one process to simulate.")
+        st.stop()
+    params = dict(params, **settings["smp"])
+    key = cache_key(algorithm, params, workload)
+    try:
+        return result_cache().get_or_compute(key, lambda: _simulate_edit(algorithm, workload, params)), key
+    except ValueError as e:
+        st.error(f"Could not simulate {algorithm}: {e}")
+        st.stop()
+
+def display_metrics(schedule, key=None):
+    metrics = cached(key, "metrics", lambda: schedule_metrics(schedule))
+    avg_tat = metrics["avg_turnaround"]
+    avg_wt = metrics["avg_waiting"]
+    throughput = metrics["throughput"]
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown(
+            f"""
+            <div class="metric-box">
+                <h4>Avg Turnaround Time</h4>
+                <h2>{avg_tat:.2f}</h2>
+            </div>
+            """, unsafe_allow_html=True
+        )
+    with col2:
+        st.markdown(
+            f"""
+            <div class="metric-box">
+                <h4>Avg Waiting Time</h4>
+                <h2>{avg_wt:.2f}</h2>
+            </div>
+            """, unsafe_allow_html=True
+        )
+    with col3:
+        st.markdown(
+            f"""
+            <div class="metric-box">
+                <h4>Throughput</h4>
+                <h2>{throughput:.2f}</h2>
+            </div>
+            """, unsafe_allow_html=True
+        )
+    st.markdown("**Tail latency**")
+    display_tail_latency(cached(key, "tail", lambda: tail_summary(latency_sketches(schedule))))
+    if schedule.cores > 1:
+        display_utilization(schedule, key)
+
+# p50/p95/p99/max of response, waiting and turnaround time, then the same per
+# priority class when the workload has priorities
+def display_tail_latency(rows):
+    def table(rows):
+        return {
+            "Latency": [row["latency"].title() for row in rows],
+            "p50": [row["p50"] for row in rows],
+            "p95": [row["p95"] for row in rows],
+            "p99": [row["p99"] for row in rows],
+            "Max": [row["max"] for row in rows],
+        }
+
+    st.dataframe(table([row for row in rows if row["class"] is None]), use_container_width=True, hide_index=True)
+    by_class = [row for row in rows if row["class"] is not None]
+    if by_class:
+        with st.expander("Tail latency by priority class"):
+            st.dataframe(dict(table(by_class), **{"Priority": [row["class"] for row in by_class]}),
+                         column_order=["Priority", "Latency", "p50", "p95", "p99", "Max"],
+                         use_container_width=True, hide_index=True)
+
+# Share of the makespan each core spent running processes
+def display_utilization(schedule, key=None):
+    import charts
+
+    utilization = cached(key, "utilization", lambda: core_utilization(schedule))
+    st.markdown(f"**Core utilization:** {utilization.mean():.1%} average, "
+                f"{utilization.min():.1%} to {utilization.max():.1%}")
+    show_figure(charts.plot_utilization(utilization))
+
+# Share deviation, Jain's index and vruntime spread against weighted fair
+# sharing, weighted by priority when the workload has one
+def display_fairness(schedule, key=None):
+    priority = schedule.workload.priority
+    weights = None if priority is None else cfs_weights(priority)
+    fairness = cached(key, "fairness", lambda: fairness_metrics(schedule, weights))
+    st.markdown(f"**Fairness:** share deviation {fairness['share_deviation']:.1%}, "
+                f"Jain index {fairness['jain_index']:.3f}, vruntime spread "
+                f"{fairness['vruntime_spread_max']:.1f} max / {fairness['vruntime_spread_mean']:.1f} mean")
+
+# Energy, EDP, DVFS turnaround/waiting and time at each P-/idle state for the
+# sidebar's energy policy
+def display_energy(settings, algorithm, workload, **params):
+    import charts
+    import energy
+
+    policy, pstates, idle_states, static_pstate = settings["energy"]
+    key = cache_key(algorithm, dict(params, energy=settings["energy"]), workload)
+    try:
+        schedule, report = result_cache().get_or_compute(key, lambda: energy.simulate_energy(
+            algorithm, workload, policy, pstates, idle_states, static_pstate, **params))
+    except ValueError as e:
+        st.error(f"Could not evaluate energy: {e}")
+        return
+    metrics = schedule_metrics(schedule)
+
+    st.subheader(f"Energy ({policy.replace('_', ' ').title()})")
+    if settings["smp"]:
+        st.caption("The energy model covers a single core, so this runs on one core.")
+    boxes = [("Energy (J)", report["energy"]), ("EDP (J·s)", report["edp"]),
+             ("Avg Turnaround Time", metrics["avg_turnaround"]), ("Avg Waiting Time", metrics["avg_waiting"])]
+    for column, (title, value) in zip(st.columns(len(boxes)), boxes):
+        with column:
+            st.markdown(
+                f"""
+                <div class="metric-box">
+                    <h4>{title}</h4>
+                    <h2>{value:.2f}</h2>
+                </div>
+                """, unsafe_allow_html=True
+            )
+
+    show_figure(charts.plot_time_at_state(report["time_at_state"], len(pstates)))
+
+# Table and curves for a Round Robin quantum sweep, recommended rows ticked
+def display_sweep(results, color='#2563eb'):
+    import charts
+
+    st.dataframe({
+        "Quantum": [r["quantum"] for r in results],
+        "Switch Cost": [r["context_switch"] for r in results],
+        "Avg Waiting Time": [r["avg_waiting"] for r in results],
+        "Avg Turnaround Time": [r["avg_turnaround"] for r in results],
+        "Throughput": [r["throughput"] for r in results],
+        "Context Switches": [r["context_switches"] for r in results],
+        "Recommended": [r["recommended"] for r in results],
+    }, use_container_width=True, hide_index=True)
+
+    show_figure(charts.plot_sweep(results, color))
+
+    for r in results:
+        if r["recommended"]:
+            st.success(f"Switch cost {r['context_switch']}: recommended quantum {r['quantum']} "
+                       f"(avg waiting {r['avg_waiting']:.2f}, {r['context_switches']} context switches)")
+
+# Gantt chart rendered once to PNG and served from the cache afterwards
+def show_gantt_chart(schedule, algorithm, color='#2563eb', key=None):
+    import charts
+
+    st.image(cached(key, f"gantt:{algorithm}:{color}", lambda: charts.gantt_png(schedule, algorithm, color)),
+             use_container_width=True)
+
+def animate_gantt_chart(settings, timeline, algorithm, color='#2563eb', key=None):
+    import charts
+
+    speed = settings["speed"]
+    gif = cached(key, f"animation:{algorithm}:{color}:{speed}",
+                 lambda: charts.render_gantt_animation(timeline, algorithm, color, speed))
+    if gif is not None:
+        st.image(gif, use_container_width=True)
+
+# Everything a page shows after Simulate/Animate: results table, metrics,
+# energy (when enabled), Gantt chart and, when animating, the animation.
+# `title` labels the charts and defaults to the algorithm name; `fairness`
+# adds the fairness line for single-core runs.
+def show_results(settings, algorithm, workload, title=None, sort_by="Process ID", animate=False,
+                 fairness=False, **params):
+    title = title or algorithm
+    with profiled(settings, "simulate"):
+        schedule, key = run_simulation(settings, algorithm, workload, **params)
+    if settings["profiler"]:
+        settings["profiler"].count(schedule)
+
+    # Display results
+    st.subheader("Results")
+    with profiled(settings, "dataframe"):
+        df = schedule.to_dataframe().sort_values(sort_by, kind="stable")
+        st.dataframe(df.style.set_properties(**{'background-color': 'white'}),
+                      use_container_width=True,
+                      hide_index=True)
+
+    # Display metrics
+    with profiled(settings, "metrics"):
+        display_metrics(schedule, key)
+        if fairness and schedule.cores == 1:
+            display_fairness(schedule, key)
+    if settings["energy"]:
+        with profiled(settings, "energy"):
+            display_energy(settings, algorithm, workload, **params)
+
+    # Show Gantt chart
+    st.subheader("Gantt Chart")
+    with profiled(settings, "gantt"):
+        show_gantt_chart(schedule, title, color='#2563eb', key=key)
+
+    # Animation
+    if animate:
+        st.subheader("Simulation Animation")
+        with profiled(settings, "animation"):
+            animate_gantt_chart(settings, schedule, title, color='#2563eb', key=key)
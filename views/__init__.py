@@ -0,0 +1,2 @@
+# One module per page of cpu.py, each with a render(settings) function. cpu.py
+# imports only the module of the selected page.
@@ -0,0 +1,43 @@
+# Completely Fair Scheduler page
+
+import streamlit as st
+
+import ui
+from scheduler import DEFAULT_CFS_MIN_GRANULARITY, DEFAULT_CFS_TARGET_LATENCY
+
+
+def render(settings):
+    st.title("Completely Fair Scheduling")
+    
+    with st.expander("ℹ️ About CFS", expanded=True):
+        st.write("""
+        **Completely Fair Scheduler (CFS)** scheduling:
+        - Each process has a virtual runtime that grows as it runs
+        - The process with the smallest virtual runtime runs next
+        - Higher priority (lower number) means a larger weight, so virtual runtime grows more slowly and the process gets a bigger share
+        - Slices split the target latency by weight, but never drop below the minimum granularity
+        """)
+    
+    # Scheduling period
+    col1, col2 = st.columns(2)
+    with col1:
+        target_latency = st.number_input("Target latency", min_value=0.1, value=float(DEFAULT_CFS_TARGET_LATENCY),
+                                         step=0.5, key="cfs_target_latency")
+    with col2:
+        min_granularity = st.number_input("Minimum granularity", min_value=0.05, value=DEFAULT_CFS_MIN_GRANULARITY,
+                                          step=0.25, key="cfs_min_granularity")
+    
+    # Process input section
+    st.subheader("Process Details")
+    table = ui.process_editor("cfs", [[f"P{i+1}", i, (i+1)*3, i+1] for i in range(3)])
+    
+    trace = ui.upload_trace("cfs_trace")
+    
+    # Simulation controls
+    simulate_btn, animate_btn = ui.simulation_buttons("CFS")
+    
+    if simulate_btn or animate_btn:
+        ui.show_results(settings, "CFS", trace if trace is not None else ui.table_workload(table),
+                        title=f"CFS (Latency={target_latency:g}, Granularity={min_granularity:g})",
+                        animate=animate_btn, fairness=True,
+                        target_latency=target_latency, min_granularity=min_granularity)
@@ -0,0 +1,31 @@
+# First-Come First-Served page
+
+import streamlit as st
+
+import ui
+
+
+def render(settings):
+    st.title("First-Come First-Served Scheduling")
+    
+    with st.expander("ℹ️ About FCFS", expanded=True):
+        st.write("""
+        **First-Come First-Served (FCFS)** is the simplest CPU scheduling algorithm:
+        - Processes are executed in order of arrival (FIFO queue)
+        - Non-preemptive - once started, runs to completion
+        - Simple to implement but suffers from the 'convoy effect'
+        - May result in poor average waiting time
+        """)
+    
+    # Process input section
+    st.subheader("Process Details")
+    table = ui.process_editor("fcfs", [[f"P{i+1}", i*2, 5] for i in range(3)])
+    
+    trace = ui.upload_trace("fcfs_trace")
+    
+    # Simulation controls
+    simulate_btn, animate_btn = ui.simulation_buttons("FCFS")
+    
+    if simulate_btn or animate_btn:
+        ui.show_results(settings, "FCFS", trace if trace is not None else ui.table_workload(table),
+                        sort_by="Arrival Time", animate=animate_btn)
@@ -0,0 +1,43 @@
+# Multilevel Feedback Queue page
+
+import streamlit as st
+
+import ui
+from scheduler import DEFAULT_MLFQ_BOOST, DEFAULT_MLFQ_QUANTA
+
+
+def render(settings):
+    st.title("Multilevel Feedback Queue Scheduling")
+    
+    with st.expander("ℹ️ About MLFQ", expanded=True):
+        st.write("""
+        **Multilevel Feedback Queue (MLFQ)** scheduling:
+        - Several round robin queues, the top level runs first
+        - New processes start at the top level
+        - Using up a level's quantum moves a process down one level
+        - Periodic priority boost moves everything back to the top, so long jobs do not starve
+        """)
+    
+    # Levels and their quanta
+    levels = st.slider("Number of levels", 1, 8, len(DEFAULT_MLFQ_QUANTA), key="mlfq_levels")
+    quanta = []
+    for level, column in enumerate(st.columns(levels)):
+        with column:
+            quanta.append(st.number_input(f"Level {level} quantum", min_value=1, value=2 ** (level + 1),
+                                          key=f"mlfq_quantum_{level}"))
+    boost_interval = st.number_input("Priority boost interval (0 = never)", min_value=0,
+                                     value=DEFAULT_MLFQ_BOOST, key="mlfq_boost")
+    
+    # Process input section
+    st.subheader("Process Details")
+    table = ui.process_editor("mlfq", [[f"P{i+1}", i, (i+1)*4] for i in range(3)])
+    
+    trace = ui.upload_trace("mlfq_trace")
+    
+    # Simulation controls
+    simulate_btn, animate_btn = ui.simulation_buttons("MLFQ")
+    
+    if simulate_btn or animate_btn:
+        ui.show_results(settings, "MLFQ", trace if trace is not None else ui.table_workload(table),
+                        title=f"MLFQ ({levels} levels)", animate=animate_btn,
+                        quanta=tuple(quanta), boost_interval=boost_interval)
@@ -0,0 +1,53 @@
+# Monte Carlo evaluation page
+
+import streamlit as st
+
+import montecarlo
+import ui
+
+
+def render(settings):
+    st.title("Monte Carlo Evaluation")
+    
+    with st.expander("ℹ️ About Monte Carlo Evaluation", expanded=True):
+        st.write("""
+        **Monte Carlo** evaluation:
+        - Generates many random workloads like the Randomize button does
+        - Runs every algorithm on each workload, in parallel across all cores
+        - Reports the mean of each metric with a 95% confidence interval
+        - One random sample says little; thousands show typical behavior
+        """)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        num_workloads = st.slider("Number of workloads", 100, 10000, 1000, 100, key="mc_workloads")
+        num_processes = st.slider("Processes per workload", 1, 30, 10, key="mc_processes")
+    with col2:
+        time_quantum = st.slider("Round Robin Time Quantum", 1, 10, 2, key="mc_quantum")
+        seed = st.number_input("Random seed", min_value=0, value=0, key="mc_seed")
+    
+    if st.button("Run Evaluation", type="primary", use_container_width=True):
+        import charts
+
+        algorithms = dict(montecarlo.ALGORITHMS, **{"Round Robin": {"time_quantum": time_quantum}})
+        with st.spinner("Simulating workloads..."), ui.profiled(settings, "simulate"):
+            summary = montecarlo.evaluate(num_workloads, num_processes, algorithms, seed=seed)
+        
+        # Display results
+        st.subheader("Results")
+        labels = {"avg_waiting": "Avg Waiting Time", "avg_turnaround": "Avg Turnaround Time", "throughput": "Throughput"}
+        table = {"Algorithm": [row["algorithm"] for row in summary]}
+        for name, label in labels.items():
+            digits = 3 if name == "throughput" else 2
+            table[label] = [f"{row[name]:.{digits}f} ± {row[name + '_ci']:.{digits}f}" for row in summary]
+        st.dataframe(table, use_container_width=True, hide_index=True)
+        
+        with ui.profiled(settings, "charts"):
+            ui.show_figure(charts.plot_monte_carlo(summary, labels))
+        st.caption(f"Mean ± 95% confidence interval over {num_workloads} workloads of {num_processes} processes")
+        
+        st.subheader("Tail Latency")
+        for row in summary:
+            st.markdown(f"**{row['algorithm']}**")
+            ui.display_tail_latency(row["tail"])
+        st.caption(f"Percentiles over all {num_workloads * num_processes:,} simulated processes")
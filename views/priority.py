@@ -0,0 +1,38 @@
+# Priority scheduling page
+
+import streamlit as st
+
+import ui
+
+
+def render(settings):
+    st.title("Priority Scheduling")
+    
+    with st.expander("ℹ️ About Priority Scheduling", expanded=True):
+        st.write("""
+        **Priority** scheduling:
+        - Each process has a priority (lower number = higher priority)
+        - Can be preemptive or non-preemptive
+        - Higher priority processes run first
+        - May cause starvation of low-priority processes
+        """)
+    
+    # Scheduling type
+    preemptive = st.radio("Scheduling Type", ["Non-Preemptive", "Preemptive"], index=0, key="priority_type") == "Preemptive"
+    
+    # Aging: waiting processes gain priority over time to avoid starvation
+    aging = st.number_input("Aging (priority boost per waited time unit)", min_value=0.0, value=0.0, step=0.1, key="priority_aging")
+    
+    # Process input section
+    st.subheader("Process Details")
+    table = ui.process_editor("priority", [[f"P{i+1}", i, (i+1)*2, i+1] for i in range(3)])
+    
+    trace = ui.upload_trace("priority_trace")
+    
+    # Simulation controls
+    simulate_btn, animate_btn = ui.simulation_buttons("Priority")
+    
+    if simulate_btn or animate_btn:
+        ui.show_results(settings, "Priority", trace if trace is not None else ui.table_workload(table),
+                        title=f"Priority ({'Preemptive' if preemptive else 'Non-Preemptive'})",
+                        animate=animate_btn, preemptive=preemptive, aging=aging)
@@ -0,0 +1,60 @@
+# Round Robin page, with the time-quantum sweep
+
+import streamlit as st
+
+import ui
+
+
+def render(settings):
+    st.title("Round Robin Scheduling")
+    
+    with st.expander("ℹ️ About Round Robin", expanded=True):
+        st.write("""
+        **Round Robin** scheduling:
+        - Each process gets equal time quantum
+        - Preemptive - interrupts processes after quantum
+        - Fair allocation of CPU time
+        - Performance depends heavily on quantum size
+        """)
+    
+    # Time quantum input
+    time_quantum = st.slider("Time Quantum", 1, 10, 2, key="rr_quantum")
+    
+    # Sweep mode simulates a whole range of quanta in parallel
+    sweep_mode = st.toggle("Sweep a range of time quanta", key="rr_sweep")
+    if sweep_mode:
+        col1, col2 = st.columns(2)
+        with col1:
+            quantum_range = st.slider("Quantum range", 1, 50, (1, 10), key="rr_sweep_range")
+        with col2:
+            switch_costs = st.multiselect("Context switch costs", [0, 0.5, 1, 2, 5], default=[0], key="rr_sweep_costs")
+    
+    # Process input section
+    st.subheader("Process Details")
+    table = ui.process_editor("rr", [[f"P{i+1}", i, (i+1)*2] for i in range(3)])
+    
+    trace = ui.upload_trace("rr_trace")
+    
+    # Simulation controls
+    if sweep_mode:
+        if st.button("Run Quantum Sweep", type="primary", use_container_width=True):
+            from sweep import quantum_sweep
+
+            try:
+                with ui.profiled(settings, "simulate"):
+                    results = quantum_sweep(trace if trace is not None else ui.table_workload(table),
+                                            range(quantum_range[0], quantum_range[1] + 1), switch_costs or [0])
+            except ValueError as e:
+                st.error(f"Could not run the quantum sweep: {e}")
+                st.stop()
+            st.subheader("Quantum Sweep")
+            with ui.profiled(settings, "charts"):
+                ui.display_sweep(results, color='#2563eb')
+        return
+    
+    simulate_btn, animate_btn = ui.simulation_buttons("Round Robin")
+    
+    if simulate_btn or animate_btn:
+        ui.show_results(settings, "Round Robin", trace if trace is not None else ui.table_workload(table),
+                        title=f"Round Robin (Quantum={time_quantum})", animate=animate_btn,
+                        fairness=True, time_quantum=time_quantum)
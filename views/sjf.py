@@ -0,0 +1,31 @@
+# Shortest Job First page
+
+import streamlit as st
+
+import ui
+
+
+def render(settings):
+    st.title("⏱️ Shortest Job First (Non-Preemptive)")
+    
+    with st.expander("ℹ️ About SJF", expanded=True):
+        st.write("""
+        **Shortest Job First (SJF)** scheduling:
+        - Executes processes with shortest burst time first
+        - Non-preemptive version shown here
+        - Minimizes average waiting time
+        - Requires knowing burst times in advance
+        """)
+    
+    # Process input section
+    st.subheader("Process Details")
+    table = ui.process_editor("sjf", [[f"P{i+1}", i*2, (i+1)*2] for i in range(3)])
+    
+    trace = ui.upload_trace("sjf_trace")
+    
+    # Simulation controls
+    simulate_btn, animate_btn = ui.simulation_buttons("SJF")
+    
+    if simulate_btn or animate_btn:
+        ui.show_results(settings, "SJF", trace if trace is not None else ui.table_workload(table),
+                        animate=animate_btn)
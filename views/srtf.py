@@ -0,0 +1,31 @@
+# Shortest Remaining Time First page
+
+import streamlit as st
+
+import ui
+
+
+def render(settings):
+    st.title("Shortest Remaining Time First (Preemptive)")
+    
+    with st.expander("ℹ️ About SRTF", expanded=True):
+        st.write("""
+        **Shortest Remaining Time First (SRTF)**:
+        - Preemptive version of SJF
+        - Always executes process with shortest remaining time
+        - More complex but better for responsiveness
+        - Optimal for minimizing average turnaround time
+        """)
+    
+    # Process input section
+    st.subheader("Process Details")
+    table = ui.process_editor("srtf", [[f"P{i+1}", i, (i+1)*2] for i in range(3)])
+    
+    trace = ui.upload_trace("srtf_trace")
+    
+    # Simulation controls
+    simulate_btn, animate_btn = ui.simulation_buttons("SRTF")
+    
+    if simulate_btn or animate_btn:
+        ui.show_results(settings, "SRTF", trace if trace is not None else ui.table_workload(table),
+                        animate=animate_btn)